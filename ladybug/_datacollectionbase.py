@@ -11,13 +11,43 @@ try:
     from collections.abc import Iterable  # python < 3.7
 except ImportError:
     from collections import Iterable  # python >= 3.8
+from array import array
+from numbers import Number
 from string import ascii_lowercase
+import ast
+import sys
 import math
+import itertools
+import heapq
+import operator
 
 try:
     from itertools import izip as zip  # python 2
 except ImportError:
     xrange = range  # python 3
+try:
+    import numpy
+except ImportError:  # numpy is optional and it is not available in IronPython
+    numpy = None
+try:
+    from multiprocessing import Pool
+    from multiprocessing.pool import ThreadPool
+except ImportError:  # IronPython without the multiprocessing module
+    Pool = ThreadPool = None
+
+# syntax nodes that are allowed within conditional statements
+_STATEMENT_NODES = (
+    ast.Expression, ast.BoolOp, ast.UnaryOp, ast.BinOp, ast.Compare, ast.Name,
+    ast.Load, ast.Tuple, ast.List, ast.And, ast.Or, ast.Not, ast.USub, ast.UAdd,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn,
+    ast.Is, ast.IsNot)
+_NUMBER_NODE = ast.Constant if sys.version_info >= (3, 8) else ast.Num
+# range of the integers that can be stored in the array of compact integer values
+_INT_MIN, _INT_MAX = -2 ** 31, 2 ** 31 - 1
+_STATEMENT_CACHE = {}  # compiled conditional statements
+_STATEMENT_CACHE_SIZE = 128
+_EXPRESSION_DEPTH = 32  # max depth of lazy expressions before operands are evaluated
 
 
 class BaseCollection(object):
@@ -30,7 +60,8 @@ class BaseCollection(object):
             the list of values.
     """
 
-    __slots__ = ('_header', '_values', '_datetimes', '_validated_a_period')
+    __slots__ = ('_header', '_value_buffer', '_values_shared', '_datetimes',
+                 '_validated_a_period', '_lazy', '_edit_count')
     _collection_type = None
     _mutable = True
     _enumeration = None
@@ -91,9 +122,61 @@ class BaseCollection(object):
 
     @values.setter
     def values(self, values):
+        self._edit_count = getattr(self, '_edit_count', 0) + 1
+        if isinstance(values, _SharedValues):  # values of another collection
+            self._value_buffer = values.values
+            self._values_shared = True
+            return
+        if isinstance(values, _ValueExpression):  # lazy result of arithmetic
+            self._value_buffer = values
+            self._values_shared = False
+            self._lazy = True
+            return
         self._check_values(values)
+        if isinstance(values, array) or \
+                isinstance(getattr(self, '_values', None), array):
+            try:  # keep the values compact
+                self._values = _compact_array(values)
+                return
+            except TypeError:  # values that cannot be stored in an array
+                pass
         self._values = list(values)
 
+    @property
+    def _values(self):
+        """Get the list or array of values, evaluating any pending lazy arithmetic."""
+        vals = self._value_buffer
+        if isinstance(vals, _ValueExpression):
+            vals = self._value_buffer = vals.evaluate()
+        return vals
+
+    @_values.setter
+    def _values(self, values):
+        if values is not getattr(self, '_value_buffer', None):  # a new buffer
+            self._values_shared = False
+        self._value_buffer = values
+        # count the edits such that objects derived from the values can be updated
+        self._edit_count = getattr(self, '_edit_count', 0) + 1
+
+    @property
+    def is_compact(self):
+        """Boolean for whether the values are stored in a compact typed array.
+
+        Compact values use the memory of packed integers or doubles instead of
+        a list of Python numbers. They can be used just like other values and
+        collections derived from a compact collection through duplicate, unit
+        conversion or filters that slice the values are also compact.
+        """
+        return isinstance(self._values, array)
+
+    @property
+    def is_lazy(self):
+        """Boolean for whether arithmetic on this collection is evaluated lazily.
+
+        See the to_lazy method for more information.
+        """
+        return getattr(self, '_lazy', False)
+
     @property
     def validated_a_period(self):
         """Boolean for whether the header analysis_period is validated against datetimes.
@@ -120,16 +203,19 @@ class BaseCollection(object):
     @property
     def average(self):
         """Get the average of the Data Collection values."""
-        return sum(self._values) / len(self._values)
+        return self.total / len(self._values)
 
     @property
     def median(self):
         """Get the median of the Data Collection values."""
-        return self._percentile(self._values, 50)
+        return self._values_percentile(50)
 
     @property
     def total(self):
         """Get the total of the Data Collection values."""
+        vals = _numpy_array(self._values, compact_only=True)
+        if vals is not None:
+            return vals.sum().item()
         return sum(self._values)
 
     def convert_to_unit(self, unit):
@@ -139,9 +225,12 @@ class BaseCollection(object):
         consequences depending on how the data collection is used. Use to_unit to
         get a new instance of a collection without mutating this one.
         """
+        compact = self.is_compact
         self._values = self._header.data_type.to_unit(
             self._values, unit, self._header.unit)
         self._header._unit = unit
+        if compact:
+            self._values = _compact_array(self._values)
 
     def convert_to_ip(self):
         """Convert the Data Collection to IP units.
@@ -150,8 +239,11 @@ class BaseCollection(object):
         consequences depending on how the data collection is used. Use to_ip to
         get a new instance of a collection without mutating this one.
         """
+        compact = self.is_compact
         self._values, self._header._unit = self._header.data_type.to_ip(
             self._values, self._header.unit)
+        if compact:
+            self._values = _compact_array(self._values)
 
     def convert_to_si(self):
         """Convert the Data Collection to SI units.
@@ -160,8 +252,30 @@ class BaseCollection(object):
         consequences depending on how the data collection is used. Use to_si to
         get a new instance of a collection without mutating this one.
         """
+        compact = self.is_compact
         self._values, self._header._unit = self._header.data_type.to_si(
             self._values, self._header.unit)
+        if compact:
+            self._values = _compact_array(self._values)
+
+    def convert_to_compact(self):
+        """Store the values of the Data Collection in a compact typed array.
+
+        Integer values are stored as an array of 32-bit integers and all other
+        numerical values (including larger integers) are stored as an array of
+        doubles, which uses several times less memory than a list of Python
+        numbers. The values, methods and properties of the collection are
+        otherwise unchanged. Values that are not numbers
+        cannot be made compact and will raise a TypeError.
+
+        When numpy is installed, the arithmetic, totals, averages and percentiles
+        of compact values are computed with numpy. Note that numpy sums floats
+        in a different order than Python and so these results are not always
+        bit-identical to those of the uncompacted values (they can differ in
+        the last digits) and percentiles of integers are returned as floats.
+        """
+        if not self.is_compact:
+            self._values = _compact_array(self._values)
 
     def to_unit(self, unit):
         """Get a Data Collection in the input unit.
@@ -204,12 +318,27 @@ class BaseCollection(object):
         """Get a mutable version of this collection."""
         return self.duplicate()
 
+    def to_lazy(self):
+        """Get a version of this collection on which arithmetic is evaluated lazily.
+
+        Arithmetic operators on a lazy collection (+, -, *, / and negation) do
+        not compute any values. Instead, they return a lazy collection that
+        remembers the expression, such that a chain like (dbt - 18) * 0.5 + rh / 100
+        is evaluated in a single pass without intermediate lists of values. The
+        expression is evaluated the first time that the values of the result are
+        used (eg. through values, iteration or an aggregation like average_monthly).
+
+        """
+        new_obj = self.duplicate()
+        new_obj._lazy = True
+        return new_obj
+
     def to_immutable(self):
         """Get an immutable version of this collection."""
         if self._enumeration is None:
             self._get_mutable_enumeration()
         col_obj = self._enumeration['immutable'][self._collection_type]
-        new_obj = col_obj(self.header, self.values, self.datetimes)
+        new_obj = col_obj(self.header, self._share_values(), self.datetimes)
         new_obj._validated_a_period = self._validated_a_period
         return new_obj
 
@@ -246,7 +375,7 @@ class BaseCollection(object):
                 '{} {}'.format(new_data_c._header.metadata['type'], 'Intensity')
         return new_data_c
 
-    def highest_values(self, count):
+    def highest_values(self, count, ordered=True):
         """Get a list of the the x highest values of the Data Collection and their indices.
 
         This is useful for situations where one needs to know the times of
@@ -257,13 +386,18 @@ class BaseCollection(object):
 
         Args:
             count: Integer representing the number of highest values to account for.
+            ordered: Boolean to note whether the output values should be ordered
+                from highest to lowest. If False, the values are returned in the
+                order that they appear in the Data Collection, which is faster to
+                compute when the count is large. (Default: True).
 
         Returns:
             A tuple with two elements.
 
             -   highest_values:
                 The n highest values in data list, ordered from
-                highest to lowest.
+                highest to lowest. Values that are equal are ordered by their
+                position in the Data Collection.
 
             -   highest_values_index:
                 Indices of the n highest values in data
@@ -275,13 +409,9 @@ class BaseCollection(object):
                 count, len(self._values))
         assert count > 0, \
             'count must be greater than 0. Got {}.'.format(count)
-        highest_values = sorted(self._values, reverse=True)[0:count]
-        highest_values_index = sorted(list(xrange(len(self._values))),
-                                      key=lambda k: self._values[k],
-                                      reverse=True)[0:count]
-        return highest_values, highest_values_index
+        return self._extreme_values(count, True, ordered)
 
-    def lowest_values(self, count):
+    def lowest_values(self, count, ordered=True):
         """Get a list of the the x lowest values of the Data Collection and their indices.
 
         This is useful for situations where one needs to know the times of
@@ -289,16 +419,22 @@ class BaseCollection(object):
 
         Args:
             count: Integer representing the number of lowest values to account for.
+            ordered: Boolean to note whether the output values should be ordered
+                from lowest to highest. If False, the values are returned in the
+                order that they appear in the Data Collection, which is faster to
+                compute when the count is large. (Default: True).
 
         Returns:
             A tuple with two elements.
 
-            -   highest_values:
+            -   lowest_values:
                 The n lowest values in data list, ordered from
-                lowest to lowest.
+                lowest to highest. Values that are equal are ordered by their
+                position in the Data Collection.
+
             -   lowest_values_index:
                 Indices of the n lowest values in data
-                list, ordered from lowest to lowest.
+                list, ordered from lowest to highest.
         """
         count = int(count)
         assert count <= len(self._values), \
@@ -306,10 +442,7 @@ class BaseCollection(object):
                 count, len(self._values))
         assert count > 0, \
             'count must be greater than 0. Got {}.'.format(count)
-        lowest_values = sorted(self._values)[0:count]
-        lowest_values_index = sorted(list(xrange(len(self._values))),
-                                     key=lambda k: self._values[k])[0:count]
-        return lowest_values, lowest_values_index
+        return self._extreme_values(count, False, ordered)
 
     def percentile(self, percentile):
         """Get a value representing a the input percentile of the Data Collection.
@@ -323,7 +456,7 @@ class BaseCollection(object):
         """
         assert 0 <= percentile <= 100, \
             'percentile must be between 0 and 100. Got {}'.format(percentile)
-        return self._percentile(self._values, percentile)
+        return self._values_percentile(percentile)
 
     def filter_by_conditional_statement(self, statement):
         """Filter the Data Collection based on a conditional statement.
@@ -429,9 +562,12 @@ class BaseCollection(object):
         return collection
 
     def duplicate(self):
-        """Get a copy of this Data Collection."""
+        """Get a copy of this Data Collection.
+
+        The copy shares the values of this collection until one of them is edited.
+        """
         collection = self.__class__(
-            self.header.duplicate(), list(self._values), self.datetimes)
+            self.header.duplicate(), self._share_values(), self.datetimes)
         collection._validated_a_period = self._validated_a_period
         return collection
 
@@ -439,7 +575,7 @@ class BaseCollection(object):
         """Convert Data Collection to a dictionary."""
         return {
             'header': self.header.to_dict(),
-            'values': self._values,
+            'values': self._dict_values(),
             'datetimes': self.datetimes,
             'validated_a_period': self._validated_a_period,
             'type': self.__class__.__name__
@@ -484,24 +620,9 @@ class BaseCollection(object):
             and False does not.
         """
         BaseCollection.are_collections_aligned(data_collections)
-        correct_var = BaseCollection._check_conditional_statement(
+        evaluate = BaseCollection._compile_conditional_statement(
             statement, len(data_collections))
-
-        # replace the operators of the statement with non-alphanumeric characters
-        # necessary to avoid replacing the characters of the operators
-        num_statement_clean = BaseCollection._replace_operators(statement)
-
-        pattern = []
-        for i in xrange(len(data_collections[0])):
-            num_statement = num_statement_clean
-            # replace the variable names with their numerical values
-            for j, coll in enumerate(data_collections):
-                var = correct_var[j]
-                num_statement = num_statement.replace(var, str(coll[i]))
-            # put back the operators
-            num_statement = BaseCollection._restore_operators(num_statement)
-            pattern.append(eval(num_statement, {}))
-        return pattern
+        return evaluate(*[coll._values for coll in data_collections])
 
     @staticmethod
     def are_collections_aligned(data_collections, raise_exception=True):
@@ -530,7 +651,8 @@ class BaseCollection(object):
         return True
 
     @staticmethod
-    def compute_function_aligned(funct, data_collections, data_type, unit):
+    def compute_function_aligned(funct, data_collections, data_type, unit,
+                                 vectorized=False, workers=1, use_threads=False):
         """Compute a function with a list of aligned data collections or individual values.
 
         Args:
@@ -542,6 +664,20 @@ class BaseCollection(object):
             data_type: An instance of a Ladybug data type that describes the results
                 of the funct.
             unit: The units of the funct results.
+            vectorized: Boolean to note whether the funct is vectorized, meaning
+                that it accepts whole lists of values for the Data Collections
+                (along with the individual values) and returns a list with one
+                result for each datetime of the collections. Vectorized
+                functions are called only once. (Default: False).
+            workers: An integer for the number of processes (or threads) across
+                which the computation of a function that is not vectorized is
+                split. The values are sent to the workers in chunks and so the
+                funct must be defined at the level of a module such that it can
+                be used by other processes. (Default: 1).
+            use_threads: Boolean to note whether a pool of threads should be used
+                instead of a pool of processes when workers is greater than 1.
+                Threads are only faster when the funct releases the global
+                interpreter lock (eg. through numpy). (Default: False).
 
         Returns:
             A Data Collection with the results function. If all items in this list of
@@ -567,29 +703,48 @@ class BaseCollection(object):
             # humid_ratio will be a Data Collection of humidity ratios at Denver
         """
         # check that all inputs are either data collections or floats
-        data_colls = []
-        for i, func_input in enumerate(data_collections):
+        data_colls, func_inputs = [], []
+        for func_input in data_collections:
             if isinstance(func_input, BaseCollection):
                 data_colls.append(func_input)
+                func_inputs.append(func_input)
             else:
                 try:
-                    data_collections[i] = float(func_input)
+                    func_inputs.append(float(func_input))
                 except ValueError:
                     raise TypeError('Expected a number or a Data Collection. '
                                     'Got {}'.format(type(func_input)))
 
         # run the function and return the result
         if len(data_colls) == 0:
-            return funct(*data_collections)
-        else:
-            BaseCollection.are_collections_aligned(data_colls)
-            val_len = len(data_colls[0].values)
-            for i, col in enumerate(data_collections):
-                data_collections[i] = [col] * val_len if isinstance(col, float) else col
-            result = data_colls[0].get_aligned_collection(data_type=data_type, unit=unit)
-            for i in xrange(val_len):
-                result[i] = funct(*[col[i] for col in data_collections])
+            return funct(*func_inputs)
+        BaseCollection.are_collections_aligned(data_colls)
+        result = data_colls[0].get_aligned_collection(data_type=data_type, unit=unit)
+        if vectorized:
+            values = funct(*[col.values if isinstance(col, BaseCollection) else col
+                             for col in func_inputs])
+            result.values = values.tolist() if hasattr(values, 'tolist') else values
             return result
+        columns = [col._values if isinstance(col, BaseCollection) else col
+                   for col in func_inputs]
+        assert workers >= 1, 'workers must be at least 1. Got {}.'.format(workers)
+        pool_class = ThreadPool if use_threads else Pool
+        if workers == 1 or pool_class is None:
+            result.values = _map_function((funct, columns))
+            return result
+        val_len = len(result)
+        chunk_size = int(math.ceil(val_len / (workers * 4)))
+        chunks = [(funct, [col[st:st + chunk_size] if isinstance(col, Iterable)
+                           else col for col in columns])
+                  for st in xrange(0, val_len, chunk_size)]
+        pool = pool_class(workers)
+        try:
+            values = pool.map(_map_function, chunks)
+        finally:
+            pool.close()
+            pool.join()
+        result.values = list(itertools.chain.from_iterable(values))
+        return result
 
     def _time_aggregated_collection(self, timestep):
         """Get a time-aggregated version of this collection."""
@@ -646,6 +801,9 @@ class BaseCollection(object):
     def _check_conditional_statement(statement, num_collections):
         """Method to check conditional statements to be sure that they are valid.
 
+        Statements may only contain numbers, the variables of the data collections
+        and arithmetic, comparison and logical operators.
+
         Args:
             statement: A conditional statement as a string (e.g. a>25 and a%5==0).
                 The variable should always be named as 'a' (without quotations).
@@ -658,39 +816,58 @@ class BaseCollection(object):
         """
         # Determine what the list of variables should be based on the num_collections
         correct_var = list(ascii_lowercase)[:num_collections]
+        error_msg = 'Invalid conditional statement: {}\n Statement should be a ' \
+            'valid Python statement and the variables should be named as ' \
+            'follows: {}'.format(statement, ', '.join(correct_var))
 
-        # Clean out the operators of the statement
-        st_statement = BaseCollection._remove_operators(statement)
-        parsed_st = [s for s in st_statement if s.isalpha()]
-
-        # Perform the check
-        for var in parsed_st:
-            if var not in correct_var:
-                raise ValueError(
-                    'Invalid conditional statement: {}\n '
-                    'Statement should be a valid Python statement'
-                    ' and the variables should be named as follows: {}'.format(
-                        statement, ', '.join(correct_var))
-                )
+        # Parse the statement and check every element of it
+        try:
+            tree = ast.parse(statement.lower().strip(), mode='eval')
+        except SyntaxError:
+            raise ValueError(error_msg)
+        for node in ast.walk(tree):
+            if not isinstance(node, _STATEMENT_NODES + (_NUMBER_NODE,)):
+                raise ValueError(error_msg)
+            if isinstance(node, ast.Name) and node.id not in correct_var:
+                raise ValueError(error_msg)
+            if isinstance(node, _NUMBER_NODE):
+                number = node.value if hasattr(node, 'value') else node.n
+                if isinstance(number, bool) or not isinstance(number, Number):
+                    raise ValueError(error_msg)
         return correct_var
 
     @staticmethod
-    def _remove_operators(statement):
-        """Remove logical operators from a statement."""
-        return statement.lower().replace("and", "").replace("or", "") \
-            .replace("not", "").replace("in", "").replace("is", "")
+    def _compile_conditional_statement(statement, num_collections):
+        """Compile a conditional statement into a function that evaluates whole lists.
 
-    @staticmethod
-    def _replace_operators(statement):
-        """Replace logical operators of a statement with non-alphanumeric characters."""
-        return statement.lower().replace("and", "&&").replace("or", "||") \
-            .replace("not", "~").replace("in", "<<").replace("is", "$")
+        The statement is checked and compiled only once and the result is cached
+        such that the same statement can be used again without parsing it.
 
-    @staticmethod
-    def _restore_operators(statement):
-        """Restore python logical operators from previously replaced ones."""
-        return statement.replace("&&", "and").replace("||", "or") \
-            .replace("~", "not").replace("<<", "in").replace("$", "is")
+        Args:
+            statement: A conditional statement as a string (e.g. a>25 and a%5==0).
+            num_collections: An integer representing the number of data collections
+                that the statement will be evaluating.
+
+        Returns:
+            A function that takes one list of values for each data collection and
+            returns a list of True/False booleans for whether each set of values
+            meets the conditional statement.
+        """
+        try:
+            return _STATEMENT_CACHE[(statement, num_collections)]
+        except KeyError:
+            pass
+        variables = ', '.join(BaseCollection._check_conditional_statement(
+            statement, num_collections))
+        items = variables if num_collections == 1 else 'zip({})'.format(variables)
+        source = 'lambda {0}: [bool({1}) for {0} in {2}]'.format(
+            variables, statement.lower().strip(), items)
+        evaluate = eval(compile(source, '<statement>', 'eval'),
+                        {'__builtins__': {}, 'bool': bool, 'zip': zip})
+        if len(_STATEMENT_CACHE) >= _STATEMENT_CACHE_SIZE:
+            _STATEMENT_CACHE.clear()
+        _STATEMENT_CACHE[(statement, num_collections)] = evaluate
+        return evaluate
 
     @staticmethod
     def linspace(start, stop, num):
@@ -896,12 +1073,9 @@ class BaseCollection(object):
 
     def _filter_by_statement(self, statement):
         """Filter the data collection based on a conditional statement."""
-        self.__class__._check_conditional_statement(statement, 1)
-        _filt_values, _filt_datetimes = [], []
-        for i, a in enumerate(self._values):
-            if eval(statement, {'a': a}):
-                _filt_values.append(a)
-                _filt_datetimes.append(self.datetimes[i])
+        pattern = self._compile_conditional_statement(statement, 1)(self._values)
+        _filt_values = [v for v, p in zip(self._values, pattern) if p]
+        _filt_datetimes = [d for d, p in zip(self.datetimes, pattern) if p]
         return _filt_values, _filt_datetimes
 
     def _filter_by_pattern(self, pattern):
@@ -911,8 +1085,10 @@ class BaseCollection(object):
         except TypeError:
             raise TypeError("pattern is not a list of Booleans. Got {}".format(
                 type(pattern)))
-        _filt_values = [d for i, d in enumerate(self._values) if pattern[i % _len]]
-        _filt_datetimes = [d for i, d in enumerate(self.datetimes) if pattern[i % _len]]
+        if _len != len(self._values):  # repeat the pattern over the values
+            pattern = list(itertools.islice(itertools.cycle(pattern), len(self._values)))
+        _filt_values = list(itertools.compress(self._values, pattern))
+        _filt_datetimes = list(itertools.compress(self.datetimes, pattern))
         return _filt_values, _filt_datetimes
 
     def _check_values(self, values):
@@ -960,7 +1136,25 @@ class BaseCollection(object):
         Returns:
             The percentile of the values
         """
+        return self._sorted_percentile(sorted(values), percent, key)
+
+    def _percentiles(self, values, percents):
+        """Find several percentiles of a list of values with a single sort.
+
+        Args:
+            values: A list of values for which percentiles are desired
+            percents: A list of float values from 0 to 100 representing the
+                requested percentiles.
+
+        Returns:
+            A list with the percentile of the values for each of the percents.
+        """
         vals = sorted(values)
+        return [self._sorted_percentile(vals, percent) for percent in percents]
+
+    @staticmethod
+    def _sorted_percentile(vals, percent, key=lambda x: x):
+        """Find the percentile of a list of values that is already sorted."""
         k = (len(vals) - 1) * (percent / 100)
         f = math.floor(k)
         c = math.ceil(k)
@@ -970,12 +1164,100 @@ class BaseCollection(object):
         d1 = key(vals[int(c)]) * (k - f)
         return d0 + d1
 
+    def _extreme_values(self, count, highest, ordered):
+        """Get the x highest or lowest values of the Data Collection and their indices.
+
+        The values are selected with a heap when the count is small compared to
+        the number of values and they are sorted otherwise. Values that are
+        equal are always ordered by their position in the Data Collection.
+
+        Args:
+            count: Integer for the number of values to be selected.
+            highest: Boolean to note whether the highest values should be selected.
+                If False, the lowest values are selected.
+            ordered: Boolean to note whether the output should be ordered by
+                value. If False, it is in the order of the Data Collection.
+        """
+        values = self._values
+        use_heap = count * 20 < len(values)
+        select = heapq.nlargest if highest else heapq.nsmallest
+        if ordered:
+            if use_heap:
+                index = select(count, xrange(len(values)), key=values.__getitem__)
+            else:
+                index = sorted(xrange(len(values)), key=values.__getitem__,
+                               reverse=highest)[:count]
+            return [values[i] for i in index], index
+
+        # find the least extreme of the selected values and take everything beyond it
+        selected = select(count, values) if use_heap else \
+            sorted(values, reverse=highest)[:count]
+        threshold = selected[-1]
+        ties = selected.count(threshold)  # number of values equal to the threshold
+        beyond = operator.gt if highest else operator.lt
+        top_values, top_index = [], []
+        for i, val in enumerate(values):
+            if val == threshold:
+                if ties == 0:
+                    continue
+                ties -= 1
+            elif not beyond(val, threshold):
+                continue
+            top_values.append(val)
+            top_index.append(i)
+        return top_values, top_index
+
+    def _values_percentile(self, percentile):
+        """Get the percentile of all values of the Data Collection."""
+        vals = _numpy_array(self._values, compact_only=True)
+        if vals is not None:
+            return numpy.percentile(vals, percentile).item()
+        return self._percentile(self._values, percentile)
+
+    def _numpy_operation(self, funct, other):
+        """Apply an arithmetic operator to compact values with numpy.
+
+        Args:
+            funct: A function from the operator module (eg. operator.add).
+            other: A number or the compact values of another Data Collection.
+
+        Returns:
+            A compact array of the resulting values. None if numpy is not available
+            or the values are not compact, in which case the operation should be
+            performed with pure Python.
+        """
+        vals = _numpy_array(self._values, compact_only=True)
+        if vals is None:
+            return None
+        if not isinstance(other, (int, float)):
+            other = _numpy_array(other, compact_only=True)
+            if other is None:
+                return None
+        try:
+            with numpy.errstate(divide='raise', invalid='raise'):
+                return _array_from_numpy(funct(vals, other))
+        except FloatingPointError:  # let pure Python raise a ZeroDivisionError
+            return None
+
+    def _dict_values(self):
+        """Get the values of the collection in a form that can be serialized to JSON."""
+        return self._values.tolist() if self.is_compact else self._values
+
     def _average(self, vals):
         return sum(vals) / len(vals)
 
     def _total(self, vals):
         return sum(vals)
 
+    @staticmethod
+    def _check_percentiles(percentiles):
+        """Check a list of percentiles to be sure that they are valid."""
+        assert isinstance(percentiles, Iterable) and len(percentiles) > 0, \
+            'percentiles must be a list of numbers. Got {}'.format(percentiles)
+        for percentile in percentiles:
+            assert 0 <= percentile <= 100, \
+                'percentile must be between 0 and 100. Got {}'.format(percentile)
+
     def _get_percentile_function(self, percentile):
         def percentile_function(vals):
             return self._percentile(vals, percentile)
@@ -994,13 +1276,30 @@ class BaseCollection(object):
             [s for c in clss.__subclasses__() for s in self._all_subclasses(c)])
 
     def __len__(self):
-        return len(self._values)
+        return len(self._value_buffer)
 
     def __getitem__(self, key):
+        if isinstance(key, slice) and self.is_compact:
+            return self._values[key].tolist()
         return self._values[key]
 
     def __setitem__(self, key, value):
-        self._values[key] = value
+        if self._values_shared:  # copy the values before editing them
+            vals = self._values
+            self._values = vals[:] if isinstance(vals, array) else list(vals)
+        self._edit_count += 1
+        try:
+            self._values[key] = value
+        except (TypeError, OverflowError):
+            if not self.is_compact:
+                raise
+            # the value does not fit in the array of the compact values
+            try:
+                self._values = array('d', self._values)
+                self._values[key] = value
+            except TypeError:
+                self._values = list(self._values)
+                self._values[key] = value
 
     def __iter__(self):
         return iter(self._values)
@@ -1039,55 +1338,114 @@ class BaseCollection(object):
         return new_obj
 
     def __neg__(self):
-        new_vals = [-v_1 for v_1 in self._values]
+        new_vals = self._neg_values()
         new_obj = self.__class__(self.header.duplicate(), new_vals, self.datetimes)
         new_obj._validated_a_period = self._validated_a_period
         return new_obj
 
     def _add_values(self, other):
+        if self.is_lazy:
+            return self._lazy_values('+', other)
         if isinstance(other, (int, float)):
-            new_vals = [v_1 + other for v_1 in self._values]
+            new_vals = self._numpy_operation(operator.add, other)
+            if new_vals is None:
+                new_vals = [v_1 + other for v_1 in self._values]
         else:
             assert self._collection_type == other._collection_type, \
                 '{} cannot be added to {}'.format(self.__class__, other.__class__)
             assert len(self) == len(other), 'Length of DataCollections must match in ' \
                 'order to add them together. {} != {}'.format(len(self), len(other))
-            new_vals = [v_1 + v_2 for v_1, v_2 in zip(self._values, other._values)]
+            new_vals = self._numpy_operation(operator.add, other._values)
+            if new_vals is None:
+                new_vals = [v_1 + v_2 for v_1, v_2 in zip(self._values, other._values)]
         return new_vals
 
     def _sub_values(self, other):
+        if self.is_lazy:
+            return self._lazy_values('-', other)
         if isinstance(other, (int, float)):
-            new_vals = [v_1 - other for v_1 in self._values]
+            new_vals = self._numpy_operation(operator.sub, other)
+            if new_vals is None:
+                new_vals = [v_1 - other for v_1 in self._values]
         else:
             assert self._collection_type == other._collection_type, \
                 '{} cannot be subtracted from {}'.format(other.__class__, self.__class__)
             assert len(self) == len(other), 'Length of DataCollections must match ' \
                 'to subtract one from the other. {} != {}'.format(len(self), len(other))
-            new_vals = [v_1 - v_2 for v_1, v_2 in zip(self._values, other._values)]
+            new_vals = self._numpy_operation(operator.sub, other._values)
+            if new_vals is None:
+                new_vals = [v_1 - v_2 for v_1, v_2 in zip(self._values, other._values)]
         return new_vals
 
     def _mul_values(self, other):
+        if self.is_lazy:
+            return self._lazy_values('*', other)
         if isinstance(other, (int, float)):
-            new_vals = [v_1 * other for v_1 in self._values]
+            new_vals = self._numpy_operation(operator.mul, other)
+            if new_vals is None:
+                new_vals = [v_1 * other for v_1 in self._values]
         else:
             assert self._collection_type == other._collection_type, \
                 '{} cannot be multiplied by {}'.format(other.__class__, self.__class__)
             assert len(self) == len(other), 'Length of DataCollections must match ' \
                 'to multiply them together. {} != {}'.format(len(self), len(other))
-            new_vals = [v_1 * v_2 for v_1, v_2 in zip(self._values, other._values)]
+            new_vals = self._numpy_operation(operator.mul, other._values)
+            if new_vals is None:
+                new_vals = [v_1 * v_2 for v_1, v_2 in zip(self._values, other._values)]
         return new_vals
 
     def _div_values(self, other):
+        if self.is_lazy:
+            return self._lazy_values('/', other)
         if isinstance(other, (int, float)):
-            new_vals = [v_1 / other for v_1 in self._values]
+            new_vals = self._numpy_operation(operator.truediv, other)
+            if new_vals is None:
+                new_vals = [v_1 / other for v_1 in self._values]
         else:
             assert self._collection_type == other._collection_type, \
                 '{} cannot be divided by {}'.format(other.__class__, self.__class__)
             assert len(self) == len(other), 'Length of DataCollections must match ' \
                 'to divide them. {} != {}'.format(len(self), len(other))
-            new_vals = [v_1 / v_2 for v_1, v_2 in zip(self._values, other._values)]
+            new_vals = self._numpy_operation(operator.truediv, other._values)
+            if new_vals is None:
+                new_vals = [v_1 / v_2 for v_1, v_2 in zip(self._values, other._values)]
         return new_vals
 
+    def _share_values(self):
+        """Get the values of this collection such that a new collection can share them.
+
+        Both collections will copy the values before they edit them.
+        """
+        vals = self._values
+        self._values_shared = True
+        return _SharedValues(vals)
+
+    def _expression_operand(self):
+        """Get the values of this collection for use in a lazy expression."""
+        vals = self._value_buffer
+        if not isinstance(vals, _ValueExpression):
+            self._values_shared = True  # the expression is evaluated later
+        return vals
+
+    def _neg_values(self):
+        if self.is_lazy:
+            return _ValueExpression(None, (self._expression_operand(),), len(self))
+        return [-v_1 for v_1 in self._values]
+
+    def _lazy_values(self, symbol, other):
+        """Get a lazy expression for an arithmetic operation with another operand."""
+        if isinstance(other, (int, float)):
+            return _ValueExpression(
+                symbol, (self._expression_operand(), other), len(self))
+        assert self._collection_type == other._collection_type, \
+            '{} cannot be used with {} in an arithmetic operation'.format(
+                other.__class__, self.__class__)
+        assert len(self) == len(other), 'Length of DataCollections must match ' \
+            'for arithmetic operations. {} != {}'.format(len(self), len(other))
+        return _ValueExpression(
+            symbol, (self._expression_operand(), other._expression_operand()),
+            len(self))
+
     @property
     def is_continuous(self):
         """Boolean denoting whether the data collection is continuous."""
@@ -1115,3 +1473,183 @@ class BaseCollection(object):
         """Discontinuous Collection representation."""
         return "Discontinuous Data Collection\n{} ({})\n...{} values...".format(
             self.header.data_type, self.header.unit, len(self._values))
+
+
+def _compact_array(values):
+    """Get a typed array from a list of numerical values.
+
+    Args:
+        values: A list of numbers or an array.
+
+    Returns:
+        An array of 32-bit integers if all of the values are integers that fit in
+        it. Otherwise, an array of doubles. A TypeError is raised if any value
+        is not a number.
+    """
+    if isinstance(values, array):
+        return values[:]
+    if all(isinstance(val, int) and not isinstance(val, bool) for val in values):
+        try:
+            return array('i', values)
+        except OverflowError:  # integers that are too large for the array
+            pass
+    return array('d', values)
+
+
+def _numpy_array(values, compact_only=False):
+    """Get a numpy array from a list of numerical values.
+
+    Args:
+        values: A list of numbers or a compact array. Compact arrays of doubles
+            are not copied and the numpy array uses the same memory as them.
+            Compact arrays of integers are copied to 64-bit integers such that
+            the results of math with them are the same on all platforms.
+        compact_only: Boolean to note whether None should be returned when the
+            values are not a compact array, which is useful for operations that
+            are faster in pure Python than the copying of a list. (Default: False).
+
+    Returns:
+        A numpy array. None if numpy is not available or the values are not numbers.
+    """
+    if numpy is None:
+        return None
+    if isinstance(values, array):
+        if values.typecode == 'i':
+            return numpy.frombuffer(values, dtype=numpy.int32).astype(numpy.int64)
+        return numpy.frombuffer(values, dtype=numpy.float64)
+    if compact_only:
+        return None
+    vals = numpy.asarray(values)
+    return vals if vals.dtype.kind in 'iuf' else None
+
+
+def _array_from_numpy(values):
+    """Get a compact array from a numpy array of integers or floats.
+
+    Integers that do not fit in a 32-bit array are stored as doubles like they
+    are in _compact_array.
+    """
+    if values.dtype.kind in 'iu' and (len(values) == 0 or (
+            values.min() >= _INT_MIN and values.max() <= _INT_MAX)):
+        return array('i', values.astype(numpy.int32).tobytes())
+    return array('d', values.astype(numpy.float64).tobytes())
+
+
+def _map_function(args):
+    """Map a function over columns of values and individual values.
+
+    This function is used by compute_function_aligned and it is defined at the
+    level of the module such that it can be used in a pool of processes.
+
+    Args:
+        args: A tuple with the function and a list of columns. Each column
+            is either a list of values or an individual value that is used
+            with every item of the lists.
+
+    Returns:
+        A list with the results of the function.
+    """
+    funct, columns = args
+    columns = [col if isinstance(col, Iterable) else itertools.repeat(col)
+               for col in columns]
+    return list(itertools.starmap(funct, zip(*columns)))
+
+
+class _SharedValues(object):
+    """The values of a Data Collection that are shared with a new Data Collection.
+
+    Args:
+        values: The list or array of values to be shared.
+    """
+    __slots__ = ('values',)
+
+    def __init__(self, values):
+        self.values = values
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+
+class _ValueExpression(object):
+    """An arithmetic expression over the values of Data Collections.
+
+    Expressions are the values of lazy Data Collections until they are evaluated
+    and the whole tree of an expression is evaluated in a single pass.
+
+    Args:
+        symbol: Text for the arithmetic operator of the expression ('+', '-', '*'
+            or '/'). None to negate a single operand.
+        operands: A tuple with the operands of the operator. Each operand is either
+            a number, a list or array of values or another _ValueExpression.
+        length: Integer for the number of values that the expression evaluates to.
+    """
+    __slots__ = ('symbol', 'operands', 'length', 'depth')
+
+    def __init__(self, symbol, operands, length):
+        depth = 0
+        for operand in operands:
+            if isinstance(operand, _ValueExpression):
+                depth = max(depth, operand.depth)
+        if depth >= _EXPRESSION_DEPTH:  # keep the source short enough to compile
+            operands = tuple(op.evaluate() if isinstance(op, _ValueExpression)
+                             else op for op in operands)
+            depth = 0
+        self.symbol = symbol
+        self.operands = operands
+        self.length = length
+        self.depth = depth + 1
+
+    def evaluate(self):
+        """Get a list or compact array of the values of the expression."""
+        columns, constants = [], []
+        source = self._source(columns, constants)
+        namespace = {'__builtins__': {}}
+        for i, constant in enumerate(constants):
+            namespace['c{}'.format(i)] = constant
+        variables = ', '.join('v{}'.format(i) for i in xrange(len(columns)))
+        funct = eval(compile('lambda {}: {}'.format(variables, source),
+                             '<expression>', 'eval'), namespace)
+        if numpy is not None and all(isinstance(col, array) for col in columns):
+            try:
+                with numpy.errstate(divide='raise', invalid='raise'):
+                    return _array_from_numpy(funct(*map(_numpy_array, columns)))
+            except FloatingPointError:  # let pure Python raise a ZeroDivisionError
+                pass
+        return list(map(funct, *columns))
+
+    def _source(self, columns, constants):
+        """Get the Python source of the expression.
+
+        Args:
+            columns: A list to which the lists of values used by the expression
+                are added. Each one is a variable named v0, v1, etc.
+            constants: A list to which the numbers used by the expression are
+                added. Each one is a variable named c0, c1, etc.
+        """
+        terms = []
+        for operand in self.operands:
+            if isinstance(operand, _ValueExpression):
+                terms.append(operand._source(columns, constants))
+            elif isinstance(operand, (int, float)):
+                terms.append('c{}'.format(len(constants)))
+                constants.append(operand)
+            else:
+                for i, col in enumerate(columns):
+                    if col is operand:
+                        break
+                else:
+                    i = len(columns)
+                    columns.append(operand)
+                terms.append('v{}'.format(i))
+        if self.symbol is None:
+            return '(-{})'.format(terms[0])
+        return '({} {} {})'.format(terms[0], self.symbol, terms[1])
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(self.evaluate())
@@ -2,9 +2,9 @@
 """Ladybug analysis period class."""
 from __future__ import division
 
-from .dt import DateTime
+from .dt import DateTime, DateTimeSequence
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 import sys
 if (sys.version_info >= (3, 0)):
     xrange = range
@@ -111,8 +111,7 @@ class AnalysisPeriod(object):
         self._timestep = timestep
         self._minute_intervals = timedelta(1 / (24.0 * self.timestep))
 
-        # _timestamps_data is a dictionary for datetimes.
-        # key values will be minute of year
+        # _timestamps_data is an array of the minutes of the year in the period
         self._timestamps_data = None  # set to None for now and calculate upon request
         self._datetimes = None
 
@@ -240,10 +239,14 @@ class AnalysisPeriod(object):
 
     @property
     def datetimes(self):
-        """A sorted list of hourly datetimes in this analysis period."""
+        """A sorted DateTimeSequence of the datetimes in this analysis period.
+
+        The sequence stores the minutes of the year and only creates the DateTimes
+        upon request. It can be used in the same way as a tuple of DateTimes.
+        """
         if self._timestamps_data is None:
             self._calculate_timestamps()
-        return tuple(self._datetimes)
+        return self._datetimes
 
     @property
     def moys(self):
@@ -379,49 +382,34 @@ class AnalysisPeriod(object):
         }
 
     def _calc_timestamps(self, st_time, end_time):
-        """Calculate timesteps between start time and end time.
+        """Calculate minutes of the year between start time and end time.
 
         Use this method only when start time month is before end time month.
         """
-        # calculate based on minutes
-        # I have to convert the object to DateTime because of how Dynamo
-        # works: https://github.com/DynamoDS/Dynamo/issues/6683
-        # Do not modify this line to datetime
-        curr = datetime(st_time.year, st_time.month, st_time.day, st_time.hour,
-                        st_time.minute, self.is_leap_year)
-        end_time = datetime(end_time.year, end_time.month, end_time.day,
-                            end_time.hour, end_time.minute, self.is_leap_year)
-
-        while curr <= end_time:
-            if self.is_possible_hour(curr.hour + (curr.minute / 60.0)):
-                time = DateTime(curr.month, curr.day, curr.hour, curr.minute,
-                                self.is_leap_year)
-                self._timestamps_data.append(time.moy)
-                self._datetimes.append(time)
-            curr += self.minute_intervals
-
-        if self.timestep != 1 and curr.hour == 23 and self.is_possible_hour(0):
+        mins_per_step = self.VALIDTIMESTEPS[self.timestep]
+        possible_mods = set(mod for mod in xrange(0, 1440, mins_per_step)
+                            if self.is_possible_hour(mod / 60.0))
+        st_moy, end_moy = st_time.moy, end_time.moy
+        moys = [moy for moy in xrange(st_moy, end_moy + 1, mins_per_step)
+                if moy % 1440 in possible_mods]
+
+        if self.timestep != 1 and end_time.hour == 23 and self.is_possible_hour(0):
             # This is for cases that timestep is more than one
             # and last hour of the day is part of the calculation
-            curr = end_time
-            for _ in list(xrange(self.timestep))[1:]:
-                curr += self.minute_intervals
-                time = DateTime(curr.month, curr.day, curr.hour, curr.minute,
-                                self.is_leap_year)
-                self._timestamps_data.append(time.moy)
-                self._datetimes.append(time)
+            moys.extend(xrange(end_moy + mins_per_step, end_moy + 60, mins_per_step))
+        return moys
 
     def _calculate_timestamps(self):
-        """Return a list of Ladybug DateTimes in this analysis period."""
-        self._timestamps_data = []
-        self._datetimes = []
+        """Calculate the DateTimeSequence of this analysis period."""
         if not self._is_reversed:
-            self._calc_timestamps(self.st_time, self.end_time)
+            moys = self._calc_timestamps(self.st_time, self.end_time)
         else:
-            self._calc_timestamps(
+            moys = self._calc_timestamps(
                 self.st_time, DateTime.from_last_hour(self.is_leap_year))
-            self._calc_timestamps(
-                DateTime.from_first_hour(self.is_leap_year), self.end_time)
+            moys.extend(self._calc_timestamps(
+                DateTime.from_first_hour(self.is_leap_year), self.end_time))
+        self._datetimes = DateTimeSequence(moys, self.is_leap_year)
+        self._timestamps_data = self._datetimes._moys
 
     def _calc_daystamps(self, st_time, end_time):
         """Calculate days of the year between start time and end time.
@@ -439,7 +427,7 @@ class AnalysisPeriod(object):
 
         The length will be number of hours * timestep.
         """
-        if self.st_hour == 1 and self.end_hour == 23:  # use fast method
+        if self.st_hour == 0 and self.end_hour == 23:  # use fast method
             if not self._is_reversed:
                 return (self.end_time.int_hoy + 1 - self.st_time.int_hoy) * self.timestep
             else:
@@ -73,7 +73,7 @@ def epw_to_ddy(epw_file, percentile, output_file):
         epw_file: Path to an .epw file.
     """
     try:
-        epw_obj = EPW(epw_file)
+        epw_obj = EPW(epw_file, lazy_load=True)
         ddy_obj = DDY(epw_obj.location, epw_obj.best_available_design_days(percentile))
         output_file.write(ddy_obj.to_file_string())
     except Exception as e:
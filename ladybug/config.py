@@ -6,6 +6,7 @@ Usage:
     from ladybug.config import folders
     print(folders.default_epw_folder)
     folders.default_epw_folder = "C:/epw_data"
+    folders.epw_cache_folder = "C:/epw_cache"
 """
 import os
 import json
@@ -25,6 +26,7 @@ class Folders(object):
     Properties:
         * ladybug_tools_folder
         * default_epw_folder
+        * epw_cache_folder
         * config_file
         * mute
     """
@@ -68,6 +70,23 @@ class Folders(object):
             print('Path to the default epw folder is set to: '
                   '{}'.format(self._default_epw_folder))
 
+    @property
+    def epw_cache_folder(self):
+        """Get or set the path to the folder where parsed EPW caches are written.
+
+        If None, the cache of each EPW file will be written into the same
+        folder as the EPW file itself.
+        """
+        return self._epw_cache_folder
+
+    @epw_cache_folder.setter
+    def epw_cache_folder(self, path):
+        self._epw_cache_folder = path or None
+
+        if not self.mute and self._epw_cache_folder:
+            print('Path to the epw cache folder is set to: '
+                  '{}'.format(self._epw_cache_folder))
+
     @property
     def config_file(self):
         """Get or set the path to the config.json file from which folders are loaded.
@@ -98,7 +117,8 @@ class Folders(object):
         # set the default paths to be all blank
         default_path = {
             "ladybug_tools_folder": r'',
-            "default_epw_folder": r''
+            "default_epw_folder": r'',
+            "epw_cache_folder": r''
         }
 
         with open(file_path, 'r') as cfg:
@@ -112,9 +132,10 @@ class Folders(object):
                     if not key.startswith('__') and p.strip():
                         default_path[key] = p.strip()
 
-        # set paths for the ladybug_tools_folder and default_epw_folder
+        # set paths for the ladybug_tools_folder, default_epw_folder and cache folder
         self.ladybug_tools_folder = default_path["ladybug_tools_folder"]
         self.default_epw_folder = default_path["default_epw_folder"]
+        self.epw_cache_folder = default_path["epw_cache_folder"]
 
     def _find_default_epw_folder(self):
         """Find the the default EPW folder in its usual location.
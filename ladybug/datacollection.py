@@ -31,12 +31,16 @@ are faster when the collection is continuous.
 """
 from __future__ import division
 
-from ._datacollectionbase import BaseCollection
+from ._datacollectionbase import BaseCollection, _numpy_array
 from .header import Header
 from .analysisperiod import AnalysisPeriod
-from .dt import DateTime
+from .dt import DateTime, DateTimeSequence
 
-from collections import OrderedDict
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from operator import attrgetter, ge, le
+import math
 try:
     from collections.abc import Iterable  # python < 3.7
 except ImportError:
@@ -46,6 +50,14 @@ try:
 except ImportError:
     xrange = range  # python 3
 
+_INTERVAL_KEYS = {  # functions to get the group key of a DateTime for each interval
+    'daily': attrgetter('doy'),
+    'monthly': attrgetter('month'),
+    'monthlyperhour': attrgetter('month', 'hour', 'minute')
+}
+_GROUPING_PLANS = {}  # grouping plans of continuous collections by analysis period
+_GROUPING_PLANS_SIZE = 256
+
 
 class HourlyDiscontinuousCollection(BaseCollection):
     """Discontinuous Data Collection at hourly or sub-hourly intervals.
@@ -55,7 +67,8 @@ class HourlyDiscontinuousCollection(BaseCollection):
             must have an AnalysisPeriod on it.
         values: A list of values.
         datetimes: A list of Ladybug DateTime objects that aligns with
-            the list of values.
+            the list of values. A DateTimeSequence can also be used, in which
+            case the DateTimes are stored compactly as minutes of the year.
 
 
     Properties:
@@ -63,7 +76,9 @@ class HourlyDiscontinuousCollection(BaseCollection):
         * bounds
         * datetimes
         * header
+        * is_compact
         * is_continuous
+        * is_lazy
         * is_mutable
         * max
         * median
@@ -87,7 +102,8 @@ class HourlyDiscontinuousCollection(BaseCollection):
             'datetimes should be a list or tuple. Got {}'.format(type(datetimes))
 
         self._header = header
-        self._datetimes = tuple(datetimes)
+        self._datetimes = datetimes if isinstance(datetimes, DateTimeSequence) \
+            else tuple(datetimes)
         self.values = values
         self._validated_a_period = False
 
@@ -136,6 +152,37 @@ class HourlyDiscontinuousCollection(BaseCollection):
             moy_dict[dt.moy] = val
         return moy_dict
 
+    def value_at(self, datetime):
+        """Get the value of this collection at a given datetime.
+
+        The index of each datetime is found with a dictionary that is built the
+        first time this method is called such that each lookup is fast.
+
+        Args:
+            datetime: A Ladybug DateTime in the collection.
+
+        Returns:
+            The value of the collection at the datetime. A ValueError is raised
+            if the datetime is not in the collection.
+        """
+        ind = self._moy_position(datetime.moy)
+        if ind is None:
+            raise ValueError(
+                'DateTime {} was not found in the Data Collection.'.format(datetime))
+        return self._values[ind]
+
+    def values_at(self, datetimes):
+        """Get a list of the values of this collection at several datetimes.
+
+        Args:
+            datetimes: A list of Ladybug DateTimes in the collection.
+
+        Returns:
+            A list of the values of the collection at each of the datetimes. A
+            ValueError is raised if any of the datetimes is not in the collection.
+        """
+        return [self.value_at(dt) for dt in datetimes]
+
     def filter_by_analysis_period(self, analysis_period):
         """Filter a Data Collection based on an analysis period.
 
@@ -206,6 +253,21 @@ class HourlyDiscontinuousCollection(BaseCollection):
         """
         return self._time_interval_operation('daily', 'percentile', percentile)
 
+    def percentiles_daily(self, percentiles):
+        """Return a list of daily collections with values at each input percentile.
+
+        This is faster than calling percentile_daily for each percentile since
+        the values of each day are grouped and sorted only once.
+
+        Args:
+            percentiles: A list of float values from 0 to 100 representing the
+                requested percentiles (eg. [5, 25, 50, 75, 95]).
+
+        Returns:
+            A list of daily collections with one collection for each percentile.
+        """
+        return self._time_interval_percentiles('daily', percentiles)
+
     def group_by_month(self):
         """Return a dictionary of this collection's values grouped by each month.
 
@@ -235,6 +297,21 @@ class HourlyDiscontinuousCollection(BaseCollection):
         """
         return self._time_interval_operation('monthly', 'percentile', percentile)
 
+    def percentiles_monthly(self, percentiles):
+        """Return a list of monthly collections with values at each input percentile.
+
+        This is faster than calling percentile_monthly for each percentile since
+        the values of each month are grouped and sorted only once.
+
+        Args:
+            percentiles: A list of float values from 0 to 100 representing the
+                requested percentiles (eg. [5, 25, 50, 75, 95]).
+
+        Returns:
+            A list of monthly collections with one collection for each percentile.
+        """
+        return self._time_interval_percentiles('monthly', percentiles)
+
     def group_by_month_per_hour(self):
         """Return a dictionary of this collection's values grouped by each month per hour.
 
@@ -246,17 +323,54 @@ class HourlyDiscontinuousCollection(BaseCollection):
 
         -   The third represents the minute of the minute of the hour between 0-59.
         """
-        t_step = self.header.analysis_period.timestep
         data_by_month_per_hour = OrderedDict()
-        for m in xrange(1, 13):
-            for h in xrange(0, 24 * t_step):
-                float_hr = h / t_step
-                hr, mi = int(float_hr), int((h % t_step) * (60 / t_step))
-                data_by_month_per_hour[(m, hr, mi)] = []
+        for key in self._month_per_hour_keys():
+            data_by_month_per_hour[key] = []
         for v, dt in zip(self.values, self.datetimes):
             data_by_month_per_hour[(dt.month, dt.hour, dt.minute)].append(v)
         return data_by_month_per_hour
 
+    def group_by_function(self, key_function):
+        """Return a dictionary of this collection's values grouped by a custom function.
+
+        This is useful for groupings that do not have their own method, such
+        as ISO weeks, seasons or typical week windows.
+
+        Args:
+            key_function: A function that takes a Ladybug DateTime and returns
+                the key of the group that it belongs to. Any hashable object
+                can be a key (eg. lambda dt: dt.isocalendar()[1] for ISO weeks
+                or lambda dt: (dt.month % 12) // 3 for seasons). DateTimes for
+                which the function returns None are excluded from all groups.
+
+        Returns:
+            An OrderedDict with the key of each group as keys and the values in
+            each group as values. Groups are ordered by their first value.
+        """
+        return OrderedDict((key, self._group_values(group)) for key, group
+                           in self._grouping_plan(key_function).items())
+
+    def aggregate_by_function(self, key_function, operation='average', percentile=0):
+        """Return a dictionary of this collection's values aggregated by a function.
+
+        Args:
+            key_function: A function that takes a Ladybug DateTime and returns
+                the key of the group that it belongs to. See the group_by_function
+                method for more information.
+            operation: Text for the operation used to aggregate the values of
+                each group. Choose from 'average', 'total' or
+                'percentile'. (Default: 'average').
+            percentile: A float value from 0 to 100 representing the requested
+                percentile when the operation is 'percentile'. (Default: 0).
+
+        Returns:
+            An OrderedDict with the key of each group as keys and the aggregated
+            value of each group as values.
+        """
+        funct = self._interval_function(operation, percentile)
+        return OrderedDict((key, funct(self._group_values(group))) for key, group
+                           in self._grouping_plan(key_function).items())
+
     def average_monthly_per_hour(self):
         """Return a monthly per hour data collection of average values."""
         return self._time_interval_operation('monthlyperhour', 'average')
@@ -274,6 +388,22 @@ class HourlyDiscontinuousCollection(BaseCollection):
         """
         return self._time_interval_operation('monthlyperhour', 'percentile', percentile)
 
+    def percentiles_monthly_per_hour(self, percentiles):
+        """Return a list of monthly per hour collections at each input percentile.
+
+        This is faster than calling percentile_monthly_per_hour for each percentile
+        since the values of each month per hour are grouped and sorted only once.
+
+        Args:
+            percentiles: A list of float values from 0 to 100 representing the
+                requested percentiles (eg. [5, 25, 50, 75, 95]).
+
+        Returns:
+            A list of monthly per hour collections with one collection for
+            each percentile.
+        """
+        return self._time_interval_percentiles('monthlyperhour', percentiles)
+
     def interpolate_holes(self):
         """Linearly interpolate over holes in this collection to make it continuous.
 
@@ -384,62 +514,67 @@ class HourlyDiscontinuousCollection(BaseCollection):
         a_per = self.header.analysis_period
         n_ap = [a_per.st_month, a_per.st_day, a_per.st_hour, a_per.end_month,
                 a_per.end_day, a_per.end_hour, a_per.timestep, a_per.is_leap_year]
+        datetimes, values = self.datetimes, self._values
 
         # make sure that datetimes are all in chronological order.
-        sort_datetimes, sort_values = zip(*sorted(zip(self.datetimes, self.values)))
+        moys = _datetime_moys(datetimes)
+        order = sorted(xrange(len(moys)), key=moys.__getitem__)
         if not a_per.is_reversed and not a_per.is_annual:
-            if sort_datetimes[0].doy < a_per.st_time.doy:
-                n_ap[0] = sort_datetimes[0].month
-                n_ap[1] = sort_datetimes[0].day
-            if sort_datetimes[-1].doy > a_per.end_time.doy:
-                n_ap[3] = sort_datetimes[-1].month
-                n_ap[4] = sort_datetimes[-1].day
+            first_dt, last_dt = datetimes[order[0]], datetimes[order[-1]]
+            if moys[order[0]] // 1440 + 1 < a_per.st_time.doy:
+                n_ap[0], n_ap[1] = first_dt.month, first_dt.day
+            if moys[order[-1]] // 1440 + 1 > a_per.end_time.doy:
+                n_ap[3], n_ap[4] = last_dt.month, last_dt.day
         elif a_per.is_reversed:
-            last_ind = None
-            for i, date_t in enumerate(sort_datetimes):
-                last_ind = i if date_t.moy <= a_per.end_time.moy else last_ind
-            if last_ind is not None:
-                last_ind = last_ind + 1
-                sort_datetimes = sort_datetimes[last_ind:] + sort_datetimes[:last_ind]
-                sort_values = sort_values[last_ind:] + sort_values[:last_ind]
+            # rotate the datetimes to start after the end of the analysis_period
+            last_ind = bisect_right([moys[i] for i in order], a_per.end_time.moy)
+            sort_order = order
+            order = order[last_ind:] + order[:last_ind]
             # If datetimes are outside the a_period range, just make it annual.
             # There's no way to know what side of the analysis_period should be extended.
-            if sort_datetimes[0].doy > a_per.end_time.doy and \
-                    sort_datetimes[0].doy < a_per.st_time.doy:
+            first_doy = moys[order[0]] // 1440 + 1
+            if a_per.end_time.doy < first_doy < a_per.st_time.doy:
                 n_ap[0], n_ap[1], n_ap[3], n_ap[4] = 1, 1, 12, 31
-                sort_datetimes, sort_values = zip(*sorted(zip(
-                    self.datetimes, self.values)))
-
-        # check that no hours lie outside of the analysis_period
-        if not a_per.is_annual:
-            if a_per.st_hour != 0:
-                for date_t in sort_datetimes:
-                    n_ap[2] = date_t.hour if date_t.hour < n_ap[2] else n_ap[2]
-            if a_per.end_hour != 23:
-                for date_t in sort_datetimes:
-                    n_ap[5] = date_t.hour if date_t.hour > n_ap[5] else n_ap[5]
+                order = sort_order
 
-        # check that there are no duplicate datetimes.
-        for i in xrange(len(sort_datetimes)):
-            assert sort_datetimes[i] != sort_datetimes[i - 1], 'Duplicate datetime ' \
-                'was found in the collection: {}'.format(sort_datetimes[i])
-
-        # check that the analysis_period timestep is correct.
+        # check the hours, duplicates, timestep and leap days in one pass
+        check_st_hour = not a_per.is_annual and a_per.st_hour != 0
+        check_end_hour = not a_per.is_annual and a_per.end_hour != 23
+        check_leap = not a_per.is_leap_year
+        valid_steps = sorted(a_per.VALIDTIMESTEPS.keys())
         mins_per_step = int(60 / n_ap[6])
-        for date_t in sort_datetimes:
-            if date_t.moy % mins_per_step != 0:
-                i = 0
-                valid_steps = sorted(a_per.VALIDTIMESTEPS.keys())
-                while date_t.moy % mins_per_step != 0 and i < len(valid_steps):
-                    mins_per_step = int(60 / valid_steps[i])
-                    i += 1
+        prev_moy = None
+        for i in order:
+            moy = moys[i]
+            # check that there are no duplicate datetimes.
+            assert moy != prev_moy, 'Duplicate datetime ' \
+                'was found in the collection: {}'.format(datetimes[i])
+            prev_moy = moy
+            # check that no hours lie outside of the analysis_period
+            if check_st_hour or check_end_hour:
+                hour = (moy % 1440) // 60
+                if check_st_hour and hour < n_ap[2]:
+                    n_ap[2] = hour
+                if check_end_hour and hour > n_ap[5]:
+                    n_ap[5] = hour
+            # check that the analysis_period timestep is correct.
+            if moy % mins_per_step != 0:
+                j = 0
+                while moy % mins_per_step != 0 and j < len(valid_steps):
+                    mins_per_step = int(60 / valid_steps[j])
+                    j += 1
                 n_ap[6] = int(60 / mins_per_step)
-
-        # check that the analysis_period leap_year is correct.
-        if not a_per.is_leap_year:
-            for date_t in sort_datetimes:
+            # check that the analysis_period leap_year is correct.
+            if check_leap and 84960 <= moy < 86400:  # only February 29 can be leap
+                date_t = datetimes[i]
                 if date_t.month == 2 and date_t.day == 29:
                     n_ap[7] = True
+        if isinstance(datetimes, DateTimeSequence):
+            sort_datetimes = DateTimeSequence(
+                [moys[i] for i in order], datetimes.leap_year)
+        else:
+            sort_datetimes = [datetimes[i] for i in order]
+        sort_values = [values[i] for i in order]
 
         # build a validated collection.
         new_ap = AnalysisPeriod(*n_ap)
@@ -453,7 +588,7 @@ class HourlyDiscontinuousCollection(BaseCollection):
         """Convert Data Collection to a dictionary."""
         return {
             'header': self.header.to_dict(),
-            'values': self._values,
+            'values': self._dict_values(),
             'datetimes': [dat.to_array() for dat in self.datetimes],
             'validated_a_period': self._validated_a_period,
             'type': self.__class__.__name__
@@ -464,14 +599,46 @@ class HourlyDiscontinuousCollection(BaseCollection):
         _step = (end - start) / float(step_count)
         return (start + (i * _step) for i in xrange(int(step_count)))
 
+    def _moy_position(self, moy):
+        """Get the index of a minute of the year in this collection's values.
+
+        None is returned if the moy is not in the collection.
+        """
+        return self._moy_index().get(moy)
+
+    def _moy_index(self):
+        """Get a dictionary with the index of each minute of the year in this collection.
+
+        The dictionary is remembered along with the datetimes it was built from
+        and it is only rebuilt if the datetimes of the collection change.
+        """
+        datetimes = self.datetimes
+        try:
+            index_dts, index = self._moy_index_cache
+            if index_dts is datetimes:
+                return index
+        except AttributeError:  # the index has not yet been built
+            pass
+        index = {}
+        for i, moy in enumerate(_datetime_moys(datetimes)):
+            index.setdefault(moy, i)
+        self._moy_index_cache = (datetimes, index)
+        return index
+
     def _filter_by_moys_slow(self, moys):
-        """Filter the Data Collection with a slow method that always works."""
+        """Filter the Data Collection with a method that always works.
+
+        The moys are put in a set such that the datetimes are filtered in a
+        single pass regardless of the number of moys.
+        """
+        if not isinstance(moys, (set, frozenset)):
+            moys = set(moys)
         _filt_values = []
         _filt_datetimes = []
-        for i, d in enumerate(self.datetimes):
+        for val, d in zip(self._values, self.datetimes):
             if d.moy in moys:
                 _filt_datetimes.append(d)
-                _filt_values.append(self._values[i])
+                _filt_values.append(val)
         return _filt_values, _filt_datetimes
 
     def _timestep_cull(self, timestep):
@@ -502,39 +669,67 @@ class HourlyDiscontinuousCollection(BaseCollection):
     def _time_interval_operation(self, interval, operation, percentile=0):
         """Get a collection of a certain time interval with a given math operation."""
         # retrive the function that correctly describes the operation
-        if operation == 'average':
-            funct = self._average
-        elif operation == 'total':
-            funct = self._total
+        funct = self._interval_function(operation, percentile)
+
+        # retrive the dates that correctly describe the time interval
+        dates = self._interval_dates(interval)
+        # get the data for the new collection
+        new_data = None
+        if operation != 'percentile':
+            new_data = self._numpy_interval_operation(interval, operation)
+        if new_data is not None:
+            d_times = list(dates)
         else:
-            assert 0 <= percentile <= 100, \
-                'percentile must be between 0 and 100. Got {}'.format(percentile)
-            funct = self._get_percentile_function(percentile)
+            plan = self._grouping_plan(interval)
+            new_data, d_times = [], []
+            for i in dates:
+                try:
+                    vals = self._group_values(plan[i])
+                except KeyError:  # no values in the group
+                    continue
+                if len(vals) != 0:
+                    new_data.append(funct(vals))
+                    d_times.append(i)
+        if operation == 'percentile':
+            operation = '{} percentile'.format(percentile)
+        return self._interval_collection(interval, operation, new_data, d_times)
+
+    def _time_interval_percentiles(self, interval, percentiles):
+        """Get a collection of a certain time interval for each of several percentiles.
+
+        The values of each group of the time interval are sorted only once
+        and all of the percentiles are computed from the sorted values.
+        """
+        self._check_percentiles(percentiles)
+        plan = self._grouping_plan(interval)
+        columns, d_times = [[] for _ in percentiles], []
+        for i in self._interval_dates(interval):
+            try:
+                vals = self._group_values(plan[i])
+            except KeyError:  # no values in the group
+                continue
+            if len(vals) != 0:
+                for col, val in zip(columns, self._percentiles(vals, percentiles)):
+                    col.append(val)
+                d_times.append(i)
+        return [self._interval_collection(
+            interval, '{} percentile'.format(per), col, d_times)
+            for per, col in zip(percentiles, columns)]
 
-        # retrive the data that correctly describes the time interval
+    def _interval_dates(self, interval):
+        """Get the dates that correctly describe a time interval."""
         if interval == 'monthly':
-            data_dict = self.group_by_month()
-            dates = self.header.analysis_period.months_int
+            return self.header.analysis_period.months_int
         elif interval == 'daily':
-            data_dict = self.group_by_day()
-            dates = self.header.analysis_period.doys_int
+            return self.header.analysis_period.doys_int
         elif interval == 'monthlyperhour':
-            data_dict = self.group_by_month_per_hour()
-            dates = self.header.analysis_period.months_per_hour
-        else:
-            raise ValueError('Invalid input value for interval: {}'.format(interval))
-        # get the data and header for the new collection
-        new_data, d_times = [], []
-        for i in dates:
-            vals = data_dict[i]
-            if vals != []:
-                new_data.append(funct(vals))
-                d_times.append(i)
+            return self.header.analysis_period.months_per_hour
+        raise ValueError('Invalid input value for interval: {}'.format(interval))
+
+    def _interval_collection(self, interval, operation, new_data, d_times):
+        """Get a collection of a certain time interval from its values and dates."""
         new_header = self.header.duplicate()
-        if operation == 'percentile':
-            new_header.metadata['operation'] = '{} percentile'.format(percentile)
-        else:
-            new_header.metadata['operation'] = operation
+        new_header.metadata['operation'] = operation
 
         # build the final data collection
         if interval == 'monthly':
@@ -547,6 +742,76 @@ class HourlyDiscontinuousCollection(BaseCollection):
         collection._validated_a_period = True
         return collection
 
+    def _interval_function(self, operation, percentile=0):
+        """Get the function that aggregates the values of a group for an operation."""
+        if operation == 'average':
+            return self._average
+        elif operation == 'total':
+            return self._total
+        elif operation == 'percentile':
+            assert 0 <= percentile <= 100, \
+                'percentile must be between 0 and 100. Got {}'.format(percentile)
+            return self._get_percentile_function(percentile)
+        raise ValueError('Invalid input value for operation: {}'.format(operation))
+
+    def _grouping_plan(self, grouping):
+        """Get the indices of this collection's values in each group of a grouping.
+
+        Args:
+            grouping: Text for the 'daily', 'monthly' or 'monthlyperhour' interval
+                or a function that takes a DateTime and returns the key of
+                its group (or None to exclude it from all groups).
+
+        Returns:
+            An OrderedDict with the key of each group as keys and a slice or a
+            list of the indices of the values in each group as values.
+        """
+        key_function = grouping if callable(grouping) else _INTERVAL_KEYS.get(grouping)
+        if key_function is None:
+            raise ValueError('Invalid input value for grouping: {}'.format(grouping))
+        datetimes = self.datetimes
+        if isinstance(datetimes, DateTimeSequence) and grouping == 'daily':
+            group_keys = datetimes.doys  # no need to create the DateTimes
+        elif isinstance(datetimes, DateTimeSequence) and grouping == 'monthly':
+            group_keys = datetimes.months
+        else:
+            group_keys = map(key_function, datetimes)
+        groups, keys = {}, []
+        for i, key in enumerate(group_keys):
+            try:
+                groups[key].append(i)
+            except KeyError:
+                if key is not None:
+                    groups[key] = [i]
+                    keys.append(key)
+        return OrderedDict((key, groups[key]) for key in keys)
+
+    def _month_per_hour_keys(self):
+        """Get a list of all month per hour keys for the timestep of the collection."""
+        t_step = self.header.analysis_period.timestep
+        keys = []
+        for m in xrange(1, 13):
+            for h in xrange(0, 24 * t_step):
+                float_hr = h / t_step
+                keys.append((m, int(float_hr), int((h % t_step) * (60 / t_step))))
+        return keys
+
+    def _group_values(self, group):
+        """Get the values of a group in a grouping plan as a list (or tuple)."""
+        if isinstance(group, slice):
+            values = self._values[group]
+            return values.tolist() if isinstance(values, array) else values
+        values = self._values
+        return [values[i] for i in group]
+
+    def _numpy_interval_operation(self, interval, operation):
+        """Get the values of an average or total time interval operation with numpy.
+
+        Discontinuous collections are always grouped with pure Python and so
+        this method returns None.
+        """
+        return None
+
     def __repr__(self):
         """Hourly Discontinuous Collection representation."""
         return "{} Discontinuous Data Collection\n{}\n{} ({})\n...{} values...".format(
@@ -569,7 +834,9 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         * bounds
         * datetimes
         * header
+        * is_compact
         * is_continuous
+        * is_lazy
         * is_mutable
         * max
         * median
@@ -620,7 +887,11 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
 
     @property
     def datetimes(self):
-        """Return datetimes for this collection as a tuple."""
+        """Return datetimes for this collection as a DateTimeSequence.
+
+        The sequence can be used like a tuple of DateTimes but it stores the minutes
+        of the year and only creates the DateTimes when they are accessed.
+        """
         if self._datetimes is None:
             self._datetimes = self.header.analysis_period.datetimes
         return self._datetimes
@@ -683,6 +954,92 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         _new_header._analysis_period = _new_a_per
         return HourlyContinuousCollection(_new_header, _new_values)
 
+    def rolling_average(self, count, wrap_around=False):
+        """Get a collection of the average over a rolling window of values.
+
+        The value at each step is the average of the count values that end at
+        that step (eg. a 72-hour moving average uses a count of 72 * timestep).
+
+        Args:
+            count: An integer for the number of values in the window.
+            wrap_around: Boolean to note whether the windows at the start of the
+                collection should include values from the end of the collection,
+                which is useful for annual collections where the end of the year
+                precedes the start. If False, the windows at the start of the
+                collection only include the values that precede them. (Default: False).
+        """
+        totals = self._rolling_totals(count, wrap_around)
+        if wrap_around:
+            values = [tot / count for tot in totals]
+        else:
+            values = [tot / min(i + 1, count) for i, tot in enumerate(totals)]
+        return self._rolling_collection(values, '{} step rolling average'.format(count))
+
+    def rolling_total(self, count, wrap_around=False):
+        """Get a collection of the total over a rolling window of values.
+
+        Args:
+            count: An integer for the number of values in the window.
+            wrap_around: Boolean to note whether the windows at the start of the
+                collection should include values from the end of the collection.
+                See the rolling_average method for more information. (Default: False).
+        """
+        return self._rolling_collection(self._rolling_totals(count, wrap_around),
+                                        '{} step rolling total'.format(count))
+
+    def rolling_min(self, count, wrap_around=False):
+        """Get a collection of the minimum over a rolling window of values.
+
+        Args:
+            count: An integer for the number of values in the window.
+            wrap_around: Boolean to note whether the windows at the start of the
+                collection should include values from the end of the collection.
+                See the rolling_average method for more information. (Default: False).
+        """
+        return self._rolling_collection(self._rolling_extremes(count, wrap_around, False),
+                                        '{} step rolling min'.format(count))
+
+    def rolling_max(self, count, wrap_around=False):
+        """Get a collection of the maximum over a rolling window of values.
+
+        Args:
+            count: An integer for the number of values in the window.
+            wrap_around: Boolean to note whether the windows at the start of the
+                collection should include values from the end of the collection.
+                See the rolling_average method for more information. (Default: False).
+        """
+        return self._rolling_collection(self._rolling_extremes(count, wrap_around, True),
+                                        '{} step rolling max'.format(count))
+
+    def exponential_average(self, alpha, wrap_around=False):
+        """Get a collection of the exponentially weighted average of the values.
+
+        The average at each step is alpha * value + (1 - alpha) * previous average,
+        which is the form of running mean outdoor temperatures.
+
+        Args:
+            alpha: A number between 0 and 1 for the weight of each new value.
+                Higher numbers give more weight to recent values.
+            wrap_around: Boolean to note whether the average at the start of the
+                collection should follow the average at the end of the collection,
+                which is useful for annual collections where the end of the year
+                precedes the start. If False, the average starts from the first
+                value. (Default: False).
+        """
+        assert 0 < alpha <= 1, 'alpha must be greater than 0 and less than or ' \
+            'equal to 1. Got {}'.format(alpha)
+        values, beta = self._values, 1 - alpha
+        avg = values[0]
+        if wrap_around:  # warm up the average with one pass over the values
+            for val in values:
+                avg = alpha * val + beta * avg
+        new_values = []
+        for val in values:
+            avg = alpha * val + beta * avg
+            new_values.append(avg)
+        return self._rolling_collection(
+            new_values, '{} exponential average'.format(alpha))
+
     def filter_by_conditional_statement(self, statement):
         """Filter the Data Collection based on a conditional statement.
 
@@ -758,8 +1115,6 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         Return:
             A new Data Collection with filtered data
         """
-        existing_hoys = self.header.analysis_period.hoys
-        hoys = [h for h in hoys if h in existing_hoys]
         _moys = tuple(int(hour * 60) for hour in hoys)
         return self.filter_by_moys(_moys)
 
@@ -767,30 +1122,17 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         """Filter the Data Collection based on a list of minutes of the year.
 
         Args:
-           moys: A List of minutes of the year [0..8759 * 60]
+           moys: A List of minutes of the year [0..8759 * 60]. Minutes of the
+                year that are not in the collection are ignored.
 
         Return:
             A new Data Collection with filtered data
         """
-        t_s = 60 / self.header.analysis_period.timestep
-        st_ind = self.header.analysis_period.st_time.moy / t_s
-        if not self.header.analysis_period.is_reversed:
-            _filt_indices = [int(moy / t_s - st_ind) for moy in moys]
-        else:
-            if not self.header.analysis_period.is_leap_year:
-                eoy_ind = 8759 * self.header.analysis_period.timestep - st_ind
-            else:
-                eoy_ind = 8783 * self.header.analysis_period.timestep - st_ind
-            _filt_indices = []
-            for moy in moys:
-                ind = moy / t_s
-                if ind > st_ind:
-                    _filt_indices.append(int(ind - st_ind))
-                else:
-                    _filt_indices.append(int(ind + eoy_ind))
-
+        _filt_indices = self._moy_indices(moys)
         _filt_values = [self._values[i] for i in _filt_indices]
-        _filt_datetimes = [self.datetimes[i] for i in _filt_indices]
+        dt_moys = self.datetimes.moys
+        _filt_datetimes = DateTimeSequence(
+            [dt_moys[i] for i in _filt_indices], self.header.analysis_period.is_leap_year)
         _filt_header = self.header.duplicate()
         coll = HourlyDiscontinuousCollection(_filt_header, _filt_values, _filt_datetimes)
         coll._validated_a_period = True
@@ -804,60 +1146,302 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         hourly_data_by_day = OrderedDict()
         for d in xrange(1, 366):
             hourly_data_by_day[d] = []
+        for d, group in self._grouping_plan('daily').items():
+            hourly_data_by_day[d] = self._group_values(group)
+        return hourly_data_by_day
+
+    def group_by_month(self):
+        """Return a dictionary of this collection's values grouped by each month.
+
+        Key values are between 1-12.
+        """
+        hourly_data_by_month = OrderedDict()
+        for d in xrange(1, 13):
+            hourly_data_by_month[d] = []
+        for mon, group in self._grouping_plan('monthly').items():
+            hourly_data_by_month[mon] = self._group_values(group)
+        return hourly_data_by_month
+
+    def group_by_month_per_hour(self):
+        """Return a dictionary of this collection's values grouped by each month per hour.
+
+        Key values are tuples of 3 integers.
+
+        -   The first represents the month of the year between 1-12.
+
+        -   The second represents the hour of the day between 0-24.
+
+        -   The third represents the minute of the minute of the hour between 0-59.
+        """
+        data_by_month_per_hour = OrderedDict()
+        for key in self._month_per_hour_keys():
+            data_by_month_per_hour[key] = []
+        for key, group in self._grouping_plan('monthlyperhour').items():
+            data_by_month_per_hour[key] = self._group_values(group)
+        return data_by_month_per_hour
+
+    def _grouping_plan(self, grouping):
+        """Get the indices of this collection's values in each group of a grouping.
+
+        The plans of the 'daily', 'monthly' and 'monthlyperhour' intervals only
+        depend on the analysis period and so they are remembered such that
+        collections with the same analysis period are grouped without looping
+        over their datetimes. Plans of functions are always rebuilt since the
+        functions may depend on outside state. Groups of consecutive values
+        are slices.
+
+        Args:
+            grouping: Text for the 'daily', 'monthly' or 'monthlyperhour' interval
+                or a function that takes a DateTime and returns the key of
+                its group (or None to exclude it from all groups).
+
+        Returns:
+            An OrderedDict with the key of each group as keys and a slice or a
+            list of the indices of the values in each group as values.
+        """
+        if callable(grouping):
+            plan = HourlyDiscontinuousCollection._grouping_plan(self, grouping)
+            return _slice_plan(plan)
+        a_per = self.header.analysis_period
+        plan_key = (a_per, grouping, len(self._values))
+        try:
+            return OrderedDict(_GROUPING_PLANS[plan_key])
+        except KeyError:
+            pass
+        if grouping == 'daily':
+            plan = self._daily_plan()
+        elif grouping == 'monthly':
+            plan = self._monthly_plan()
+        elif grouping == 'monthlyperhour' and not a_per.is_reversed:
+            plan = self._monthly_per_hour_plan()
+        else:
+            plan = HourlyDiscontinuousCollection._grouping_plan(self, grouping)
+            plan = _slice_plan(plan)
+        if len(_GROUPING_PLANS) >= _GROUPING_PLANS_SIZE:
+            _GROUPING_PLANS.clear()
+        # store the plan as tuples such that it cannot be edited through a copy
+        _GROUPING_PLANS[plan_key] = tuple(
+            (key, group if isinstance(group, slice) else tuple(group))
+            for key, group in plan.items())
+        return plan
+
+    def _daily_plan(self):
+        """Get the grouping plan of the values by each day of year."""
+        plan = OrderedDict()
         a_per = self.header.analysis_period
         indx_per_day = 24 * a_per.timestep
         start_doy = sum(a_per._num_of_days_each_month[:a_per.st_time.month - 1]) \
             + a_per.st_time.day
         if not a_per.is_reversed:
             for i in range(0, len(self._values), indx_per_day):
-                hourly_data_by_day[start_doy] = self._values[i:i + indx_per_day]
+                plan[start_doy] = slice(i, i + indx_per_day)
                 start_doy += 1
         else:
             end_ind = 24 * a_per.timestep * (365 - start_doy)
             for i in range(0, end_ind + 1, indx_per_day):
-                hourly_data_by_day[start_doy] = self._values[i:i + indx_per_day]
+                plan[start_doy] = slice(i, i + indx_per_day)
                 start_doy += 1
             start_doy = 1
             for i in range(end_ind, len(self._values), indx_per_day):
-                hourly_data_by_day[start_doy] = self._values[i:i + indx_per_day]
+                plan[start_doy] = slice(i, i + indx_per_day)
                 start_doy += 1
-        return hourly_data_by_day
+        return plan
 
-    def group_by_month(self):
-        """Return a dictionary of this collection's values grouped by each month.
+    def _monthly_plan(self):
+        """Get the grouping plan of the values by each month.
 
-        Key values are between 1-12.
+        Note that each group includes the first value of the following month.
         """
-        hourly_data_by_month = OrderedDict()
-        for d in xrange(1, 13):
-            hourly_data_by_month[d] = []
-
+        plan = OrderedDict()
         a_per = self.header.analysis_period
         a_per_months = a_per.months_int
         indx = 24 * a_per.timestep * abs(
             a_per.st_day - 1 - a_per._num_of_days_each_month[a_per_months[0] - 1])
-        hourly_data_by_month[a_per_months[0]] = self._values[0:indx + 1]
+        plan[a_per_months[0]] = slice(0, indx + 1)
+        for mon in a_per_months[1:]:
+            interval = a_per._num_of_days_each_month[mon - 1] * 24 * a_per.timestep
+            plan[mon] = slice(indx, indx + interval + 1)
+            indx += interval
+        return plan
+
+    def _monthly_per_hour_plan(self):
+        """Get the grouping plan of the values by each month per hour.
+
+        The values of each hour of a month are every 24 * timestep values
+        within the month and so each group is a slice with a step.
+        """
+        plan = OrderedDict()
+        per_day = 24 * self.header.analysis_period.timestep
+        keys = self._month_per_hour_keys()
+        months = self.header.analysis_period.months_int
+        for mon, (st, end) in zip(months, self._month_bounds()):
+            if end <= st:
+                continue
+            st_key = (mon - 1) * per_day
+            for h in xrange(per_day):
+                plan[keys[st_key + h]] = slice(st + h, end, per_day)
+        return plan
+
+    def _moy_position(self, moy):
+        """Get the index of a minute of the year in this collection's values.
+
+        The index is computed from the analysis period without looking at the
+        datetimes. None is returned if the moy is not in the collection.
+        """
+        indices = self._moy_indices((moy,))
+        return indices[0] if indices else None
 
-        if len(a_per_months) > 1:
-            for mon in a_per_months[1:]:
-                interval = a_per._num_of_days_each_month[mon - 1] * 24 * a_per.timestep
-                try:
-                    hourly_data_by_month[mon] = self._values[indx:indx + interval + 1]
-                except IndexError:
-                    hourly_data_by_month[mon] = self._values[indx:]  # last items
-                indx += interval
-        return hourly_data_by_month
+    def _moy_indices(self, moys):
+        """Get the indices of several minutes of the year in this collection's values.
+
+        The indices are computed from the analysis period without looking at the
+        datetimes. Moys that are not in the collection are skipped.
+        """
+        a_per = self.header.analysis_period
+        mins_per_step, st_moy = 60 // a_per.timestep, a_per.st_time.moy
+        year_mins = (8784 if a_per.is_leap_year else 8760) * 60
+        count = len(self._values)
+        indices = []
+        for moy in moys:
+            offset = moy - st_moy
+            if offset < 0:  # the moy may be after the end of the year in the period
+                offset += year_mins
+            ind, rem = divmod(offset, mins_per_step)
+            if rem == 0 and ind < count:
+                indices.append(int(ind))
+        return indices
+
+    def _rolling_values(self, count, wrap_around):
+        """Get the values to be used in the rolling windows of this collection.
+
+        Returns:
+            A tuple with two items.
+
+            -   values: A list of values where the windows at the start of the
+                collection are preceded by the end of the collection if wrap_around
+                is True.
+
+            -   offset: An integer for the index of the first value of the collection.
+        """
+        assert isinstance(count, int) and 1 <= count <= len(self._values), 'count ' \
+            'must be an integer between 1 and {}. Got {}'.format(len(self._values), count)
+        values = self._values
+        if not wrap_around or count == 1:
+            return values, 0
+        return list(values[len(values) - count + 1:]) + list(values), count - 1
+
+    def _rolling_totals(self, count, wrap_around):
+        """Get a list of the totals of each rolling window with a running sum.
+
+        The running sum of floats is re-computed with math.fsum every count steps
+        such that rounding errors do not build up and windows without any
+        non-zero values always have a total of exactly zero.
+        """
+        values, offset = self._rolling_values(count, wrap_around)
+        totals, total, non_zero = [], 0, 0
+        for i, val in enumerate(values):
+            total += val
+            non_zero += val != 0
+            if i >= count:
+                total -= values[i - count]
+                non_zero -= values[i - count] != 0
+            if non_zero == 0:
+                total -= total  # an exact zero of the same type as the total
+            elif (i + 1) % count == 0 and isinstance(total, float):
+                total = math.fsum(values[i + 1 - count:i + 1])
+            if i >= offset:
+                totals.append(total)
+        return totals
+
+    def _rolling_extremes(self, count, wrap_around, highest):
+        """Get a list of the max or min of each rolling window with a monotonic deque.
+
+        The deque holds the indices of the values that can still be the extreme
+        of a window such that each value is added and removed only once.
+        """
+        values, offset = self._rolling_values(count, wrap_around)
+        beyond = ge if highest else le
+        window, extremes = deque(), []
+        for i, val in enumerate(values):
+            while window and beyond(val, values[window[-1]]):
+                window.pop()
+            window.append(i)
+            if window[0] <= i - count:
+                window.popleft()
+            if i >= offset:
+                extremes.append(values[window[0]])
+        return extremes
+
+    def _rolling_collection(self, values, operation):
+        """Get a collection aligned with this one from rolling operation values."""
+        new_header = self.header.duplicate()
+        new_header.metadata['operation'] = operation
+        return HourlyContinuousCollection(new_header, values)
+
+    def _month_bounds(self):
+        """Get a list with the start and end index of the values in each month."""
+        a_per = self.header.analysis_period
+        a_per_months = a_per.months_int
+        count = len(self._values)
+        indx = min(24 * a_per.timestep * abs(
+            a_per.st_day - 1 - a_per._num_of_days_each_month[a_per_months[0] - 1]),
+            count)
+        bounds = [(0, indx)]
+        for mon in a_per_months[1:]:
+            interval = a_per._num_of_days_each_month[mon - 1] * 24 * a_per.timestep
+            bounds.append((indx, min(indx + interval, count)))
+            indx += interval
+        return bounds
+
+    def _numpy_interval_operation(self, interval, operation):
+        """Get the values of an average or total time interval operation with numpy.
+
+        The values are grouped and summed with vectorized numpy operations
+        that match the grouping of group_by_day, group_by_month and
+        group_by_month_per_hour.
+
+        Returns:
+            A list of values for the operation. None if numpy is not available,
+            the analysis period of the collection does not span whole days or
+            the values are not compact, in which case the operation should be
+            performed with pure Python.
+        """
+        a_per = self.header.analysis_period
+        if a_per.st_hour != 0 or a_per.end_hour != 23 or a_per.is_reversed:
+            return None
+        vals = _numpy_array(self._values, compact_only=True)
+        if vals is None:
+            return None
+        per_day = 24 * a_per.timestep
+        if interval == 'daily':
+            totals = vals.reshape(-1, per_day).sum(axis=1).tolist()
+            counts = [per_day] * len(totals)
+        elif interval == 'monthly':  # groups include the first value of next month
+            bounds = [(st, min(end + 1, len(vals))) for st, end in self._month_bounds()]
+            totals = [vals[st:end].sum().item() for st, end in bounds]
+            counts = [end - st for st, end in bounds]
+        else:
+            totals, counts = [], []
+            for st, end in self._month_bounds():
+                totals.extend(vals[st:end].reshape(-1, per_day).sum(axis=0).tolist())
+                counts.extend([(end - st) // per_day] * per_day)
+        if operation == 'total':
+            return totals
+        return [total / count for total, count in zip(totals, counts)]
 
     def to_immutable(self):
         """Get an immutable version of this collection."""
         if self._enumeration is None:
             self._get_mutable_enumeration()
         col_obj = self._enumeration['immutable'][self._collection_type]
-        return col_obj(self.header, self.values)
+        return col_obj(self.header, self._share_values())
 
     def duplicate(self):
-        """Return a copy of the current Data Collection."""
-        return self.__class__(self.header.duplicate(), list(self._values))
+        """Return a copy of the current Data Collection.
+
+        The copy shares the values of this collection until one of them is edited.
+        """
+        return self.__class__(self.header.duplicate(), self._share_values())
 
     def get_aligned_collection(self, value=0, data_type=None, unit=None, mutable=None):
         """Return a Collection aligned with this one composed of one repeated value.
@@ -921,8 +1505,8 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
 
     def to_discontinuous(self):
         """Return a discontinuous version of the current collection."""
-        collection = HourlyDiscontinuousCollection(self.header.duplicate(),
-                                                   self.values, self.datetimes)
+        collection = HourlyDiscontinuousCollection(
+            self.header.duplicate(), self._share_values(), self.datetimes)
         collection._validated_a_period = True
         return collection
 
@@ -937,7 +1521,7 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         """Convert Data Collection to a dictionary."""
         return {
             'header': self.header.to_dict(),
-            'values': self._values,
+            'values': self._dict_values(),
             'type': self.__class__.__name__
         }
 
@@ -1003,7 +1587,7 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         return self.__class__(self.header, new_vals)
 
     def __neg__(self):
-        new_vals = [-v_1 for v_1 in self._values]
+        new_vals = self._neg_values()
         return self.__class__(self.header, new_vals)
 
     def __key(self):
@@ -1032,7 +1616,9 @@ class DailyCollection(BaseCollection):
         * bounds
         * datetimes
         * header
+        * is_compact
         * is_continuous
+        * is_lazy
         * is_mutable
         * max
         * median
@@ -1119,6 +1705,37 @@ class DailyCollection(BaseCollection):
         """
         return self._monthly_operation('percentile', percentile)
 
+    def percentiles_monthly(self, percentiles):
+        """Return a list of monthly collections with values at each input percentile.
+
+        This is faster than calling percentile_monthly for each percentile since
+        the values of each month are grouped and sorted only once.
+
+        Args:
+            percentiles: A list of float values from 0 to 100 representing the
+                requested percentiles (eg. [5, 25, 50, 75, 95]).
+
+        Returns:
+            A list of monthly collections with one collection for each percentile.
+        """
+        self._check_percentiles(percentiles)
+        data_dict = self.group_by_month()
+        columns, d_times = [[] for _ in percentiles], []
+        for i in self.header.analysis_period.months_int:
+            vals = data_dict[i]
+            if vals != []:
+                for col, val in zip(columns, self._percentiles(vals, percentiles)):
+                    col.append(val)
+                d_times.append(i)
+        collections = []
+        for per, col in zip(percentiles, columns):
+            new_header = self.header.duplicate()
+            new_header.metadata['operation'] = '{} percentile'.format(per)
+            collection = MonthlyCollection(new_header, col, d_times)
+            collection._validated_a_period = True
+            collections.append(collection)
+        return collections
+
     def to_time_aggregated(self):
         """Get a collection where data has been aggregated over the collection timestep.
 
@@ -1270,7 +1887,9 @@ class MonthlyCollection(BaseCollection):
         * bounds
         * datetimes
         * header
+        * is_compact
         * is_continuous
+        * is_lazy
         * is_mutable
         * max
         * median
@@ -1412,7 +2031,9 @@ class MonthlyPerHourCollection(BaseCollection):
         * bounds
         * datetimes
         * header
+        * is_compact
         * is_continuous
+        * is_lazy
         * is_mutable
         * max
         * median
@@ -1554,3 +2175,18 @@ class MonthlyPerHourCollection(BaseCollection):
                 self.header.analysis_period.end_month,
                 self.header.analysis_period.end_hour,
                 self.header.data_type, self.header.unit, len(self._values))
+
+
+def _datetime_moys(datetimes):
+    """Get the minutes of the year of a list of DateTimes or a DateTimeSequence."""
+    if isinstance(datetimes, DateTimeSequence):
+        return datetimes.moys
+    return [date_t.moy for date_t in datetimes]
+
+
+def _slice_plan(plan):
+    """Replace the groups of consecutive indices in a grouping plan with slices."""
+    for key, indices in plan.items():
+        if indices[-1] - indices[0] == len(indices) - 1:
+            plan[key] = slice(indices[0], indices[-1] + 1)
+    return plan
@@ -19,6 +19,7 @@ get a mutable version of an immutable collection.
 """
 from __future__ import division
 
+from ._datacollectionbase import _SharedValues
 from .datacollection import HourlyDiscontinuousCollection, HourlyContinuousCollection, \
     DailyCollection, MonthlyCollection, MonthlyPerHourCollection
 
@@ -30,12 +31,18 @@ class _ImmutableCollectionBase(object):
     @property
     def values(self):
         """The Data Collection's list of numerical values."""
-        return self._values
+        vals = self._values
+        if not isinstance(vals, tuple):  # values shared with a mutable collection
+            vals = self._values = tuple(vals)
+        return vals
 
     @values.setter
     def values(self, values):
         if hasattr(self, '_values'):
             raise AttributeError(self._mutable_message)
+        if isinstance(values, _SharedValues):  # never edited so they need no copy
+            self._values = values.values
+            return
         self._check_values(values)
         self._values = tuple(values)
 
@@ -51,10 +58,14 @@ class _ImmutableCollectionBase(object):
     def duplicate(self):
         """Get a copy of this Data Collection."""
         collection = self.__class__(
-            self.header.duplicate(), self._values, self.datetimes)
+            self.header.duplicate(), self._share_values(), self.datetimes)
         collection._validated_a_period = self._validated_a_period
         return collection
 
+    def convert_to_compact(self):
+        """This method is not available for immutable collections."""
+        raise AttributeError(self._mutable_message)
+
     def __setitem__(self, key, value):
         raise AttributeError(self._mutable_message)
 
@@ -69,7 +80,8 @@ class HourlyDiscontinuousCollectionImmutable(
 
     def to_mutable(self):
         """Get a mutable version of this collection."""
-        new_obj = HourlyDiscontinuousCollection(self.header, self.values, self.datetimes)
+        new_obj = HourlyDiscontinuousCollection(
+            self.header, self._share_values(), self.datetimes)
         new_obj._validated_a_period = self._validated_a_period
         return new_obj
 
@@ -84,13 +96,13 @@ class HourlyContinuousCollectionImmutable(
 
     def to_mutable(self):
         """Get a mutable version of this collection."""
-        new_obj = HourlyContinuousCollection(self.header, self.values)
+        new_obj = HourlyContinuousCollection(self.header, self._share_values())
         new_obj._validated_a_period = self._validated_a_period
         return new_obj
 
     def duplicate(self):
         """Return a copy of the current Data Collection."""
-        return self.__class__(self.header.duplicate(), self._values)
+        return self.__class__(self.header.duplicate(), self._share_values())
 
 
 class DailyCollectionImmutable(
@@ -99,7 +111,7 @@ class DailyCollectionImmutable(
 
     def to_mutable(self):
         """Get a mutable version of this collection."""
-        new_obj = DailyCollection(self.header, self.values, self.datetimes)
+        new_obj = DailyCollection(self.header, self._share_values(), self.datetimes)
         new_obj._validated_a_period = self._validated_a_period
         return new_obj
 
@@ -110,7 +122,7 @@ class MonthlyCollectionImmutable(
 
     def to_mutable(self):
         """Get a mutable version of this collection."""
-        new_obj = MonthlyCollection(self.header, self.values, self.datetimes)
+        new_obj = MonthlyCollection(self.header, self._share_values(), self.datetimes)
         new_obj._validated_a_period = self._validated_a_period
         return new_obj
 
@@ -121,6 +133,7 @@ class MonthlyPerHourCollectionImmutable(
 
     def to_mutable(self):
         """Get a mutable version of this collection."""
-        new_obj = MonthlyPerHourCollection(self.header, self.values, self.datetimes)
+        new_obj = MonthlyPerHourCollection(
+            self.header, self._share_values(), self.datetimes)
         new_obj._validated_a_period = self._validated_a_period
         return new_obj
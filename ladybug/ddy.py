@@ -3,12 +3,11 @@ from __future__ import division
 
 from .location import Location
 from .designday import DesignDay
-from .futil import write_to_file
+from .futil import write_to_file, file_exists, open_file
 
 import os
 import re
 import platform
-import codecs
 
 
 class DDY(object):
@@ -61,20 +60,23 @@ class DDY(object):
 
         Args:
             file_path: A string representing a complete path to the .ddy file.
+                This can also be a gzip compressed .ddy.gz file or a .ddy file
+                inside a zip archive, in which case the zip file is written as a
+                folder in the path (eg. c:/ladybug/USA_CO_Denver.zip/USA_CO_Denver.ddy).
         """
         # check that the file is there
-        if not os.path.isfile(file_path):
+        if not file_exists(file_path):
             raise ValueError(
                 'Cannot find a .ddy file at {}'.format(file_path))
-        if not file_path.lower().endswith('.ddy'):
+        if not file_path.lower().endswith(('.ddy', '.ddy.gz')):
             raise ValueError(
                 'DDY file does not have a .ddy extension.')
 
         # check the python version and open the file
         if platform.python_implementation() == 'IronPython':
-            ddywin = codecs.open(file_path, 'r')
+            ddywin = open_file(file_path)
         else:
-            ddywin = codecs.open(file_path, 'r', encoding='utf-8', errors='ignore')
+            ddywin = open_file(file_path, encoding='utf-8', errors='ignore')
 
         # extract all location and design day definitions from the file
         loc_p = re.compile(r"(Site:Location,(.|\n)*?((;\s*!)|(;\s*\n)|(;\n)))")
@@ -3,6 +3,11 @@
 from __future__ import division
 
 from datetime import datetime, date, time
+from array import array
+try:
+    from collections.abc import Sequence  # python 3
+except ImportError:
+    from collections import Sequence  # python 2 and IronPython
 
 MONTHNAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep',
               'Oct', 'Nov', 'Dec')
@@ -575,3 +580,204 @@ class Time(time):
     def __repr__(self):
         """Return time as a string."""
         return self.__str__()
+
+
+class DateTimeSequence(Sequence):
+    """A compact, immutable sequence of Ladybug DateTimes.
+
+    The sequence stores an integer array of minutes of the year and it only
+    creates the DateTime objects when they are requested. Indexing creates only
+    the requested DateTime while iterating creates all of the DateTimes the first
+    time, after which they are kept for all following uses. Operations that only
+    need the moys, hoys, doys or months never create the DateTimes. It can be
+    used anywhere that a tuple of DateTimes is accepted and it is equal to a
+    tuple of the same DateTimes.
+
+    Args:
+        moys: A list of integers for the minutes of the year of each DateTime.
+        leap_year: A boolean to indicate if the DateTimes are for a leap year
+            (Default: False).
+
+    Properties:
+        * leap_year
+        * moys
+        * hoys
+        * doys
+        * months
+    """
+
+    __slots__ = ('_moys', '_leap_year', '_datetimes')
+
+    def __init__(self, moys, leap_year=False):
+        """Create Ladybug DateTimeSequence.
+        """
+        self._moys = moys[:] if isinstance(moys, array) and moys.typecode == 'l' \
+            else array('l', moys)
+        self._leap_year = bool(leap_year)
+        self._datetimes = None  # tuple of DateTimes created upon request
+        if self._moys and (min(self._moys) < 0 or
+                           max(self._moys) >= _minutes_of_year(self._leap_year)):
+            raise ValueError('moys must be positive and smaller than {}. Got {} to {}'
+                             .format(_minutes_of_year(self._leap_year),
+                                     min(self._moys), max(self._moys)))
+
+    @classmethod
+    def from_datetimes(cls, datetimes):
+        """Create a DateTimeSequence from a list of Ladybug DateTimes.
+
+        Args:
+            datetimes: A list of Ladybug DateTimes, which should all be for the same
+                year (either all leap year or all not leap year).
+        """
+        if isinstance(datetimes, DateTimeSequence):
+            return datetimes
+        leap_year = datetimes[0].leap_year if len(datetimes) != 0 else False
+        assert all(dt.leap_year == leap_year for dt in datetimes), \
+            'DateTimeSequence cannot mix leap year and non-leap year DateTimes.'
+        return cls([dt.moy for dt in datetimes], leap_year)
+
+    @property
+    def leap_year(self):
+        """Boolean to note whether the DateTimes belong to a leap year or not."""
+        return self._leap_year
+
+    @property
+    def moys(self):
+        """An array of integers for the minute of the year of each DateTime."""
+        return self._moys[:]
+
+    @property
+    def hoys(self):
+        """An array of floats for the hour of the year of each DateTime."""
+        return array('d', (moy / 60.0 for moy in self._moys))
+
+    @property
+    def doys(self):
+        """An array of integers for the day of the year of each DateTime."""
+        return array('l', (moy // 1440 + 1 for moy in self._moys))
+
+    @property
+    def months(self):
+        """An array of integers for the month of each DateTime."""
+        doy_months = _DOY_MONTHS[self._leap_year]
+        return array('l', (doy_months[moy // 1440] for moy in self._moys))
+
+    def _datetime(self, moy):
+        """Create a DateTime from a minute of the year in this sequence."""
+        doy, mod = divmod(moy, 1440)
+        return datetime.__new__(
+            DateTime, 2016 if self._leap_year else 2017,
+            _DOY_MONTHS[self._leap_year][doy], _DOY_DAYS[self._leap_year][doy],
+            mod // 60, mod % 60)
+
+    def _materialize(self):
+        """Get a tuple of all DateTimes in the sequence, creating it only once."""
+        if self._datetimes is None:
+            year = 2016 if self._leap_year else 2017
+            doy_months = _DOY_MONTHS[self._leap_year]
+            doy_days = _DOY_DAYS[self._leap_year]
+            new = datetime.__new__
+            self._datetimes = tuple(
+                new(DateTime, year, doy_months[moy // 1440], doy_days[moy // 1440],
+                    moy % 1440 // 60, moy % 60) for moy in self._moys)
+        return self._datetimes
+
+    def _moy(self, date_t):
+        """Get the minute of the year of a DateTime or None if it cannot be here."""
+        if isinstance(date_t, DateTime) and date_t.leap_year == self._leap_year \
+                and date_t.second == 0 and date_t.microsecond == 0:
+            return date_t.moy
+
+    def index(self, value, *args):
+        """Get the index of a DateTime in the sequence."""
+        moy = self._moy(value)
+        if moy is None:
+            raise ValueError('{} is not in DateTimeSequence'.format(value))
+        try:
+            return self._moys.index(moy, *args)
+        except ValueError:
+            raise ValueError('{} is not in DateTimeSequence'.format(value))
+
+    def count(self, value):
+        """Get the number of times that a DateTime occurs in the sequence."""
+        moy = self._moy(value)
+        return 0 if moy is None else self._moys.count(moy)
+
+    def __len__(self):
+        return len(self._moys)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            new_seq = DateTimeSequence(self._moys[key], self._leap_year)
+            if self._datetimes is not None:
+                new_seq._datetimes = self._datetimes[key]
+            return new_seq
+        if self._datetimes is not None:
+            return self._datetimes[key]
+        return self._datetime(self._moys[key])  # only create the requested DateTime
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __reversed__(self):
+        return reversed(self._materialize())
+
+    def __contains__(self, value):
+        moy = self._moy(value)
+        return moy is not None and moy in self._moys
+
+    def __add__(self, other):
+        if isinstance(other, DateTimeSequence) and other._leap_year == self._leap_year:
+            return DateTimeSequence(self._moys + other._moys, self._leap_year)
+        return self._materialize() + tuple(other)
+
+    def __radd__(self, other):
+        return tuple(other) + self._materialize()
+
+    def __reduce__(self):
+        return (type(self), (self._moys, self._leap_year))
+
+    def __hash__(self):
+        return hash(self._materialize())
+
+    def __eq__(self, other):
+        if isinstance(other, DateTimeSequence):
+            return self._leap_year == other._leap_year and self._moys == other._moys
+        elif isinstance(other, tuple):
+            return self._materialize() == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Return the DateTimeSequence as a string."""
+        if len(self._moys) == 0:
+            return 'DateTimeSequence: ()'
+        return 'DateTimeSequence: {} to {} ({} datetimes)'.format(
+            self._datetime(self._moys[0]), self._datetime(self._moys[-1]),
+            len(self._moys))
+
+
+def _minutes_of_year(leap_year):
+    """Get the number of minutes in a year."""
+    return 527040 if leap_year else 525600
+
+
+def _doy_lookups(leap_year):
+    """Get tuples of the month and the day of the month for each day of the year."""
+    days_per_month = (31, 29 if leap_year else 28, 31, 30, 31, 30,
+                      31, 31, 30, 31, 30, 31)
+    months, days = [], []
+    for month, month_days in enumerate(days_per_month):
+        months.extend([month + 1] * month_days)
+        days.extend(range(1, month_days + 1))
+    return tuple(months), tuple(days)
+
+
+_DOY_MONTHS, _DOY_DAYS = zip(_doy_lookups(False), _doy_lookups(True))
@@ -2,35 +2,64 @@
 from __future__ import division
 
 import os
+import math
+import heapq
+try:
+    import multiprocessing
+except ImportError:  # IronPython without the multiprocessing module
+    multiprocessing = None
+try:
+    import mmap
+except ImportError:  # IronPython without the mmap module
+    mmap = None
 
-from .dt import Date
+from .dt import Date, DateTimeSequence
 from .analysisperiod import AnalysisPeriod
-from .datacollection import HourlyContinuousCollection
+from .datacollection import HourlyContinuousCollection, HourlyDiscontinuousCollection
 from .datacollection import MonthlyCollection
 from .datatype import angle, distance, energyflux, energyintensity, generic, \
     illuminance, luminance, fraction, pressure, speed, temperature
 from .designday import DesignDay
 from .ddy import DDY
-from .futil import write_to_file
+from .epwcache import file_hash, cache_file_path, read_cache, write_cache
+from .futil import write_to_file, preparedir, file_exists, open_file, \
+    collect_file_paths
 from .header import Header
 from .location import Location
 from .climatezone import ashrae_climate_zone
 from .skymodel import calc_sky_temperature
 from .psychrometrics import rel_humid_from_db_dpt, wet_bulb_from_db_rh
 
-readmode = 'rb'
+writemode = 'wb'
 try:
     from itertools import izip as zip  # python 2
 except ImportError:
     xrange = range  # python 3
-    readmode = 'r'
+    writemode = 'w'
 
 
 class EPW(object):
     """An EPW object containing all of the data of an .epw file.
 
     Args:
-        file_path: Local file address to an .epw file.
+        file_path: Local file address to an .epw file. This can also be a gzip
+            compressed .epw.gz file or an .epw file inside a zip archive, in which
+            case the zip file is written as a folder in the path (eg.
+            c:/ladybug/USA_CO_Denver.zip/USA_CO_Denver.epw).
+        lazy_load: Boolean to note whether the hourly data of the file should be
+            loaded lazily. When True, the body of the file is kept as text once
+            it is read and each field is only parsed into a data collection when
+            it is first requested (eg. through the dry_bulb_temperature property).
+            This greatly reduces load time and memory for cases where only a few
+            fields of the EPW are used. Note that the text of the body is released
+            once all of the fields have been parsed. (Default: False).
+        use_cache: Boolean to note whether the parsed data of the file should be
+            cached in a compact binary file, which is keyed by the hash of the
+            file contents. If True and a valid cache already exists, the data
+            will be loaded from the cache instead of parsing the text of the file.
+            The cache is written to the folders.epw_cache_folder in the ladybug
+            config or, if this is not set, next to the EPW file. See the epwcache
+            module for evicting old cache files. (Default: False).
 
     Properties:
         * location
@@ -81,21 +110,28 @@ class EPW(object):
         * sky_temperature
     """
     __slots__ = ('_file_path', '_is_header_loaded', '_is_data_loaded', '_is_ip',
-                 '_data', '_metadata', '_location',
+                 '_lazy_load', '_use_cache', '_body_lines', '_line_offsets', '_data',
+                 '_derived', '_metadata',
+                 '_location',
                  '_heating_dict', '_cooling_dict', '_extremes_dict',
                  '_extreme_hot_weeks', '_extreme_cold_weeks', '_typical_weeks',
                  '_monthly_ground_temps', '_is_leap_year', 'daylight_savings_start',
                  'daylight_savings_end', '_num_of_fields', 'comments_1', 'comments_2')
 
-    def __init__(self, file_path):
+    def __init__(self, file_path, lazy_load=False, use_cache=False):
         """Initialize an EPW object from from a local .epw file.
         """
         self._file_path = os.path.normpath(file_path) if file_path is not None else None
         self._is_header_loaded = False
         self._is_data_loaded = False
         self._is_ip = False  # track if collections have been converted to IP
+        self._lazy_load = bool(lazy_load)
+        self._use_cache = bool(use_cache)
 
         # placeholders for the EPW data that will be imported
+        self._body_lines = None  # text of the body lines that are not yet parsed
+        self._line_offsets = None  # byte offsets of the body lines in the file
+        self._derived = {}  # memoized data collections derived from the fields
         self._data = []
         self._metadata = {}
         self._heating_dict = {}
@@ -316,6 +352,63 @@ class EPW(object):
 
         return epw_obj
 
+    @staticmethod
+    def load_many(paths, fields=None, workers=1):
+        """Load the location, metadata and select data of many EPW files at once.
+
+        Files are parsed in parallel using a pool of processes. Each process
+        only returns the requested fields of each file such that the amount of
+        data transferred between processes is kept small.
+
+        Args:
+            paths: A list of paths to .epw files. This can also be the path to
+                a folder (eg. folders.default_epw_folder), in which case all
+                of the .epw and .epw.gz files within the folder and its sub-folders
+                are loaded.
+            fields: An optional list of the EPW fields to be loaded for each file.
+                Each item can be either an integer for the field number (see the
+                import_data_by_field method) or the name of an EPW data property
+                (eg. 'dry_bulb_temperature' or 'sky_temperature'). If None, only
+                the location and the metadata of the files are loaded. (Default: None).
+            workers: An integer for the number of processes used to load the
+                files. If 1, the files are loaded in serial within the current
+                process. If None, the number of CPUs of the machine is
+                used. (Default: 1).
+
+        Returns:
+            A list of dictionaries with one dictionary per EPW file in the order of
+            the input paths. Each dictionary has the following keys.
+
+            -   file_path - The path to the EPW file.
+
+            -   location - A Ladybug Location object for the EPW.
+
+            -   metadata - A dictionary with the metadata of the EPW.
+
+            -   data - A dictionary with one item per requested field where
+                the keys are the items of the input fields and the values are
+                annual data collections.
+        """
+        epw_paths = collect_file_paths(paths, ('.epw', '.epw.gz'))
+        fields = tuple(fields) if fields is not None else ()
+        for field in fields:
+            assert isinstance(field, int) or \
+                isinstance(getattr(EPW, str(field), None), property), 'EPW fields ' \
+                'must be field numbers or names of EPW properties. Got {}.'.format(field)
+
+        # load the files in serial or in parallel
+        args = [(path, fields) for path in epw_paths]
+        if workers == 1 or len(args) <= 1 or multiprocessing is None:
+            return [_load_epw_fields(arg) for arg in args]
+        workers = workers or multiprocessing.cpu_count()
+        pool = multiprocessing.Pool(min(workers, len(args)))
+        try:
+            chunk = max(1, len(args) // (workers * 4))
+            return pool.map(_load_epw_fields, args, chunk)
+        finally:
+            pool.close()
+            pool.join()
+
     def _import_data(self, import_header_only=False):
         """Import data from an epw file.
 
@@ -323,32 +416,58 @@ class EPW(object):
         will be saved in the properties above.
         """
         # perform checks on the file before opening it.
-        assert os.path.isfile(self._file_path), 'Cannot find an epw file at {}'.format(
+        assert file_exists(self._file_path), 'Cannot find an epw file at {}'.format(
             self._file_path)
-        assert self._file_path.lower().endswith('epw'), '{} is not an .epw file. \n' \
-            'It does not possess the .epw file extension.'.format(self._file_path)
+        assert self._file_path.lower().endswith(('epw', 'epw.gz')), '{} is not an ' \
+            '.epw file. \nIt does not possess the .epw file extension.'.format(
+                self._file_path)
+
+        # if a cache of the parsed file exists, import the data from it
+        use_cache = self._use_cache and os.path.isfile(self._file_path)
+        if use_cache and not import_header_only:
+            f_hash = file_hash(self._file_path)
+            cache_file = cache_file_path(self._file_path, f_hash)
+            if self._import_cache(cache_file, f_hash):
+                return
 
-        with open(self._file_path, readmode) as epwin:
+        with open_file(self._file_path) as epwin:
             # import the header data to the object
-            line = epwin.readline()
-            original_header_load = bool(self._is_header_loaded)
+            header_lines = [epwin.readline() for i in xrange(8)]
             if not self._is_header_loaded:
-                self._import_location(line)
-                header_lines = [line] + [epwin.readline() for i in xrange(7)]
+                self._import_location(header_lines[0])
                 self._import_header(header_lines)
             if import_header_only:
                 return
 
             # import the body of the data to the object
-            if original_header_load:
-                for _ in xrange(7):
-                    epwin.readline()
-            body_lines = []
-            while line:
-                line = epwin.readline()
-                body_lines.append(line)
-            del body_lines[-1]  # last line is a blank space
-            self._import_body(body_lines)
+            self._import_body(epwin.readlines())
+
+        # write the parsed data to the cache such that it can be used next time
+        if use_cache:
+            self._import_all_fields()
+            columns = [coll._values for coll in self._data]
+            write_cache(cache_file, f_hash, header_lines, columns)
+
+    def _import_cache(self, cache_file, f_hash):
+        """Import the header and data collections of this EPW from a cache file.
+
+        Returns:
+            True if the data was imported from the cache. False if there is
+            no valid cache for the EPW file.
+        """
+        cached = read_cache(cache_file, f_hash)
+        if cached is None:
+            return False
+        header_lines, columns = cached
+        if not self._is_header_loaded:
+            self._import_location(header_lines[0])
+            self._import_header(header_lines)
+        self._num_of_fields = len(columns)
+        analysis_period = AnalysisPeriod(is_leap_year=self._is_leap_year)
+        self._data = [self._field_collection(i, values, analysis_period)
+                      for i, values in enumerate(columns)]
+        self._is_data_loaded = True
+        return True
 
     def _import_location(self, line):
         """Set the EPW location from the first line of the EPW.
@@ -450,43 +569,67 @@ class EPW(object):
         self._num_of_fields = min(len(body_lines[0].strip().split(',')), 35)
         analysis_period = AnalysisPeriod(is_leap_year=self.is_leap_year)
 
-        # create headers and an empty list for each field in epw file
-        headers = []
-        for field_number in xrange(self._num_of_fields):
-            field = EPWFields.field_by_number(field_number)
-            header = Header(data_type=field.name, unit=field.unit,
-                            analysis_period=analysis_period,
-                            metadata=dict(self._metadata))
-            headers.append(header)
-            self._data.append([])
-
-        # parse the hourly data
-        for line in body_lines:
-            data = line.strip().split(',')
-            for field_number in xrange(self._num_of_fields):
-                value_type = EPWFields.field_by_number(field_number).value_type
-                try:
-                    value = value_type(data[field_number])
-                except ValueError as e:
-                    # failed to convert the value for the specific TypeError
-                    if value_type != int:
-                        raise ValueError(e)
-                    value = int(round(float(data[field_number])))
-                self._data[field_number].append(value)
+        # if the data is lazily loaded, keep the text until each field is requested
+        if self._lazy_load:
+            self._body_lines = body_lines
+            self._data = [None] * self._num_of_fields
+            self._is_data_loaded = True
+            return
 
-        # if the first value is at 1 AM, move last item to start position
-        for field_number in xrange(self._num_of_fields):
-            point_in_time = headers[field_number].data_type.point_in_time
-            if point_in_time:
-                # move the last hour to first position
-                last_hour = self._data[field_number].pop()
-                self._data[field_number].insert(0, last_hour)
+        # split each line only once and transpose the rows into columns of text
+        columns = list(zip(*[line.strip().split(',') for line in body_lines]))
 
-        # finally, build the data collection objects from the headers and data
-        for i in xrange(self._num_of_fields):
-            self._data[i] = HourlyContinuousCollection(headers[i], self._data[i])
+        # convert each column in bulk and build the data collection objects
+        for field_number in xrange(self._num_of_fields):
+            self._data.append(self._field_collection_from_column(
+                field_number, columns[field_number], analysis_period))
         self._is_data_loaded = True
 
+    def _field_collection_from_column(self, field_number, column, analysis_period):
+        """Get a data collection for an EPW field from its column of text values.
+
+        Args:
+            field_number: An integer between 0 to 34 for the EPW field of the column.
+            column: A list of text values for the field with one value per line
+                of the EPW body (in the order they appear in the file).
+            analysis_period: The annual AnalysisPeriod to be used for the header.
+        """
+        values = EPWFields.convert_column(field_number, column)
+        # if the first value is at 1 AM, move last item to start position
+        if EPWFields.field_by_number(field_number).name.point_in_time:
+            values.insert(0, values.pop())
+        return self._field_collection(field_number, values, analysis_period)
+
+    def _field_collection(self, field_number, values, analysis_period):
+        """Get a data collection for an EPW field from a list of parsed values."""
+        field = EPWFields.field_by_number(field_number)
+        header = Header(data_type=field.name, unit=field.unit,
+                        analysis_period=analysis_period,
+                        metadata=dict(self._metadata))
+        return HourlyContinuousCollection(header, values)
+
+    def _import_field(self, field_number):
+        """Parse a data collection for a single field from the unparsed body lines."""
+        column = [line.strip().split(',', field_number + 1)[field_number]
+                  for line in self._body_lines]
+        analysis_period = AnalysisPeriod(is_leap_year=self._is_leap_year)
+        coll = self._field_collection_from_column(field_number, column, analysis_period)
+        if self._is_ip:  # the other collections of the EPW are in IP
+            coll.convert_to_ip()
+        self._data[field_number] = coll
+        if all(dat is not None for dat in self._data):
+            self._body_lines = None  # all fields are parsed; release the text
+        return coll
+
+    def _import_all_fields(self):
+        """Ensure that all fields are loaded as data collections, including lazy ones."""
+        if not self.is_data_loaded:
+            self._import_data()
+        if self._body_lines is not None:
+            for field_number, coll in enumerate(self._data):
+                if coll is None:
+                    self._import_field(field_number)
+
     @property
     def file_path(self):
         """Get path to epw file."""
@@ -502,6 +645,12 @@ class EPW(object):
         """Return True if weather data is loaded."""
         return self._is_data_loaded
 
+    @property
+    def lazy_load(self):
+        """Boolean for whether the fields of the EPW data are parsed only upon request.
+        """
+        return self._lazy_load
+
     @property
     def is_ip(self):
         """Returns True if the data collections of this file are in IP units."""
@@ -536,7 +685,9 @@ class EPW(object):
             'must be a dictionary. Got {}.'.format(type(meta_d))
         self._metadata = meta_d
         for coll in self._data:
-            coll.header._metadata = meta_d
+            if coll is not None:  # lazily loaded fields will get the new metadata
+                coll.header._metadata = meta_d
+        self._derived = {}
 
     @property
     def annual_heating_design_day_996(self):
@@ -804,7 +955,10 @@ class EPW(object):
         if not 0 <= field_number < self._num_of_fields:
             raise ValueError("Field number should be between 0-%d" % self._num_of_fields)
 
-        return self._data[field_number]
+        coll = self._data[field_number]
+        if coll is None:  # lazily loaded field that has not been parsed yet
+            coll = self._import_field(field_number)
+        return coll
 
     def import_data_by_field(self, field_number):
         """Return an annual data collection for any field_number in epw file.
@@ -857,6 +1011,140 @@ class EPW(object):
         """
         return self._get_data_by_field(field_number)
 
+    def import_data_by_analysis_period(self, field_number, analysis_period):
+        """Get a data collection for any EPW field over an analysis period.
+
+        The result is the same as import_data_by_field(field_number) filtered by
+        the analysis_period. However, if the data of the field has not yet been
+        loaded, only the lines of the EPW file within the analysis period are
+        read and parsed. The file is memory-mapped and the lines are found using
+        an index of their byte offsets, which is built the first time this method
+        is called and re-used for all subsequent calls.
+
+        Args:
+            field_number: A value between 0 to 34 for different available epw fields.
+                See the import_data_by_field method for the full list of fields.
+            analysis_period: A Ladybug AnalysisPeriod for the hours of the year
+                to be imported. Its timestep must be 1 and its is_leap_year
+                must match that of the EPW.
+
+        Returns:
+            An HourlyContinuousCollection if the analysis_period starts at
+            hour 0 and ends at hour 23. Otherwise, an HourlyDiscontinuousCollection.
+        """
+        # if the field is already parsed or the file cannot be memory-mapped,
+        # filter the loaded data
+        if not 0 <= field_number < self._num_of_fields:
+            raise ValueError("Field number should be between 0-%d" % self._num_of_fields)
+        if self._file_path is None or not self._file_path.lower().endswith('epw') \
+                or not os.path.isfile(self._file_path) or (self._is_data_loaded and (
+                self._body_lines is None or self._data[field_number] is not None)):
+            coll = self._get_data_by_field(field_number)
+            return coll.filter_by_analysis_period(analysis_period)
+
+        # check the analysis period
+        assert isinstance(analysis_period, AnalysisPeriod), 'Expected AnalysisPeriod ' \
+            'for import_data_by_analysis_period. Got {}.'.format(type(analysis_period))
+        assert analysis_period.timestep == 1, 'analysis_period timestep must be 1 ' \
+            'for EPW data. Got {}.'.format(analysis_period.timestep)
+        assert analysis_period.is_leap_year is self.is_leap_year, 'analysis_period ' \
+            'is_leap_year must match that of the EPW. {} != {}'.format(
+                analysis_period.is_leap_year, self.is_leap_year)
+
+        # get the indices of the annual data that fall within the analysis period
+        continuous = analysis_period.st_hour == 0 and analysis_period.end_hour == 23
+        if continuous:
+            st_ind = int(analysis_period.st_time.moy / 60)
+            end_ind = int(analysis_period.end_time.moy / 60) + 1
+            num_rows = 8784 if self._is_leap_year else 8760
+            count = end_ind - st_ind if end_ind > st_ind else end_ind - st_ind + num_rows
+            indices = [(st_ind + i) % num_rows for i in xrange(count)]
+        else:
+            indices = [int(moy / 60) for moy in analysis_period.moys]
+
+        # read the text of the rows and convert it into values
+        field = EPWFields.field_by_number(field_number)
+        values = EPWFields.convert_column(
+            field_number, self._read_field_rows(field_number, indices))
+
+        # build the data collection
+        header = Header(data_type=field.name, unit=field.unit,
+                        analysis_period=analysis_period,
+                        metadata=dict(self._metadata))
+        if continuous:
+            coll = HourlyContinuousCollection(header, values)
+        else:
+            datetimes = DateTimeSequence([i * 60 for i in indices], self._is_leap_year)
+            coll = HourlyDiscontinuousCollection(header, values, datetimes)
+            coll._validated_a_period = True
+        if self._is_ip:
+            coll.convert_to_ip()
+        return coll
+
+    def _read_field_rows(self, field_number, indices):
+        """Get the text of a field for a list of indices of the annual data.
+
+        Args:
+            field_number: An integer between 0 to 34 for the EPW field.
+            indices: A list of integers for the indices of the annual data collection
+                of the field (with index 0 being midnight on January 1st).
+        """
+        # get the rows of the file, accounting for point-in-time fields at 1 AM
+        num_rows = 8784 if self.is_leap_year else 8760
+        if EPWFields.field_by_number(field_number).name.point_in_time:
+            rows = [(i - 1) % num_rows for i in indices]
+        else:
+            rows = indices
+        if self._body_lines is not None:  # lazily loaded text of the body
+            return [self._body_lines[r].strip().split(',', field_number + 1)
+                    [field_number] for r in rows]
+
+        # group the rows into contiguous runs that can each be read at once
+        runs, run_st = [], 0
+        for i in xrange(1, len(rows) + 1):
+            if i == len(rows) or rows[i] != rows[i - 1] + 1:
+                runs.append((rows[run_st], rows[i - 1] + 1))
+                run_st = i
+
+        # read the text of each run of rows from the memory-mapped file
+        column = []
+        with open(self._file_path, 'rb') as epwin:
+            source = mmap.mmap(epwin.fileno(), 0, access=mmap.ACCESS_READ) \
+                if mmap is not None else epwin
+            try:
+                if self._line_offsets is None:
+                    self._line_offsets = self._body_line_offsets(source)
+                offsets = self._line_offsets
+                for st, end in runs:
+                    source.seek(offsets[st])
+                    text = source.read(offsets[end] - offsets[st]).decode('latin-1')
+                    column.extend(line.split(',', field_number + 1)[field_number]
+                                  for line in text.splitlines())
+            finally:
+                if source is not epwin:
+                    source.close()
+        return column
+
+    @staticmethod
+    def _body_line_offsets(source):
+        """Get a tuple of the byte offsets of each line in the body of an EPW file.
+
+        The tuple has one more item than the number of body lines, which marks
+        the byte position where the last line ends.
+
+        Args:
+            source: A readable binary file object or mmap of an EPW file.
+        """
+        source.seek(0)
+        for _ in xrange(8):
+            source.readline()
+        offsets = [source.tell()]
+        line = source.readline()
+        while line.strip():
+            offsets.append(source.tell())
+            line = source.readline()
+        return tuple(offsets)
+
     @property
     def years(self):
         """Return years as a Ladybug Data Collection."""
@@ -1270,16 +1558,64 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
         Read more at: https://bigladdersoftware.com/epx/docs/8-9/engineering-reference\
 /climate-calculations.html#energyplus-sky-temperature-calculation
         """
+        return self._derived_collection('sky_temperature', (12,), self._sky_temperature)
+
+    def _sky_temperature(self, horiz_ir):
+        """Compute the sky temperature collection from Horizontal Infrared Radiation."""
         # create sky temperature header
         sky_temp_header = Header(data_type=temperature.SkyTemperature(), unit='C',
                                  analysis_period=AnalysisPeriod(),
                                  metadata=self._metadata)
 
         # calculate sy temperature for each hour
-        horiz_ir = self._get_data_by_field(12).values
-        sky_temp_data = [calc_sky_temperature(hir) for hir in horiz_ir]
+        sky_temp_data = [calc_sky_temperature(hir) for hir in horiz_ir.values]
         return HourlyContinuousCollection(sky_temp_header, sky_temp_data)
 
+    def _derived_collection(self, key, field_numbers, compute):
+        """Get a data collection derived from EPW fields, which is memoized.
+
+        The memoized collection is re-computed whenever the values or units of
+        the fields that it is derived from have changed. A copy of the memoized
+        collection is always returned such that it can be edited without
+        affecting the memoized collection.
+
+        Args:
+            key: Text for the name of the derived collection.
+            field_numbers: A tuple of integers for the EPW fields from which the
+                collection is derived.
+            compute: A function that takes the data collections of the fields
+                as arguments and returns the derived data collection.
+        """
+        return self._memoized(key, field_numbers, compute).duplicate()
+
+    def _memoized(self, key, field_numbers, compute):
+        """Get an object derived from EPW fields, which is computed only once.
+
+        The memoized object is re-computed whenever the values or units of
+        the fields that it is derived from have changed, which is checked with
+        the count of edits of their data collections. Note that the memoized
+        object itself is returned and so it should not be edited.
+
+        Args:
+            key: A hashable key for the derived object.
+            field_numbers: A tuple of integers for the EPW fields from which the
+                object is derived.
+            compute: A function that takes the data collections of the fields
+                as arguments and returns the derived object.
+        """
+        sources = [self._get_data_by_field(field) for field in field_numbers]
+        source_state = tuple((src, src.header.unit, src._edit_count) for src in sources)
+        try:
+            old_state, result = self._derived[key]
+            if all(old[0] is new[0] and old[1:] == new[1:]
+                   for old, new in zip(old_state, source_state)):
+                return result
+        except KeyError:
+            pass
+        result = compute(*sources)
+        self._derived[key] = (source_state, result)
+        return result
+
     def approximate_design_day(self, day_type='SummerDesignDay', percentile=0.4):
         """Get a DesignDay object derived from percentile analysis of annual EPW data.
 
@@ -1306,18 +1642,17 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
         # get values used for both winter and summer design days
         avg_pres = self.atmospheric_station_pressure.average
         pressure = round(avg_pres) if avg_pres != 999999 else 101325
-        avg_mon_temp = self.dry_bulb_temperature.average_monthly()
-        hr_count = int(87.6 * percentile * 2)
+        stats = self._design_day_statistics(percentile)
+        hr_count = stats['hour_count']
 
         if day_type == 'WinterDesignDay':  # create winter design day criteria
             # get temperature at percentile and indices of coldest hours
-            temp = self.dry_bulb_temperature.percentile(percentile)
-            _, indices = self.dry_bulb_temperature.lowest_values(hr_count)
+            temp, indices = stats['low_temperature'], stats['low_indices']
             # get average wind speed and direction at coldest hours
             wind_speed = round(sum(self.wind_speed[i] for i in indices) / hr_count, 1)
             wind_dir = round(sum(self.wind_direction[i] for i in indices) / hr_count)
             # get the date as the 21st of the coldest month
-            date_obj = Date(avg_mon_temp.lowest_values(1)[1][0] + 1, 21)
+            date_obj = Date(stats['coldest_month'], 21)
             # return the design day object
             day_name = '{}% Heating Design Day for {}'.format(
                 100 - percentile, self.location.city)
@@ -1327,8 +1662,7 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
                 'ASHRAEClearSky', [0.0])
         elif day_type == 'SummerDesignDay':  # create summer design day criteria
             # get temperature at percentile and indices of hottest hours
-            temp = self.dry_bulb_temperature.percentile(100 - percentile)
-            _, indices = self.dry_bulb_temperature.highest_values(hr_count)
+            temp, indices = stats['high_temperature'], stats['high_indices']
             # get average humidity, wind speed and direction at hottest hours
             dew_pt = sum(self.dew_point_temperature[i] for i in indices) / hr_count
             rh = rel_humid_from_db_dpt(temp, dew_pt)
@@ -1336,27 +1670,91 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
             wind_speed = round(sum(self.wind_speed[i] for i in indices) / hr_count, 1)
             wind_dir = round(sum(self.wind_direction[i] for i in indices) / hr_count)
             # get the date as the 21st of the hottest month
-            date_obj = Date(avg_mon_temp.highest_values(1)[1][0] + 1, 21)
-            # compute the daily range of temperature from the days of the hottest month
-            hot_mon_db = self.dry_bulb_temperature.filter_by_analysis_period(
-                AnalysisPeriod(st_month=date_obj.month, end_month=date_obj.month))
-            temp_ranges = []
-            for day in hot_mon_db.group_by_day().values():
-                if day != []:
-                    temp_ranges.append(max(day) - min(day))
-            temp_range = round(sum(temp_ranges) / len(temp_ranges), 1)
+            date_obj = Date(stats['hottest_month'], 21)
             # return the design day object
             day_name = '{}% Cooling Design Day for {}'.format(
                 percentile, self.location.city)
             return DesignDay.from_design_day_properties(
-                day_name, day_type, self.location, date_obj, temp, temp_range,
-                'Wetbulb', wb_temp, pressure, wind_speed, wind_dir,
-                'ASHRAEClearSky', [1.0])
+                day_name, day_type, self.location, date_obj, temp,
+                stats['hottest_month_range'], 'Wetbulb', wb_temp, pressure,
+                wind_speed, wind_dir, 'ASHRAEClearSky', [1.0])
         else:
             raise ValueError(
                 'Unrecognized design day type "{}".\nChoose from: "SummerDesignDay", '
                 '"WinterDesignDay"'.format(day_type))
 
+    def _design_day_statistics(self, percentile):
+        """Get the dry bulb temperature statistics used to approximate design days.
+
+        The statistics are computed in a single pass over the dry bulb temperature
+        for both the heating and the cooling design day and they are memoized
+        such that best_available_design_days does not compute them twice. Only
+        the most extreme hours are selected from the temperatures with a heap
+        instead of sorting all of the values.
+
+        Args:
+            percentile: A number between 0 and 50 for the percentile difference
+                from the most extreme conditions within the EPW.
+
+        Returns:
+            A dictionary with the number of hours (hour_count), the temperatures
+            at the percentile (low_temperature, high_temperature), the indices of
+            the coldest and hottest hours (low_indices, high_indices), the
+            coldest and hottest months (coldest_month, hottest_month) and the
+            average daily temperature range of the hottest month
+            (hottest_month_range).
+        """
+        assert 0 <= percentile <= 50, \
+            'percentile must be between 0 and 50. Got {}'.format(percentile)
+        hr_count = int(87.6 * percentile * 2)
+        assert hr_count > 0, 'percentile {} is too small to select any hours ' \
+            'of the EPW.'.format(percentile)
+
+        def compute(dry_bulb):
+            values = dry_bulb._values
+            count = len(values)
+            key = values.__getitem__
+            # select the coldest hours along with the ranks needed by the percentile
+            k_low = (count - 1) * (percentile / 100)
+            low_ind = heapq.nsmallest(
+                max(hr_count, int(math.ceil(k_low)) + 1), xrange(count), key=key)
+            low_temp = _sorted_percentile([values[i] for i in low_ind], k_low)
+            # select the hottest hours along with the ranks needed by the percentile
+            k_high = (count - 1) * ((100 - percentile) / 100)
+            high_ind = heapq.nlargest(
+                max(hr_count, count - int(math.floor(k_high))), xrange(count), key=key)
+            high_vals = [values[i] for i in reversed(high_ind)]  # ascending order
+            high_temp = _sorted_percentile(high_vals, k_high - count + len(high_vals))
+            # get the monthly average temperatures in one pass over the values
+            per_month = AnalysisPeriod.NUMOFDAYSEACHMONTHLEAP if self.is_leap_year \
+                else AnalysisPeriod.NUMOFDAYSEACHMONTH
+            month_st, monthly_avg = [], []
+            st = 0
+            for days in per_month:
+                end = st + days * 24
+                month_st.append(st)
+                monthly_avg.append(sum(values[st:end]) / (end - st))
+                st = end
+            coldest = min(xrange(12), key=monthly_avg.__getitem__)
+            hottest = max(xrange(12), key=monthly_avg.__getitem__)
+            # get the average daily range of temperature of the hottest month
+            days = per_month[hottest]
+            temp_ranges = []
+            for st in xrange(month_st[hottest], month_st[hottest] + days * 24, 24):
+                day = values[st:st + 24]
+                temp_ranges.append(max(day) - min(day))
+            return {
+                'hour_count': hr_count,
+                'low_temperature': low_temp,
+                'low_indices': low_ind[:hr_count],
+                'high_temperature': high_temp,
+                'high_indices': high_ind[:hr_count],
+                'coldest_month': coldest + 1,
+                'hottest_month': hottest + 1,
+                'hottest_month_range': round(sum(temp_ranges) / len(temp_ranges), 1)
+            }
+        return self._memoized(('design_day', percentile), (6,), compute)
+
     def best_available_design_days(self, percentile=0.4):
         """Get the best available heating + cooling design days from this EPW.
 
@@ -1399,7 +1797,9 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
             self._import_data()
         if not self.is_ip:
             for coll in self._data:
-                coll.convert_to_ip()
+                if coll is not None:  # lazily loaded fields are converted upon parsing
+                    coll.convert_to_ip()
+            self._derived = {}
         self._is_ip = True
 
     def convert_to_si(self):
@@ -1412,9 +1812,27 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
             self._import_data()
         if self.is_ip:
             for coll in self._data:
-                coll.convert_to_si()
+                if coll is not None:  # lazily loaded fields are converted upon parsing
+                    coll.convert_to_si()
+            self._derived = {}
         self._is_ip = False
 
+    def convert_to_compact(self):
+        """Store the values of all numerical Data Collections of this EPW compactly.
+
+        This parses all of the fields of the EPW (including lazily loaded ones)
+        and stores their values in typed arrays, which reduces the memory used by
+        the EPW data several times. This is useful when the data of many EPW
+        files must be held in memory at once. Fields with values that are not
+        numbers (eg. the uncertainty flags) are left as they are.
+        """
+        self._import_all_fields()
+        for coll in self._data:
+            try:
+                coll.convert_to_compact()
+            except TypeError:  # field with values that are not numbers
+                pass
+
     def to_ddy(self, file_path, percentile=0.4):
         """Produce a DDY file with a heating + cooling design day from this EPW.
 
@@ -1464,10 +1882,11 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
         for hoy in hoys:
             dir_rad = self.direct_normal_radiation[hoy]
             dif_rad = self.diffuse_horizontal_radiation[hoy]
+            date_t = datetimes[hoy]
             line = "%d %d %.3f %d %d\n" \
-                % (datetimes[hoy].month,
-                   datetimes[hoy].day,
-                   datetimes[hoy].hour + 0.5,
+                % (date_t.month,
+                   date_t.day,
+                   date_t.hour + 0.5,
                    dir_rad, dif_rad)
             lines.append(line)
 
@@ -1490,8 +1909,7 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
     def to_dict(self):
         """Convert the EPW to a dictionary."""
         # load data if it's not loaded
-        if not self.is_data_loaded:
-            self._import_data()
+        self._import_all_fields()
 
         def dictify_dict(base_dict):
             new_dict = {}
@@ -1524,59 +1942,69 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
 
     def to_file_string(self):
         """Get a text string for the entirety of the EPW file contents."""
-        # load data if it's  not loaded convert to SI if it is in IP
-        if not self.is_data_loaded:
-            self._import_data()
-        originally_ip = False
-        if self.is_ip:
-            self.convert_to_si()
-            originally_ip = True
+        return ''.join(self.header) + ''.join(self._body_text_chunks())
 
-        # write the file
-        lines = self.header
-        try:
-            # if the first value is at 1AM, move first item to end position
-            for field in xrange(0, self._num_of_fields):
-                point_in_time = self._data[field].header.data_type.point_in_time
-                if point_in_time:
-                    first_hour = self._data[field]._values.pop(0)
-                    self._data[field]._values.append(first_hour)
-
-            annual_a_per = AnalysisPeriod(is_leap_year=self.is_leap_year)
-            for hour in xrange(0, len(annual_a_per.datetimes)):
-                line = []
-                for field in xrange(0, self._num_of_fields):
-                    line.append(str(self._data[field]._values[hour]))
-                lines.append(",".join(line) + "\n")
-        except IndexError:
-            length_error_msg = 'Data length is not for a full year and cannot be ' + \
-                'saved as an EPW file.'
-            raise ValueError(length_error_msg)
-        finally:  # move last item to start position for fields on the hour
-            for field in xrange(0, self._num_of_fields):
-                point_in_time = self._data[field].header.data_type.point_in_time
-                if point_in_time:
-                    last_hour = self._data[field]._values.pop()
-                    self._data[field]._values.insert(0, last_hour)
-
-        if originally_ip:  # put back the object as it was
-            self.convert_to_ip()
-        return ''.join(lines)
+    def write_to_file_object(self, file_object, chunk_size=1000):
+        """Write the contents of the EPW to an open file object in chunks of lines.
+
+        Unlike to_file_string, the text of the whole file is never held in memory
+        and the data collections of this EPW are never mutated (even if the EPW
+        is in IP units). So this method can be used to write many EPWs
+        and it is safe to use while other threads are reading the same EPW.
+
+        Args:
+            file_object: An open file object (or any object with a write method)
+                to which the text of the EPW will be written.
+            chunk_size: An integer for the number of hourly lines that are
+                written at once. (Default: 1000).
+        """
+        file_object.write(''.join(self.header))
+        for chunk in self._body_text_chunks(chunk_size):
+            file_object.write(chunk)
+
+    def _body_text_chunks(self, chunk_size=1000):
+        """Yield text for the hourly lines of the EPW body in chunks of lines.
+
+        Point-in-time fields are shifted by index such that their first value
+        is written at the end of the file and IP values are converted to SI
+        for each chunk. No data collection of this EPW is mutated.
+        """
+        # load data if it's not loaded and get the values of all of the fields
+        self._import_all_fields()
+        num_lines = len(AnalysisPeriod(is_leap_year=self.is_leap_year))
+        colls = self._data[:self._num_of_fields]
+        values = [coll._values for coll in colls]
+        if any(len(vals) != num_lines for vals in values):
+            raise ValueError(
+                'Data length is not for a full year and cannot be saved as an EPW file.')
+        # if the first value is at 1AM, the first item is written at the end
+        shifts = [1 if coll.header.data_type.point_in_time else 0 for coll in colls]
+
+        # write the lines of the file
+        for st in xrange(0, num_lines, chunk_size):
+            end = min(st + chunk_size, num_lines)
+            columns = []
+            for coll, vals, shift in zip(colls, values, shifts):
+                chunk = vals[st + shift:end + shift]
+                if shift and end == num_lines:
+                    chunk = list(chunk) + [vals[0]]
+                if self._is_ip:
+                    chunk = coll.header.data_type.to_si(chunk, coll.header.unit)[0]
+                columns.append([str(val) for val in chunk])
+            yield ''.join(','.join(row) + '\n' for row in zip(*columns))
 
     def write(self, file_path):
-        """Write EPW object as an .epw file and return the file path.
+        """Write EPW object as an .epw file and return the text of the file.
 
         Args:
             file_path: Text for the full path to where the .epw file will be written.
         """
         if not file_path.lower().endswith('.epw'):
             file_path += '.epw'
-        file_data = self.to_file_string()
-        write_to_file(file_path, file_data, True)
-        return file_data
+        return self.save(file_path)
 
     def save(self, file_path):
-        """Write EPW object as a file.
+        """Write EPW object as a file and return the text of the file.
 
         Args:
             file_path: Text for the full path to where the file will be written.
@@ -1585,6 +2013,22 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
         write_to_file(file_path, file_data, True)
         return file_data
 
+    def stream_to_file(self, file_path):
+        """Write EPW object as a file in chunks of lines and return the file path.
+
+        Unlike save, the text of the whole file is never held in memory, which
+        makes this method better suited to writing many EPWs.
+
+        Args:
+            file_path: Text for the full path to where the file will be written.
+        """
+        folder = os.path.dirname(file_path)
+        if folder and not os.path.isdir(folder):
+            preparedir(folder)
+        with open(file_path, writemode) as outf:
+            self.write_to_file_object(outf)
+        return file_path
+
     def ToString(self):
         """Overwrite .NET ToString."""
         return self.__repr__()
@@ -1833,6 +2277,30 @@ pdfs_v8.4.0/AuxiliaryPrograms.pdf
              }
     }
 
+    @classmethod
+    def convert_column(cls, field_number, column):
+        """Convert a column of text values into the value type of an EPW field.
+
+        The whole column is converted in one pass with the type of the field.
+        Only if this fails for an integer field (eg. because the file writes
+        45.0 instead of 45) will the values be rounded from floats instead.
+
+        Args:
+            field_number: An integer between 0 to 34 for the EPW field.
+            column: A list of text values for the field.
+
+        Returns:
+            A list of values with the type of the EPW field.
+        """
+        value_type = cls._fields[field_number]['type']
+        try:
+            return list(map(value_type, column))
+        except ValueError as e:
+            # failed to convert the values for the specific type
+            if value_type is not int:
+                raise ValueError(e)
+            return [int(round(float(val))) for val in column]
+
     @classmethod
     def field_by_number(cls, field_number):
         """Return an EPWField based on field number.
@@ -1907,3 +2375,39 @@ class EPWField(object):
             self.missing = field_dict['missing']
         else:
             self.missing = None
+
+
+def _sorted_percentile(values, k):
+    """Get the percentile of a list of sorted values given the fractional rank k.
+
+    This uses the same interpolation between ranks as BaseCollection.percentile.
+    """
+    f = math.floor(k)
+    c = math.ceil(k)
+    if f == c:
+        return values[int(k)]
+    return values[int(f)] * (c - k) + values[int(c)] * (k - f)
+
+
+def _load_epw_fields(args):
+    """Load the location, metadata and select fields of an EPW file.
+
+    This function is used by EPW.load_many and it is defined at the level of
+    the module such that it can be used in a pool of processes.
+
+    Args:
+        args: A tuple with two items. The first is the path to the EPW file and
+            the second is a list of field numbers or EPW property names to load.
+    """
+    file_path, fields = args
+    epw = EPW(file_path, lazy_load=True)
+    data = {}
+    for field in fields:
+        data[field] = epw.import_data_by_field(field) if isinstance(field, int) \
+            else getattr(epw, field)
+    return {
+        'file_path': epw.file_path,
+        'location': epw.location,
+        'metadata': epw.metadata,
+        'data': data
+    }
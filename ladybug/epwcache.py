@@ -0,0 +1,287 @@
+# coding=utf-8
+"""Binary cache of parsed EPW files, which avoids re-parsing the text of the same file.
+
+Each cache file is keyed by the SHA-1 hash of the contents of the EPW and contains
+the 8 header lines of the EPW along with the values of every field packed as
+doubles (or 32-bit integers for integer fields and compressed text for the
+Uncertainty Flags). Cache files are written to
+the folders.epw_cache_folder or, if this is not set, next to the EPW file itself.
+
+Usage:
+
+.. code-block:: python
+
+    from ladybug.epw import EPW
+    from ladybug.epwcache import evict_cache
+
+    epw = EPW('./epws/denver.epw', use_cache=True)  # writes the cache
+    epw = EPW('./epws/denver.epw', use_cache=True)  # loads from the cache
+    evict_cache(max_size=500 * 1024 * 1024, max_age=30 * 24 * 3600)
+"""
+from __future__ import division
+
+import os
+import sys
+import json
+import time
+import zlib
+import struct
+import hashlib
+from array import array
+
+from .config import folders
+
+CACHE_EXTENSION = '.lbepw'
+_MAGIC = b'LBEPW'
+_VERSION = 1
+_HASH_MEMO = {}  # memo of file hashes with keys of file paths
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+def file_hash(file_path):
+    """Get the SHA-1 hash of the contents of a file.
+
+    Hashes are memoized for the duration of the Python session and they are only
+    re-computed when the modified time or the size of the file changes.
+
+    Args:
+        file_path: Path to the file to be hashed.
+    """
+    file_path = os.path.abspath(file_path)
+    f_stat = os.stat(file_path)
+    stamp = (f_stat.st_mtime, f_stat.st_size)
+    try:
+        memo_stamp, f_hash = _HASH_MEMO[file_path]
+        if memo_stamp == stamp:
+            return f_hash
+    except KeyError:
+        pass
+    sha = hashlib.sha1()
+    with open(file_path, 'rb') as inf:
+        for chunk in iter(lambda: inf.read(1048576), b''):
+            sha.update(chunk)
+    f_hash = sha.hexdigest()
+    _HASH_MEMO[file_path] = (stamp, f_hash)
+    return f_hash
+
+
+def cache_file_path(file_path, f_hash=None):
+    """Get the path to the cache file of an EPW file.
+
+    Args:
+        file_path: Path to an EPW file.
+        f_hash: Optional text for the hash of the EPW file contents. If None,
+            it will be computed from the file. (Default: None).
+    """
+    f_hash = f_hash or file_hash(file_path)
+    folder = folders.epw_cache_folder or os.path.dirname(os.path.abspath(file_path))
+    return os.path.join(folder, f_hash + CACHE_EXTENSION)
+
+
+def write_cache(cache_file, f_hash, header_lines, columns):
+    """Write the header lines and the field values of a parsed EPW to a cache file.
+
+    The file is first written to a temporary file and then renamed such that
+    other processes never read a partially-written cache.
+
+    Args:
+        cache_file: Path to the cache file to be written.
+        f_hash: Text for the hash of the contents of the EPW file.
+        header_lines: A list with the 8 header lines of the EPW file.
+        columns: A list of lists with the values of each EPW field. Columns of
+            text are stored as text, columns of integers are stored as 32-bit
+            integers and all other columns are stored as doubles.
+
+    Returns:
+        True if the cache was written. False if the cache could not be written
+        (eg. because the folder is read-only).
+    """
+    types, text, packed = pack_columns(columns)
+    meta = {'hash': f_hash, 'header': list(header_lines), 'types': types, 'text': text}
+    meta_bytes = zlib.compress(json.dumps(meta).encode('utf-8'))
+
+    temp_file = '{}.{}.tmp'.format(cache_file, os.getpid())
+    try:
+        folder = os.path.dirname(cache_file)
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        with open(temp_file, 'wb') as outf:
+            outf.write(_MAGIC)
+            outf.write(struct.pack('<HIIQ', _VERSION, len(columns),
+                                   len(columns[0]), len(meta_bytes)))
+            outf.write(meta_bytes)
+            for col_bytes in packed:
+                outf.write(col_bytes)
+        if os.path.isfile(cache_file):
+            os.remove(cache_file)
+        os.rename(temp_file, cache_file)
+    except (IOError, OSError):
+        if os.path.isfile(temp_file):
+            os.remove(temp_file)
+        return False
+    return True
+
+
+def read_cache(cache_file, f_hash):
+    """Read the header lines and the field values of an EPW from a cache file.
+
+    Args:
+        cache_file: Path to the cache file to be read.
+        f_hash: Text for the hash of the contents of the EPW file, which will
+            be checked against the hash stored in the cache.
+
+    Returns:
+        A tuple with two elements. The first is a list of the 8 header lines of
+        the EPW and the second is a list of lists with the values of each field.
+        None will be returned if the cache file does not exist, does not match
+        the hash or cannot be read.
+    """
+    if not os.path.isfile(cache_file):
+        return None
+    try:
+        with open(cache_file, 'rb') as inf:
+            if inf.read(len(_MAGIC)) != _MAGIC:
+                return None
+            version, num_cols, num_vals, meta_len = \
+                struct.unpack('<HIIQ', inf.read(struct.calcsize('<HIIQ')))
+            if version != _VERSION:
+                return None
+            meta = json.loads(zlib.decompress(inf.read(meta_len)).decode('utf-8'))
+            if meta['hash'] != f_hash:
+                return None
+            columns = unpack_columns(inf, meta['types'], meta['text'], num_vals)
+    except (IOError, OSError, ValueError, KeyError, struct.error, zlib.error):
+        return None
+    if len(columns) != num_cols or any(len(col) != num_vals for col in columns):
+        return None
+    try:  # mark the cache file as recently used for the eviction policy
+        os.utime(cache_file, None)
+    except OSError:
+        pass
+    return meta['header'], columns
+
+
+def evict_cache(folder=None, max_size=None, max_age=None):
+    """Remove EPW cache files from a folder according to their total size or age.
+
+    Cache files are considered used whenever they are written or read such that
+    the least recently used caches are removed first.
+
+    Args:
+        folder: Path to the folder containing the cache files. If None, the
+            folders.epw_cache_folder will be used. (Default: None).
+        max_size: An optional number for the maximum number of bytes that all
+            cache files in the folder can occupy. The least recently used cache
+            files will be removed until the total is below this size.
+        max_age: An optional number for the maximum number of seconds since a
+            cache file was last used. Older cache files will be removed.
+
+    Returns:
+        A list of the paths to the cache files that were removed.
+    """
+    folder = folder or folders.epw_cache_folder
+    assert folder is not None, 'No folder was input and the epw_cache_folder ' \
+        'is not set in the ladybug config.'
+    if not os.path.isdir(folder):
+        return []
+
+    # gather the cache files in the folder ordered from most to least recent
+    caches = []
+    for f_name in os.listdir(folder):
+        if f_name.endswith(CACHE_EXTENSION):
+            f_path = os.path.join(folder, f_name)
+            f_stat = os.stat(f_path)
+            caches.append((f_stat.st_mtime, f_stat.st_size, f_path))
+    caches.sort(reverse=True)
+
+    # determine which cache files should be removed
+    to_remove, total_size, over_size = [], 0, False
+    oldest = time.time() - max_age if max_age is not None else None
+    for m_time, size, f_path in caches:
+        total_size += size
+        if max_size is not None and total_size > max_size:
+            over_size = True  # this cache and all older ones must be removed
+        if over_size or (oldest is not None and m_time < oldest):
+            to_remove.append(f_path)
+
+    removed = []
+    for f_path in to_remove:
+        try:
+            os.remove(f_path)
+            removed.append(f_path)
+        except OSError:  # the file has been removed by another process
+            pass
+    return removed
+
+
+def pack_columns(columns):
+    """Pack lists of EPW field values into bytes.
+
+    Columns of text are returned separately as text, columns of integers are
+    packed as 32-bit integers and all other columns are packed as doubles.
+
+    Args:
+        columns: A list of lists with the values of each EPW field.
+
+    Returns:
+        A tuple with three items.
+
+        -   types - A list of text for the type of each column ('s' for text,
+            'i' for 32-bit integers, 'n' for integers that are too large for
+            32 bits and 'd' for doubles).
+
+        -   text - A dictionary with the values of the text columns. The keys
+            are the indices of the columns as text.
+
+        -   packed - A list of bytes for each column that is not text.
+    """
+    types, text, packed = [], {}, []
+    for i, col in enumerate(columns):
+        if isinstance(col[0], str):
+            types.append('s')
+            text[str(i)] = list(col)
+            continue
+        if isinstance(col[0], int):
+            try:
+                arr = array('i', col)
+                types.append('i')
+            except OverflowError:  # integers that do not fit in 32 bits
+                arr = array('d', col)
+                types.append('n')
+        else:
+            arr = array('d', col)
+            types.append('d')
+        if _BIG_ENDIAN:
+            arr.byteswap()
+        packed.append(arr.tostring() if sys.version_info < (3, 0) else arr.tobytes())
+    return types, text, packed
+
+
+def unpack_columns(stream, types, text, num_vals):
+    """Read lists of EPW field values from bytes written with pack_columns.
+
+    Args:
+        stream: An open binary file object positioned at the start of the
+            packed bytes of the first column.
+        types: A list of text for the type of each column from pack_columns.
+        text: A dictionary with the values of the text columns from pack_columns.
+        num_vals: An integer for the number of values in each column.
+
+    Returns:
+        A list of lists with the values of each EPW field.
+    """
+    columns = []
+    for i, col_type in enumerate(types):
+        if col_type == 's':
+            columns.append([str(val) for val in text[str(i)]])
+            continue
+        arr = array('i' if col_type == 'i' else 'd')
+        col_bytes = stream.read(num_vals * arr.itemsize)
+        if sys.version_info < (3, 0):
+            arr.fromstring(col_bytes)
+        else:
+            arr.frombytes(col_bytes)
+        if _BIG_ENDIAN:
+            arr.byteswap()
+        columns.append([int(val) for val in arr] if col_type == 'n' else arr.tolist())
+    return columns
@@ -0,0 +1,359 @@
+# coding=utf-8
+"""Persistent catalog of the EPW files in a folder with a nearest-station search.
+
+The catalog stores the location and header data of every EPW in a folder such
+that finding the weather files closest to a site does not require opening any
+of the EPW files. The catalog is saved to a JSON file and, when it is refreshed,
+only the EPW files that were added or modified since the last refresh are read.
+
+Usage:
+
+.. code-block:: python
+
+    from ladybug.config import folders
+    from ladybug.epwcatalog import EPWCatalog
+
+    catalog = EPWCatalog(folders.default_epw_folder)
+    catalog.refresh()  # only reads EPWs that are new or modified
+    for file_path, distance in catalog.nearest(39.74, -105.18, count=3):
+        print(file_path, distance)
+"""
+from __future__ import division
+
+import os
+import json
+import math
+import heapq
+
+from .epw import EPW
+from .location import Location
+
+try:
+    xrange  # python 2
+except NameError:
+    xrange = range  # python 3
+try:  # python 2
+    _STRING_TYPES = basestring
+except NameError:  # python 3
+    _STRING_TYPES = str
+
+EARTH_RADIUS = 6371.0  # mean radius of the earth in km
+_LEAF_SIZE = 8  # number of stations below which k-d tree nodes are searched linearly
+
+
+class EPWCatalog(object):
+    """A persistent catalog of the EPW files within a folder and its sub-folders.
+
+    Args:
+        folder: Path to a folder containing .epw or .epw.gz files.
+        catalog_file: Optional path to the JSON file in which the catalog is
+            saved. If None, it will be an epw_catalog.json file inside the
+            folder. (Default: None).
+        climate_zones: Boolean to note whether the ASHRAE climate zone of each
+            EPW should be computed and stored in the catalog such that stations
+            can be filtered by climate zone. This requires reading the dry bulb
+            temperature of each EPW when it is added to the catalog, which is
+            slower than reading only the header. (Default: True).
+
+    Properties:
+        * folder
+        * catalog_file
+        * climate_zones
+        * file_paths
+    """
+    __slots__ = ('_folder', '_catalog_file', '_climate_zones', '_entries',
+                 '_paths', '_points', '_zones', '_elevations', '_order')
+
+    def __init__(self, folder, catalog_file=None, climate_zones=True):
+        assert os.path.isdir(folder), 'No folder was found at {}'.format(folder)
+        self._folder = os.path.normpath(folder)
+        self._catalog_file = os.path.normpath(catalog_file) if catalog_file \
+            else os.path.join(self._folder, 'epw_catalog.json')
+        self._climate_zones = bool(climate_zones)
+
+        # load any existing catalog and build the spatial index
+        self._entries = {}
+        if os.path.isfile(self._catalog_file):
+            with open(self._catalog_file) as inf:
+                data = json.load(inf)
+            if data.get('climate_zones') == self._climate_zones:
+                self._entries = data['files']
+        self._build_index()
+
+    @property
+    def folder(self):
+        """Get the path to the folder of EPW files."""
+        return self._folder
+
+    @property
+    def catalog_file(self):
+        """Get the path to the JSON file in which the catalog is saved."""
+        return self._catalog_file
+
+    @property
+    def climate_zones(self):
+        """Get a boolean for whether climate zones are stored in the catalog."""
+        return self._climate_zones
+
+    @property
+    def file_paths(self):
+        """Get a sorted list of the full paths to all EPW files in the catalog."""
+        return [self._full_path(rel_path) for rel_path in self._paths]
+
+    def refresh(self):
+        """Update the catalog with any EPW files that were added, modified or removed.
+
+        Only the EPW files that are new or whose modified time or size have
+        changed since the last refresh are read. The catalog file is saved if
+        anything has changed.
+
+        Returns:
+            A tuple with two lists. The first is a list of the full paths to the
+            EPW files that were read and the second is a list of the full paths
+            to EPW files that were removed from the catalog.
+        """
+        # find all of the EPW files in the folder
+        found = {}
+        for root, _, files in os.walk(self._folder):
+            for f_name in files:
+                if f_name.lower().endswith(('.epw', '.epw.gz')):
+                    file_path = os.path.join(root, f_name)
+                    rel_path = os.path.relpath(file_path, self._folder).replace('\\', '/')
+                    f_stat = os.stat(file_path)
+                    found[rel_path] = (f_stat.st_mtime, f_stat.st_size)
+
+        # read the header of any EPW files that are new or have changed
+        updated = []
+        for rel_path, (m_time, size) in sorted(found.items()):
+            entry = self._entries.get(rel_path)
+            if entry is not None and entry['mtime'] == m_time and entry['size'] == size:
+                continue
+            self._entries[rel_path] = self._epw_entry(rel_path, m_time, size)
+            updated.append(self._full_path(rel_path))
+        removed = [rel_path for rel_path in self._entries if rel_path not in found]
+        for rel_path in removed:
+            del self._entries[rel_path]
+
+        # save the catalog and rebuild the spatial index if anything has changed
+        if updated or removed:
+            self._build_index()
+            self.save()
+        return updated, [self._full_path(rel_path) for rel_path in sorted(removed)]
+
+    def save(self):
+        """Write the catalog to its catalog_file."""
+        data = {'climate_zones': self._climate_zones, 'files': self._entries}
+        temp_file = '{}.{}.tmp'.format(self._catalog_file, os.getpid())
+        with open(temp_file, 'w') as outf:
+            json.dump(data, outf)
+        if os.path.isfile(self._catalog_file):
+            os.remove(self._catalog_file)
+        os.rename(temp_file, self._catalog_file)
+
+    def location(self, file_path):
+        """Get a Ladybug Location for an EPW file in the catalog.
+
+        Args:
+            file_path: The full path to an EPW file in the catalog.
+        """
+        return Location.from_dict(dict(self._entry(file_path)['location']))
+
+    def climate_zone(self, file_path):
+        """Get the ASHRAE climate zone for an EPW file in the catalog.
+
+        This will be None if the catalog was created with climate_zones set to False.
+
+        Args:
+            file_path: The full path to an EPW file in the catalog.
+        """
+        return self._entry(file_path).get('climate_zone')
+
+    def is_leap_year(self, file_path):
+        """Get a boolean for whether an EPW file in the catalog is for a leap year.
+
+        Args:
+            file_path: The full path to an EPW file in the catalog.
+        """
+        return self._entry(file_path)['is_leap_year']
+
+    def filter(self, climate_zone=None, min_elevation=None, max_elevation=None):
+        """Get the full paths to the EPW files that meet a set of criteria.
+
+        Args:
+            climate_zone: Optional text for an ASHRAE climate zone. Zones without
+                a letter (eg. '5') will match all zones with the same number
+                (eg. '5A', '5B' and '5C'). This can also be a list of several
+                climate zones. If None, all climate zones are
+                accepted. (Default: None).
+            min_elevation: An optional number for the minimum elevation of the
+                station in meters. (Default: None).
+            max_elevation: An optional number for the maximum elevation of the
+                station in meters. (Default: None).
+        """
+        accept = self._filter_function(climate_zone, min_elevation, max_elevation)
+        return [self._full_path(self._paths[i]) for i in xrange(len(self._paths))
+                if accept is None or accept(i)]
+
+    def nearest(self, latitude, longitude, count=1, climate_zone=None,
+                min_elevation=None, max_elevation=None):
+        """Get the EPW files with the stations that are closest to a given site.
+
+        Distances are measured along the surface of the earth and stations are
+        found using a k-d tree such that the search time does not grow
+        significantly with the size of the catalog.
+
+        Args:
+            latitude: A number for the latitude of the site in degrees.
+            longitude: A number for the longitude of the site in degrees.
+            count: An integer for the number of EPW files to return. (Default: 1).
+            climate_zone: Optional text for an ASHRAE climate zone that the
+                stations must be in. See the filter method for more
+                details. (Default: None).
+            min_elevation: An optional number for the minimum elevation of the
+                station in meters. (Default: None).
+            max_elevation: An optional number for the maximum elevation of the
+                station in meters. (Default: None).
+
+        Returns:
+            A list of tuples ordered from the closest to the farthest station.
+            Each tuple has the full path to the EPW file and the distance to
+            the station in kilometers.
+        """
+        assert count > 0, 'Nearest count must be greater than 0. Got {}.'.format(count)
+        accept = self._filter_function(climate_zone, min_elevation, max_elevation)
+        tx, ty, tz = _unit_vector(latitude, longitude)
+        target = (tx, ty, tz)
+        points, order = self._points, self._order
+        heap = []  # max heap of (-squared chord distance, index) for the best stations
+
+        # search the k-d tree, visiting the far side of a split only when needed
+        stack = [(0, len(order), 0, 0)]
+        while stack:
+            lo, hi, depth, bound = stack.pop()
+            if bound and len(heap) == count and bound >= -heap[0][0]:
+                continue  # the region is farther than all of the stations found
+            if hi - lo <= _LEAF_SIZE:  # search all of the stations in the leaf
+                candidates, split = order[lo:hi], None
+            else:
+                mid = (lo + hi) // 2
+                candidates, split = (order[mid],), mid
+            for i in candidates:
+                x, y, z = points[i]
+                dist = (x - tx) * (x - tx) + (y - ty) * (y - ty) + (z - tz) * (z - tz)
+                if len(heap) < count:
+                    if accept is None or accept(i):
+                        heapq.heappush(heap, (-dist, i))
+                elif dist < -heap[0][0] and (accept is None or accept(i)):
+                    heapq.heapreplace(heap, (-dist, i))
+            if split is None:
+                continue
+            axis = depth % 3
+            diff = target[axis] - points[order[split]][axis]
+            near, far = ((lo, split), (split + 1, hi)) if diff < 0 else \
+                ((split + 1, hi), (lo, split))
+            stack.append((far[0], far[1], depth + 1, diff * diff))
+            stack.append((near[0], near[1], depth + 1, 0))
+
+        result = []
+        for neg_dist, i in sorted(heap, reverse=True):
+            chord = math.sqrt(-neg_dist)
+            distance = 2 * EARTH_RADIUS * math.asin(min(chord / 2, 1))
+            result.append((self._full_path(self._paths[i]), distance))
+        return result
+
+    def _filter_function(self, climate_zone, min_elevation, max_elevation):
+        """Get a function that tests whether a station index meets the criteria.
+
+        None will be returned if there are no criteria.
+        """
+        if climate_zone is None and min_elevation is None and max_elevation is None:
+            return None
+        if climate_zone is not None:
+            assert self._climate_zones, 'The catalog was created without ' \
+                'climate_zones and so it cannot be filtered by climate zone.'
+            zones = set((climate_zone,) if isinstance(climate_zone, _STRING_TYPES)
+                        else climate_zone)
+        zone_list, elevations = self._zones, self._elevations
+
+        def accept(i):
+            if climate_zone is not None:
+                zone = zone_list[i]
+                if zone not in zones and zone[:-1] not in zones:
+                    return False
+            if min_elevation is not None and elevations[i] < min_elevation:
+                return False
+            if max_elevation is not None and elevations[i] > max_elevation:
+                return False
+            return True
+        return accept
+
+    def _build_index(self):
+        """Build the k-d tree over the station coordinates for nearest searches."""
+        self._paths = sorted(self._entries)
+        entries = [self._entries[rel_path] for rel_path in self._paths]
+        self._points = [_unit_vector(ent['location']['latitude'],
+                                     ent['location']['longitude']) for ent in entries]
+        self._zones = [ent.get('climate_zone') for ent in entries]
+        self._elevations = [ent['location']['elevation'] for ent in entries]
+        self._order = list(xrange(len(self._paths)))
+        self._split(0, len(self._order), 0)
+
+    def _split(self, lo, hi, depth):
+        """Sort a range of the k-d tree order by the median along the depth axis."""
+        if hi - lo <= _LEAF_SIZE:
+            return
+        axis = depth % 3
+        points = self._points
+        self._order[lo:hi] = sorted(self._order[lo:hi], key=lambda i: points[i][axis])
+        mid = (lo + hi) // 2
+        self._split(lo, mid, depth + 1)
+        self._split(mid + 1, hi, depth + 1)
+
+    def _epw_entry(self, rel_path, m_time, size):
+        """Get a dictionary for the catalog entry of an EPW from its file."""
+        epw = EPW(self._full_path(rel_path), lazy_load=True)
+        entry = {
+            'mtime': m_time,
+            'size': size,
+            'location': epw.location.to_dict(),
+            'is_leap_year': epw.is_leap_year
+        }
+        if self._climate_zones:
+            entry['climate_zone'] = epw.ashrae_climate_zone
+        return entry
+
+    def _entry(self, file_path):
+        """Get the catalog entry of an EPW from its full path."""
+        rel_path = os.path.relpath(file_path, self._folder).replace('\\', '/')
+        try:
+            return self._entries[rel_path]
+        except KeyError:
+            raise ValueError('{} is not in the EPW catalog.'.format(file_path))
+
+    def _full_path(self, rel_path):
+        """Get the full path to an EPW file from its path relative to the folder."""
+        return os.path.join(self._folder, os.path.normpath(rel_path))
+
+    def __len__(self):
+        return len(self._paths)
+
+    def __contains__(self, file_path):
+        try:
+            self._entry(file_path)
+            return True
+        except ValueError:
+            return False
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'EPW Catalog: {} [{} files]'.format(self._folder, len(self._paths))
+
+
+def _unit_vector(latitude, longitude):
+    """Get a tuple for a point on the unit sphere from a latitude and longitude."""
+    lat, lon = math.radians(latitude), math.radians(longitude)
+    cos_lat = math.cos(lat)
+    return (cos_lat * math.cos(lon), cos_lat * math.sin(lon), math.sin(lat))
@@ -0,0 +1,205 @@
+# coding=utf-8
+"""Export select fields of many EPW files into a single CSV or binary columnar file.
+
+Each EPW is read and written one at a time such that the memory used by an
+export does not depend on the number of EPW files. Only the requested fields of
+each EPW are parsed and the rows of each EPW are written in chunks.
+
+Every row of the output has the metadata of the station (city, state, country,
+source, station_id, latitude, longitude, time_zone and elevation), the month,
+day and hour of the values and then one column for each requested field.
+
+The binary columnar file consists of a header followed by one group of rows
+for each EPW. The header has the magic text LBCOL, a version number and a JSON
+with the names of the columns. Each group has its number of rows, the station
+metadata and the type of each column as compressed JSON followed by the values
+of each field packed as 32-bit integers or doubles. These files can be read back
+with the read_columnar function.
+
+Usage:
+
+.. code-block:: python
+
+    from ladybug.config import folders
+    from ladybug.epwexport import export_csv, export_columnar, read_columnar
+
+    fields = [6, 8, 'sky_temperature']
+    export_csv(folders.default_epw_folder, './weather.csv', fields)
+    export_columnar(folders.default_epw_folder, './weather.lbcol', fields)
+    for station, data in read_columnar('./weather.lbcol'):
+        print(station['city'], max(data['Dry Bulb Temperature (C)']))
+"""
+from __future__ import division
+
+import sys
+import csv
+import json
+import zlib
+import struct
+from collections import OrderedDict
+
+from .analysisperiod import AnalysisPeriod
+from .epw import EPW
+from .epwcache import pack_columns, unpack_columns
+from .futil import collect_file_paths
+
+try:
+    xrange  # python 2
+except NameError:
+    xrange = range  # python 3
+
+STATION_COLUMNS = ('city', 'state', 'country', 'source', 'station_id',
+                   'latitude', 'longitude', 'time_zone', 'elevation')
+TIME_COLUMNS = ('month', 'day', 'hour')
+_MAGIC = b'LBCOL'
+_VERSION = 1
+_TIME_TEXT = {}  # text of the datetimes of each hour of the year by leap year
+_EPW_EXTENSIONS = ('.epw', '.epw.gz')
+
+
+def export_csv(epw_files, output_file, fields=(6,), chunk_size=1000):
+    """Export select fields of several EPW files into a single CSV file.
+
+    Args:
+        epw_files: A list of paths to .epw files. This can also be the path to a
+            folder, in which case all of the .epw and .epw.gz files within the
+            folder and its sub-folders are exported.
+        output_file: Path to the CSV file to be written.
+        fields: A list of the EPW fields to be exported. Each item can be either
+            an integer for the field number (see EPW.import_data_by_field) or
+            the name of an EPW data property (eg. 'sky_temperature'). (Default: (6,)
+            for dry bulb temperature).
+        chunk_size: An integer for the number of rows that are written at once.
+            (Default: 1000).
+
+    Returns:
+        The path to the CSV file.
+    """
+    fields = _check_fields(fields)
+    # the csv module quotes any text with commas (eg. a city with its state)
+    if sys.version_info >= (3, 0):
+        outf = open(output_file, 'w', newline='')
+    else:
+        outf = open(output_file, 'wb')
+    with outf:
+        writer = csv.writer(outf, lineterminator='\n')
+        header_written = False
+        for epw_path, station, columns in _epw_columns(epw_files, fields):
+            if not header_written:
+                writer.writerow(STATION_COLUMNS + TIME_COLUMNS + tuple(columns.keys()))
+                header_written = True
+            station_row = tuple(str(station[key]) for key in STATION_COLUMNS)
+            times = _time_text(station['is_leap_year'])
+            values = list(columns.values())
+            for st in xrange(0, len(times), chunk_size):
+                end = min(st + chunk_size, len(times))
+                text_cols = [[str(val) for val in vals[st:end]] for vals in values]
+                writer.writerows(station_row + time + row
+                                 for time, row in zip(times[st:end], zip(*text_cols)))
+    return output_file
+
+
+def export_columnar(epw_files, output_file, fields=(6,)):
+    """Export select fields of several EPW files into a single binary columnar file.
+
+    Args:
+        epw_files: A list of paths to .epw files. This can also be the path to a
+            folder, in which case all of the .epw and .epw.gz files within the
+            folder and its sub-folders are exported.
+        output_file: Path to the binary columnar file to be written.
+        fields: A list of the EPW fields to be exported. Each item can be either
+            an integer for the field number (see EPW.import_data_by_field) or
+            the name of an EPW data property (eg. 'sky_temperature'). (Default: (6,)
+            for dry bulb temperature).
+
+    Returns:
+        The path to the binary columnar file.
+    """
+    fields = _check_fields(fields)
+    with open(output_file, 'wb') as outf:
+        header_written = False
+        for epw_path, station, columns in _epw_columns(epw_files, fields):
+            if not header_written:
+                header = json.dumps({'station': STATION_COLUMNS,
+                                     'fields': list(columns.keys())}).encode('utf-8')
+                outf.write(_MAGIC)
+                outf.write(struct.pack('<HI', _VERSION, len(header)))
+                outf.write(header)
+                header_written = True
+            values = list(columns.values())
+            types, text, packed = pack_columns(values)
+            meta = {'station': station, 'types': types, 'text': text}
+            meta_bytes = zlib.compress(json.dumps(meta).encode('utf-8'))
+            outf.write(struct.pack('<II', len(values[0]), len(meta_bytes)))
+            outf.write(meta_bytes)
+            for col_bytes in packed:
+                outf.write(col_bytes)
+    return output_file
+
+
+def read_columnar(file_path):
+    """Read the stations and values of a binary columnar file written by export_columnar.
+
+    Args:
+        file_path: Path to a binary columnar file.
+
+    Returns:
+        A generator that yields a tuple for each EPW in the file. The first item
+        of each tuple is a dictionary with the station metadata of the EPW
+        (including an is_leap_year key). The second item is an ordered dictionary
+        with the field names as keys and the lists of values as values.
+    """
+    with open(file_path, 'rb') as inf:
+        assert inf.read(len(_MAGIC)) == _MAGIC, \
+            '{} is not a ladybug columnar file.'.format(file_path)
+        version, header_len = struct.unpack('<HI', inf.read(struct.calcsize('<HI')))
+        assert version == _VERSION, 'Unsupported columnar file version {}.'.format(
+            version)
+        names = json.loads(inf.read(header_len).decode('utf-8'))['fields']
+        group_size = struct.calcsize('<II')
+        while True:
+            group_header = inf.read(group_size)
+            if len(group_header) < group_size:
+                return
+            num_rows, meta_len = struct.unpack('<II', group_header)
+            meta = json.loads(zlib.decompress(inf.read(meta_len)).decode('utf-8'))
+            columns = unpack_columns(inf, meta['types'], meta['text'], num_rows)
+            yield meta['station'], OrderedDict(zip(names, columns))
+
+
+def _check_fields(fields):
+    """Check that the fields to be exported are valid and return them as a tuple."""
+    fields = tuple(fields)
+    assert len(fields) > 0, 'At least one EPW field must be exported.'
+    for field in fields:
+        assert isinstance(field, int) or \
+            isinstance(getattr(EPW, str(field), None), property), 'EPW fields ' \
+            'must be field numbers or names of EPW properties. Got {}.'.format(field)
+    return fields
+
+
+def _epw_columns(epw_files, fields):
+    """Yield the path, station metadata and field values of each EPW one at a time."""
+    for epw_path in collect_file_paths(epw_files, _EPW_EXTENSIONS):
+        epw = EPW(epw_path, lazy_load=True)
+        station = epw.location.to_dict()
+        station = OrderedDict((key, station[key]) for key in STATION_COLUMNS)
+        station['is_leap_year'] = epw.is_leap_year
+        columns = OrderedDict()
+        for field in fields:
+            coll = epw.import_data_by_field(field) if isinstance(field, int) \
+                else getattr(epw, field)
+            name = '{} ({})'.format(coll.header.data_type.name, coll.header.unit)
+            columns[name] = coll.values
+        yield epw_path, station, columns
+
+
+def _time_text(is_leap_year):
+    """Get a list of tuples with text for the month, day and hour of each hour."""
+    try:
+        return _TIME_TEXT[is_leap_year]
+    except KeyError:
+        a_per = AnalysisPeriod(is_leap_year=is_leap_year)
+        times = [(str(dt.month), str(dt.day), str(dt.hour)) for dt in a_per.datetimes]
+        _TIME_TEXT[is_leap_year] = times
+        return times
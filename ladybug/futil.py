@@ -3,6 +3,9 @@
 from __future__ import division
 
 import os
+import io
+import gzip
+import codecs
 import shutil
 import zipfile
 import sys
@@ -16,6 +19,10 @@ else:
     import urllib.request
     readmode = 'r'
     writemode = 'w'
+try:  # python 2
+    _STRING_TYPES = basestring
+except NameError:  # python 3
+    _STRING_TYPES = str
 
 
 def preparedir(target_dir, remove_content=True):
@@ -316,6 +323,149 @@ def unzip_file(source_file, dest_dir=None, mkdir=False):
             zf.extract(member, dest_dir)
 
 
+def archive_member(file_path):
+    """Get the zip file and the member name for a path to a file inside a zip archive.
+
+    Paths to files inside zip archives are written as if the zip archive was a
+    folder (e.g. c:/ladybug/USA_CO_Denver.zip/USA_CO_Denver.epw).
+
+    Args:
+        file_path: Full path to a file, which may be inside a zip archive.
+
+    Returns:
+        A tuple with the path to the zip file and the name of the member inside
+        of it. None if the file_path does not point to a file inside a zip archive.
+    """
+    if os.path.isfile(file_path):
+        return None
+    head, member_parts = file_path, []
+    while True:
+        new_head, tail = os.path.split(head)
+        if new_head == head or not tail:
+            return None
+        head = new_head
+        member_parts.insert(0, tail)
+        if head.lower().endswith('.zip') and os.path.isfile(head):
+            return head, '/'.join(member_parts)
+
+
+def file_exists(file_path):
+    """Check whether a file exists, including files that are inside zip archives.
+
+    Args:
+        file_path: Full path to a file (e.g. c:/ladybug/USA_CO_Denver.epw.gz or
+            c:/ladybug/USA_CO_Denver.zip/USA_CO_Denver.epw).
+    """
+    if os.path.isfile(file_path):
+        return True
+    member = archive_member(file_path)
+    if member is None:
+        return False
+    zip_path, member_name = member
+    with zipfile.ZipFile(zip_path) as zf:
+        return member_name in zf.namelist()
+
+
+def collect_file_paths(paths, extensions):
+    """Get a list of file paths from a list of paths or the path to a folder.
+
+    Args:
+        paths: A list of paths to files, which is returned as a list, or the
+            path to a folder, in which case all of the files within the folder
+            and its sub-folders that have one of the extensions are returned.
+        extensions: A tuple of text for the file extensions to be collected
+            from a folder (eg. ('.epw', '.epw.gz')). They are not case sensitive.
+    """
+    if not isinstance(paths, _STRING_TYPES):
+        return list(paths)
+    assert os.path.isdir(paths), 'No folder was found at {}'.format(paths)
+    file_paths = []
+    for root, _, files in os.walk(paths):
+        file_paths.extend(os.path.join(root, f) for f in sorted(files)
+                          if f.lower().endswith(extensions))
+    return file_paths
+
+
+def open_file(file_path, encoding=None, errors=None):
+    """Open a text file for reading, which can be a gzip file or inside a zip archive.
+
+    Compressed files are decompressed as they are read without writing any
+    temporary files. Gzip files are identified by the .gz extension (e.g.
+    c:/ladybug/USA_CO_Denver.epw.gz) and members of zip archives are identified
+    by a path that goes through the zip file as if it was a folder (e.g.
+    c:/ladybug/USA_CO_Denver.zip/USA_CO_Denver.epw).
+
+    Args:
+        file_path: Full path to a file.
+        encoding: Optional text for the encoding of the file. If None, the default
+            encoding of the platform is used in Python 3 and the file is read in
+            text mode as a byte string in Python 2, like the built-in open
+            function does with the 'r' mode. (Default: None).
+        errors: Optional text for how encoding errors are handled (e.g. 'ignore').
+            If None, an error is raised for any text that cannot be decoded.
+
+    Returns:
+        An open file object that must be closed after reading (ideally by
+        using it in a with statement).
+    """
+    member = archive_member(file_path)
+    if member is not None:
+        zip_path, member_name = member
+        with zipfile.ZipFile(zip_path) as zf:
+            raw = zf.open(member_name)
+    elif file_path.lower().endswith('.gz'):
+        raw = gzip.open(file_path, 'rb')
+    elif sys.version_info < (3, 0) and not encoding:
+        return open(file_path, 'r')
+    else:
+        raw = open(file_path, 'rb')
+    if sys.version_info >= (3, 0):
+        return io.TextIOWrapper(raw, encoding=encoding, errors=errors)
+    if encoding:
+        return codecs.getreader(encoding)(raw, errors or 'strict')
+    return _TextModeReader(raw)
+
+
+class _TextModeReader(object):
+    """Reader of a binary file that translates line endings like text mode in Python 2.
+
+    Args:
+        raw: A file object opened in binary mode, such as a gzip file or a member
+            of a zip archive.
+    """
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    @staticmethod
+    def _translate(text):
+        return text.replace('\r\n', '\n')
+
+    def read(self, size=-1):
+        text = self._raw.read() if size is None or size < 0 else self._raw.read(size)
+        if text.endswith('\r'):  # keep a line ending that is split by the size
+            text += self._raw.read(1)
+        return self._translate(text)
+
+    def readline(self, size=-1):
+        return self._translate(self._raw.readline(size))
+
+    def readlines(self):
+        return [self._translate(line) for line in self._raw.readlines()]
+
+    def __iter__(self):
+        return (self._translate(line) for line in self._raw)
+
+    def close(self):
+        self._raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
 def csv_to_matrix(csv_file_path):
     """Load a CSV file into a Python matrix of strings.
 
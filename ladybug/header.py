@@ -7,6 +7,11 @@ from copy import deepcopy
 from .analysisperiod import AnalysisPeriod
 from .datatype.base import DataTypeBase
 
+try:  # python 2
+    _IMMUTABLE_TYPES = (basestring, int, float, bool, type(None))
+except NameError:  # python 3
+    _IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
 
 class Header(object):
     """DataCollection header.
@@ -103,10 +108,17 @@ class Header(object):
         self._metadata = value or {}
 
     def duplicate(self):
-        """Return a copy of the header."""
-        a_per = self.analysis_period.duplicate() if self.analysis_period else None
-        return self.__class__(self.data_type, self.unit,
-                              a_per, deepcopy(self.metadata))
+        """Return a copy of the header.
+
+        The analysis period is never edited in place and so it is shared by the
+        copy. The metadata is only deep copied if it contains mutable values.
+        """
+        metadata = self.metadata
+        if all(isinstance(val, _IMMUTABLE_TYPES) for val in metadata.values()):
+            metadata = dict(metadata)
+        else:
+            metadata = deepcopy(metadata)
+        return self.__class__(self.data_type, self.unit, self.analysis_period, metadata)
 
     def to_tuple(self):
         """Return Ladybug header as a list."""
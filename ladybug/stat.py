@@ -1,7 +1,6 @@
 # coding=utf-8
 from __future__ import division
 
-import codecs
 import os
 import platform
 import re
@@ -14,6 +13,7 @@ from .designday import DryBulbCondition
 from .designday import HumidityCondition
 from .designday import WindCondition
 from .dt import Date
+from .futil import file_exists, open_file
 from .location import Location
 
 try:
@@ -26,7 +26,10 @@ class STAT(object):
     """Import data from a local .stat file.
 
     Args:
-        file_path: Address to a local .stat file.
+        file_path: Address to a local .stat file. This can also be a gzip
+            compressed .stat.gz file or a .stat file inside a zip archive, in which
+            case the zip file is written as a folder in the path (eg.
+            c:/ladybug/USA_CO_Denver.zip/USA_CO_Denver.stat).
 
     Properties:
         * location
@@ -113,10 +116,10 @@ class STAT(object):
         """Initialize the class.
         """
         if file_path is not None:
-            if not os.path.isfile(file_path):
+            if not file_exists(file_path):
                 raise ValueError(
                     'Cannot find an stat file at {}'.format(file_path))
-            if not file_path.lower().endswith('stat'):
+            if not file_path.lower().endswith(('stat', 'stat.gz')):
                 raise TypeError('{} is not an .stat file.'.format(file_path))
             self._file_path = os.path.normpath(file_path)
 
@@ -245,9 +248,9 @@ class STAT(object):
                 iron_python = True
 
         if iron_python:
-            statwin = codecs.open(self.file_path, 'r')
+            statwin = open_file(self.file_path)
         else:
-            statwin = codecs.open(self.file_path, 'r', encoding='utf-8', errors='ignore')
+            statwin = open_file(self.file_path, encoding='utf-8', errors='ignore')
         try:
             line = statwin.readline()
             # import header with location
@@ -2,7 +2,6 @@
 from __future__ import division
 
 import math
-import os
 
 from ladybug_geometry.geometry3d.pointvector import Vector3D
 
@@ -15,7 +14,7 @@ from .datatype.illuminance import GlobalHorizontalIlluminance, \
 from .datatype.luminance import ZenithLuminance
 from .dt import DateTime, Time
 from .epw import EPW
-from .futil import write_to_file
+from .futil import write_to_file, file_exists, open_file
 from .header import Header
 from .location import Location
 from .skymodel import ashrae_revised_clear_sky, ashrae_clear_sky, \
@@ -25,11 +24,9 @@ from .sunpath import Sunpath
 
 try:  # python 2
     from itertools import izip as zip
-    readmode = 'rb'
     writemode = 'wb'
 except ImportError:  # python 3
     xrange = range
-    readmode = 'r'
     writemode = 'w'
     xrange = range
 
@@ -182,15 +179,17 @@ class Wea(object):
         """Create Wea object from a .wea file.
 
         Args:
-            wea_file:Full path to .wea file.
+            wea_file:Full path to .wea file. This can also be a gzip compressed
+                .wea.gz file or a .wea file inside a zip archive (eg.
+                c:/ladybug/weather.zip/denver.wea).
             timestep: An optional integer to set the number of time steps per hour.
                 Default is 1 for one value per hour. If the wea file has a time step
                 smaller than an hour, adjust this input accordingly.
             is_leap_year: A boolean to indicate if values are for a leap
                 year. (Default: False).
         """
-        assert os.path.isfile(wea_file), 'Failed to find {}'.format(wea_file)
-        with open(wea_file, readmode) as weaf:
+        assert file_exists(wea_file), 'Failed to find {}'.format(wea_file)
+        with open_file(wea_file) as weaf:
             location = cls._parse_wea_header(weaf, wea_file)
             # parse irradiance values
             dir_norm_irr = []
@@ -248,15 +247,17 @@ class Wea(object):
         use the from_file method without issues.
 
         Args:
-            wea_file:Full path to .wea file.
+            wea_file:Full path to .wea file. This can also be a gzip compressed
+                .wea.gz file or a .wea file inside a zip archive (eg.
+                c:/ladybug/weather.zip/denver.wea).
             timestep: An optional integer to set the number of time steps per hour.
                 Default is 1 for one value per hour.
             is_leap_year: A boolean to indicate if values are for a leap
                 year. (Default: False).
         """
         # parse in the data
-        assert os.path.isfile(wea_file), 'Failed to find {}'.format(wea_file)
-        with open(wea_file, readmode) as weaf:
+        assert file_exists(wea_file), 'Failed to find {}'.format(wea_file)
+        with open_file(wea_file) as weaf:
             location = cls._parse_wea_header(weaf, wea_file)
             # parse irradiance values
             dir_norm_irr = []
@@ -756,13 +757,7 @@ class Wea(object):
             hour: Float for hour of the day [0 - 23].
         """
         dt = DateTime(month, day, hour, leap_year=self.is_leap_year)
-        try:
-            count = int(dt.hoy * self.timestep) if self.is_annual else \
-                self.direct_normal_irradiance.datetimes.index(dt)
-        except ValueError as e:
-            raise ValueError('Datetime {} was not found in the Wea.\n{}'.format(dt, e))
-        return self.direct_normal_irradiance[count], \
-            self.diffuse_horizontal_irradiance[count]
+        return self._irradiance_value(dt.hoy, dt, 'Datetime {}'.format(dt))
 
     def get_irradiance_value_for_hoy(self, hoy):
         """Get direct and diffuse irradiance values for a hoy.
@@ -770,13 +765,8 @@ class Wea(object):
         Args:
             hoy: Float for hour of the year [0 - 8759].
         """
-        try:
-            count = int(hoy * self.timestep) if self.is_annual else \
-                self.direct_normal_irradiance.datetimes.index(DateTime.from_hoy(hoy))
-        except ValueError as e:
-            raise ValueError('HOY {} was not found in the Wea.\n{}'.format(hoy, e))
-        return self.direct_normal_irradiance[count], \
-            self.diffuse_horizontal_irradiance[count]
+        dt = DateTime.from_hoy(hoy, self.is_leap_year)
+        return self._irradiance_value(hoy, dt, 'HOY {}'.format(hoy))
 
     def directional_irradiance(self, altitude=90, azimuth=180,
                                ground_reflectance=0.2, isotropic=True):
@@ -998,6 +988,18 @@ class Wea(object):
             write_to_file(hrs_file_path, hrs_data, True)
         return file_path
 
+    def _irradiance_value(self, hoy, dt, description):
+        """Get direct and diffuse irradiance values for a hoy and its DateTime."""
+        if self.is_annual:
+            count = int(hoy * self.timestep)
+            return self.direct_normal_irradiance[count], \
+                self.diffuse_horizontal_irradiance[count]
+        try:
+            return self.direct_normal_irradiance.value_at(dt), \
+                self.diffuse_horizontal_irradiance.value_at(dt)
+        except ValueError as e:
+            raise ValueError('{} was not found in the Wea.\n{}'.format(description, e))
+
     def _aligned_collection(self, header, values):
         """Process a header and values into a collection aligned with Wea data."""
         if self.is_continuous:
@@ -1,6 +1,6 @@
 # coding=utf-8
 from ladybug.analysisperiod import AnalysisPeriod
-from ladybug.dt import DateTime
+from ladybug.dt import DateTime, DateTimeSequence
 
 from datetime import timedelta
 import sys
@@ -110,6 +110,20 @@ def test_moys_hoys_hoys_int():
     assert len(ap.moys) == len(ap.hoys) == len(ap.hoys_int)
 
 
+def test_datetimes():
+    """Test that the datetimes property is a DateTimeSequence of the period."""
+    ap = AnalysisPeriod(12, 30, 22, 1, 2, 1, timestep=2)
+    dts = ap.datetimes
+    assert isinstance(dts, DateTimeSequence)
+    assert dts is ap.datetimes
+    assert len(dts) == len(ap)
+    assert dts[0] == DateTime(12, 30, 22)
+    assert dts[-1] == DateTime(1, 2, 1)
+    assert tuple(dts.moys) == ap.moys
+    assert tuple(dts.hoys) == ap.hoys
+    assert tuple(dt.moy for dt in dts) == ap.moys
+
+
 def test_doys_int():
     """Test the doys_int property."""
     ap = AnalysisPeriod()
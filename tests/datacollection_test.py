@@ -7,7 +7,7 @@ from ladybug.datacollection import HourlyDiscontinuousCollection, \
     MonthlyPerHourCollection
 from ladybug.header import Header
 from ladybug.analysisperiod import AnalysisPeriod
-from ladybug.dt import DateTime
+from ladybug.dt import DateTime, DateTimeSequence
 from ladybug.datatype.generic import GenericType
 from ladybug.datatype.temperature import Temperature
 from ladybug.datatype.fraction import RelativeHumidity, HumidityRatio
@@ -22,6 +22,7 @@ from ladybug.psychrometrics import humid_ratio_from_db_rh
 
 import pytest
 import sys
+import json
 if (sys.version_info >= (3, 0)):
     xrange = range
 
@@ -366,6 +367,28 @@ def test_validate_a_period_hourly():
         dc1_new = dc1.validate_analysis_period()
 
 
+def test_validate_a_period_hourly_shuffled():
+    """Test validate_analysis_period with shuffled sub-hourly datetimes."""
+    a_per = AnalysisPeriod(6, 21, 0, 6, 22, 23, timestep=4)
+    datetimes = list(a_per.datetimes)
+    values = list(range(len(datetimes)))
+    shuffled = list(zip(datetimes, values))
+    shuffled = shuffled[37:] + shuffled[:37]
+    shuffled.reverse()
+    dc1 = HourlyDiscontinuousCollection(
+        Header(Temperature(), 'C', AnalysisPeriod(6, 21, 6, 6, 21, 18)),
+        [v for _, v in shuffled], [dt for dt, _ in shuffled])
+    dc1_new = dc1.validate_analysis_period()
+    assert dc1_new.header.analysis_period == a_per
+    assert dc1_new.datetimes == tuple(datetimes)
+    assert dc1_new.values == tuple(values)
+
+    # Test that a single datetime is not mistaken for a duplicate
+    dc1 = HourlyDiscontinuousCollection(
+        Header(Temperature(), 'C', AnalysisPeriod()), [20], [DateTime(6, 21, 12)])
+    assert dc1.validate_analysis_period().datetimes == (DateTime(6, 21, 12),)
+
+
 def test_validate_a_period_daily():
     """Test the validate_a_period methods for daily collections."""
     a_per = AnalysisPeriod(6, 21, 0, 6, 22, 23)
@@ -663,6 +686,27 @@ def test_lowest_values():
     assert test_lowest_values_index == list(xrange(0, 4380))
 
 
+def test_highest_lowest_values_ties():
+    """Test that highest_values and lowest_values keep the order of equal values."""
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    test_data = [i % 24 for i in xrange(8760)]
+    dc = HourlyContinuousCollection(header, test_data)
+
+    high_vals, high_index = dc.highest_values(50)
+    assert high_vals == [23] * 50
+    assert high_index == list(xrange(23, 24 * 50, 24))
+    low_vals, low_index = dc.lowest_values(380)
+    assert low_vals == [0] * 365 + [1] * 15
+    assert low_index == list(xrange(0, 8760, 24)) + list(xrange(1, 24 * 15, 24))
+
+    high_vals, high_index = dc.highest_values(400, ordered=False)
+    assert high_index == sorted(dc.highest_values(400)[1])
+    assert high_vals == [test_data[i] for i in high_index]
+    low_vals, low_index = dc.lowest_values(5000, ordered=False)
+    assert low_index == sorted(dc.lowest_values(5000)[1])
+    assert low_vals == [test_data[i] for i in low_index]
+
+
 def test_percentile():
     """Test the percentile method."""
     header1 = Header(Temperature(), 'C', AnalysisPeriod())
@@ -674,6 +718,7 @@ def test_percentile():
     assert dc.percentile(50) == 4379.5
     assert dc.percentile(75) == 6569.25
     assert dc.percentile(100) == 8759
+    assert isinstance(dc.percentile(0), int)  # lists of integers are not floated
 
     with pytest.raises(Exception):
         dc.percentile(-10)
@@ -707,6 +752,24 @@ def test_filter_by_conditional_statement_continuous():
     assert not isinstance(dc2, HourlyContinuousCollection)
 
 
+def test_filter_by_conditional_statement_checks():
+    """Test that conditional statements are checked before they are evaluated."""
+    header1 = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=2))
+    values = [i - 24 for i in xrange(48)]
+    dc1 = HourlyContinuousCollection(header1, values)
+
+    dc2 = dc1.filter_by_conditional_statement('a ** 2 < 4 and not a in (0, 1)')
+    assert dc2.values == (-1,)
+    dc2 = dc1.filter_by_conditional_statement('A >= 20 OR a % 10 == 9')
+    assert dc2.values == (-21, -11, -1, 9, 19, 20, 21, 22, 23)
+
+    bad_statements = ('b > 1', 'a > 1 and', '__import__("os")', 'a.real > 1',
+                      'a > True', 'a > "1"', '[a for a in (1,)]', 'abs(a) > 1')
+    for statement in bad_statements:
+        with pytest.raises(ValueError):
+            dc1.filter_by_conditional_statement(statement)
+
+
 def test_filter_by_pattern():
     """Test filter by pattern."""
     a_per = AnalysisPeriod(end_month=1, end_day=2)
@@ -728,6 +791,9 @@ def test_filter_by_pattern_continuous():
     assert len(dc2) == 24
     assert not isinstance(dc2, HourlyContinuousCollection)
 
+    dc3 = dc1.filter_by_pattern([True, False, False])
+    assert dc3.values == tuple(xrange(0, 48, 3))
+
 
 def test_filter_by_analysis_period_sub_hourly():
     """Test filtering by analysis period on sub-hourly continuous collection."""
@@ -881,6 +947,72 @@ def test_filter_by_hoys_continuous():
     assert not isinstance(filt_dc, HourlyContinuousCollection)
 
 
+def test_value_at():
+    """Test the value_at and values_at methods."""
+    a_per = AnalysisPeriod(st_month=3, end_month=3, timestep=4)
+    header = Header(Temperature(), 'C', a_per)
+    values = list(xrange(len(a_per)))
+    dc = HourlyDiscontinuousCollection(header, values, a_per.datetimes)
+    dc_cont = HourlyContinuousCollection(header, values)
+    for coll in (dc, dc_cont):
+        assert coll.value_at(DateTime(3, 1, 0)) == 0
+        assert coll.value_at(DateTime(3, 2, 1, 15)) == 101
+        assert coll.values_at([DateTime(3, 31, 23, 45), DateTime(3, 1, 0, 15)]) == \
+            [len(a_per) - 1, 1]
+        with pytest.raises(ValueError):
+            coll.value_at(DateTime(4, 1, 0))
+        with pytest.raises(ValueError):
+            coll.value_at(DateTime(3, 1, 0, 10))
+
+    filt_dc = dc.filter_by_pattern([True, False])
+    assert filt_dc.value_at(DateTime(3, 1, 0, 30)) == 2
+    with pytest.raises(ValueError):
+        filt_dc.value_at(DateTime(3, 1, 0, 15))
+
+
+def test_filter_by_moys_continuous_reversed():
+    """Test filter_by_moys on a continuous collection that wraps the end of the year."""
+    a_per = AnalysisPeriod(12, 1, 0, 1, 31, 23, timestep=2)
+    header = Header(Temperature(), 'C', a_per)
+    dc = HourlyContinuousCollection(header, list(xrange(len(a_per))))
+    moys = [dc.datetimes[i].moy for i in (0, 1, 1487, 1488, 1489)]
+    filt_dc = dc.filter_by_moys(moys)
+    assert filt_dc.values == (0, 1, 1487, 1488, 1489)
+    assert [dt.moy for dt in filt_dc.datetimes] == moys
+    assert dc.filter_by_moys([15, 60, 44640]).values == (1490,)
+    assert dc.filter_by_hoys([0, 0.5, 8759.5, 5000]).values == (1488, 1489, 1487)
+
+
+def test_datetime_sequence_collections():
+    """Test that collections keep their datetimes as a compact DateTimeSequence."""
+    a_per = AnalysisPeriod(timestep=4, is_leap_year=True)
+    header = Header(Temperature(), 'C', a_per)
+    dc = HourlyContinuousCollection(header, list(xrange(len(a_per))))
+    assert isinstance(dc.datetimes, DateTimeSequence)
+    assert dc.datetimes == a_per.datetimes
+
+    dc_discont = dc.to_discontinuous()
+    assert isinstance(dc_discont.datetimes, DateTimeSequence)
+    assert isinstance(
+        dc_discont.validate_analysis_period().datetimes, DateTimeSequence)
+    assert dc_discont.datetimes == tuple(a_per.datetimes)
+    dc_tuple = HourlyDiscontinuousCollection(header, dc.values, list(a_per.datetimes))
+    assert dc_discont.is_collection_aligned(dc_tuple)
+    assert dc_discont.value_at(DateTime(2, 29, 12, leap_year=True)) == \
+        dc.values[dc.datetimes.index(DateTime(2, 29, 12, leap_year=True))]
+    daily_vals = dc_discont.average_daily().values
+    assert daily_vals == dc.average_daily().values
+    assert len(daily_vals) == 366
+    assert dc_discont.total_monthly().values == dc_tuple.total_monthly().values
+
+    filt_dc = dc.filter_by_moys([0, 15, 84960, 1000000])
+    assert isinstance(filt_dc.datetimes, DateTimeSequence)
+    assert filt_dc.datetimes == (DateTime(1, 1, 0, leap_year=True),
+                                 DateTime(1, 1, 0, 15, leap_year=True),
+                                 DateTime(2, 29, 0, leap_year=True))
+    assert filt_dc.values == (0, 1, 5664)
+
+
 def test_average_daily():
     """Test the average daily method."""
     header = Header(Temperature(), 'C', AnalysisPeriod())
@@ -1057,6 +1189,26 @@ def test_percentile_monthly_per_hour():
         assert new_dc[i] == val
 
 
+def test_percentiles():
+    """Test the methods that compute several percentiles at once."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=2))
+    values = [(i * 13) % 37 for i in xrange(len(header.analysis_period))]
+    dc = HourlyContinuousCollection(header, values)
+    percentiles = [5, 25, 50, 75, 95]
+
+    for interval in ('daily', 'monthly', 'monthly_per_hour'):
+        new_dcs = getattr(dc, 'percentiles_{}'.format(interval))(percentiles)
+        assert len(new_dcs) == 5
+        for per, new_dc in zip(percentiles, new_dcs):
+            assert new_dc == getattr(dc, 'percentile_{}'.format(interval))(per)
+            assert new_dc.header.metadata['operation'] == '{} percentile'.format(per)
+    daily = dc.average_daily()
+    assert daily.percentiles_monthly([10, 90]) == \
+        [daily.percentile_monthly(10), daily.percentile_monthly(90)]
+    with pytest.raises(AssertionError):
+        dc.percentiles_monthly([50, 101])
+
+
 def test_group_by_day_discontinuous():
     """Test the group by day method for discontinuous collections."""
     header = Header(Temperature(), 'C', AnalysisPeriod())
@@ -1080,6 +1232,68 @@ def test_group_by_month_discontinuous():
         assert len(val) == 24 * days_per_month[i]
 
 
+def test_group_by_month_per_hour_continuous():
+    """Test that continuous collections are grouped by month per hour like datetimes."""
+    a_per = AnalysisPeriod(2, 10, 0, 5, 20, 23, timestep=2)
+    header = Header(Temperature(), 'C', a_per)
+    dc = HourlyContinuousCollection(header, list(xrange(len(a_per))))
+    grouped = dc.group_by_month_per_hour()
+    assert len(grouped) == 12 * 48
+    assert grouped == dc.to_discontinuous().group_by_month_per_hour()
+    assert grouped[(2, 0, 30)][:2] == [1, 49]
+    assert grouped[(1, 0, 0)] == []
+    assert dc._grouping_plan('monthlyperhour') == dc._grouping_plan('monthlyperhour')
+
+
+def test_group_by_function():
+    """Test the group by function and aggregate by function methods."""
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    values = list(xrange(8760))
+    dc = HourlyContinuousCollection(header, values)
+    discont = dc.to_discontinuous()
+
+    def season(dt):
+        return (dt.month % 12) // 3
+
+    seasons = dc.group_by_function(season)
+    assert list(seasons.keys()) == [0, 1, 2, 3]
+    assert seasons[0] == values[:1416] + values[8016:]
+    assert seasons[1] == values[1416:3624]
+    assert seasons == discont.group_by_function(season)
+
+    def week(dt):
+        return dt.isocalendar()[1] if dt.month == 1 else None
+
+    weeks = dc.group_by_function(week)
+    assert list(weeks.keys()) == [52, 1, 2, 3, 4, 5]
+    assert weeks[52] == values[:24]
+    assert weeks[1] == values[24:192]
+    assert sum(len(vals) for vals in weeks.values()) == 744
+
+    averages = dc.aggregate_by_function(season)
+    assert averages[1] == sum(values[1416:3624]) / 2208
+    assert dc.aggregate_by_function(week, 'total')[2] == sum(values[192:360])
+    assert dc.aggregate_by_function(week, 'percentile', 0)[2] == 192
+    with pytest.raises(ValueError):
+        dc.aggregate_by_function(season, 'mean')
+    with pytest.raises(ValueError):
+        dc.group_by_function('weekly')
+
+    # check that functions depending on outside state are not remembered
+    state = {'n': 6}
+
+    def hour_block(dt):
+        return dt.hour // state['n']
+
+    assert list(dc.group_by_function(hour_block).keys()) == [0, 1, 2, 3]
+    state['n'] = 12
+    assert list(dc.group_by_function(hour_block).keys()) == [0, 1]
+
+    # check that editing the returned plans does not change the remembered ones
+    dc._grouping_plan('monthly').clear()
+    assert len(dc._grouping_plan('monthly')) == 12
+
+
 def test_interpolate_holes():
     """Test the interpolate holes method on the discontinuous collection."""
     a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
@@ -1108,6 +1322,42 @@ def test_interpolate_holes():
     assert len(interp_coll2.values) == 24
 
 
+def test_rolling_operations():
+    """Test the rolling window operations on the continuous collection."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=2))
+    values = [(i * 7) % 24 for i in xrange(48)]
+    dc = HourlyContinuousCollection(header, values)
+
+    avg = dc.rolling_average(3)
+    assert isinstance(avg, HourlyContinuousCollection) and len(avg) == 48
+    assert avg.header.metadata['operation'] == '3 step rolling average'
+    assert avg.values[:3] == (0, 3.5, 7)
+    assert avg[10] == sum(values[8:11]) / 3
+    assert dc.rolling_average(3, True)[0] == (values[-2] + values[-1] + values[0]) / 3
+    assert dc.rolling_total(24)[30] == sum(values[7:31])
+    assert dc.rolling_total(24, True).values == tuple([sum(values[:24])] * 48)
+    rain = HourlyContinuousCollection(
+        Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1)),
+        [0.1, 0.2, 0.3] + [0.0] * 21)
+    assert rain.rolling_total(3).values[5:] == tuple([0.0] * 19)
+    assert rain.rolling_total(4).values[6:] == tuple([0.0] * 18)
+    assert rain.rolling_total(3)[2] == 0.6
+    assert isinstance(dc.rolling_total(5)[10], int)
+    for i in xrange(48):
+        window = values[max(i - 4, 0):i + 1]
+        assert dc.rolling_min(5)[i] == min(window)
+        assert dc.rolling_max(5)[i] == max(window)
+    assert dc.rolling_max(5, True)[1] == max(values[-3:] + values[:2])
+    assert dc.rolling_average(1).values == dc.values
+    with pytest.raises(AssertionError):
+        dc.rolling_average(49)
+
+    ema = dc.exponential_average(0.5)
+    assert ema.values[:3] == (0, 3.5, 8.75)
+    assert dc.exponential_average(1).values == dc.values
+    assert dc.exponential_average(0.5, True)[0] != 0
+
+
 def test_cull_to_timestep():
     """Test the test_cull_to_timestep method on the discontinuous collection."""
     a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
@@ -1259,6 +1509,33 @@ def test_compute_function_aligned():
     assert humid_ratio == humid_ratio_from_db_rh(20, 70, pressure_at_chicago)
 
 
+def test_compute_function_aligned_batch():
+    """Test computing functions with aligned collections in batches and pools."""
+    epw_file_path = './tests/fixtures/epw/chicago.epw'
+    chicago_epw = EPW(epw_file_path)
+    hr_inputs = [chicago_epw.dry_bulb_temperature,
+                 chicago_epw.relative_humidity,
+                 95000]
+    humid_ratio = HourlyContinuousCollection.compute_function_aligned(
+        humid_ratio_from_db_rh, hr_inputs, HumidityRatio(), 'fraction')
+
+    def humid_ratios(dbts, rhs, pressure):
+        return [humid_ratio_from_db_rh(db, rh, pressure) for db, rh in zip(dbts, rhs)]
+
+    batch_ratio = HourlyContinuousCollection.compute_function_aligned(
+        humid_ratios, hr_inputs, HumidityRatio(), 'fraction', vectorized=True)
+    assert isinstance(batch_ratio, HourlyContinuousCollection)
+    assert batch_ratio.values == humid_ratio.values
+    assert batch_ratio.header.unit == 'fraction'
+
+    for use_threads in (True, False):
+        pool_ratio = HourlyContinuousCollection.compute_function_aligned(
+            humid_ratio_from_db_rh, hr_inputs, HumidityRatio(), 'fraction',
+            workers=2, use_threads=use_threads)
+        assert pool_ratio.values == humid_ratio.values
+    assert hr_inputs[2] == 95000
+
+
 def test_duplicate():
     """Test the duplicate method on the discontinuous collections."""
     header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
@@ -1287,6 +1564,146 @@ def test_duplicate_continuous():
     assert dc1.values == dc2.values
 
 
+def test_duplicate_copy_on_write():
+    """Test that duplicated collections share values until one of them is edited."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1),
+                    {'source': 'test', 'zones': ['a']})
+    dc1 = HourlyContinuousCollection(header, list(xrange(24)))
+    dc2 = dc1.duplicate()
+    assert dc2._values is dc1._values
+    assert dc2.header.analysis_period is dc1.header.analysis_period
+    dc2.header.metadata['zones'].append('b')
+    assert dc1.header.metadata['zones'] == ['a']
+
+    dc2[0] = 100
+    assert dc2[0] == 100 and dc1[0] == 0
+    dc1[1] = 200
+    assert dc1[1] == 200 and dc2[1] == 1
+    dc2.convert_to_ip()
+    assert dc1[2] == 2
+
+    # check that unit conversions that do not change the values keep them shared
+    for convert in ('convert_to_si', 'convert_to_unit'):
+        dc4 = dc1.duplicate()
+        if convert == 'convert_to_si':
+            dc4.convert_to_si()
+        else:
+            dc4.convert_to_unit('C')
+        dc4[0] = 999
+        assert dc4[0] == 999 and dc1[0] == 0
+
+    # check that immutable collections never copy the values
+    dc3 = dc1.to_immutable()
+    assert dc3._values is dc1._values
+    dc1[2] = 300
+    assert dc3.values == tuple([0, 200] + list(xrange(2, 24)))
+    assert dc3.to_mutable()._values is dc3._values
+    assert dc3.duplicate()._values is dc3._values
+
+
+def test_convert_to_compact():
+    """Test the storage of collection values in a compact array."""
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    values = [i % 24 for i in xrange(8760)]
+    dc1 = HourlyContinuousCollection(header, values)
+    assert not dc1.is_compact
+    dc1.convert_to_compact()
+    assert dc1.is_compact
+    assert dc1.values == tuple(values)
+    assert isinstance(dc1[5], int)
+    assert dc1[0:3] == [0, 1, 2]
+    assert dc1.average == sum(values) / 8760
+    assert json.loads(json.dumps(dc1.to_dict()))['values'] == values
+
+    # check that derived collections are compact
+    dc2 = dc1.duplicate()
+    assert dc2.is_compact and dc2.values == dc1.values
+    dc2.convert_to_ip()
+    assert dc2.is_compact and dc2[1] == pytest.approx(33.8, rel=1e-6)
+    dc3 = dc1.filter_by_analysis_period(AnalysisPeriod(2, 1, 0, 2, 28, 23))
+    assert dc3.is_compact and len(dc3) == 28 * 24
+
+    # check that the groups of compact collections are lists
+    for groups in (dc1.group_by_day(), dc1.group_by_month(),
+                   dc1.group_by_month_per_hour(),
+                   dc1.group_by_function(lambda dt: dt.hour // 6)):
+        assert all(isinstance(group, list) for group in groups.values())
+    assert dc1.group_by_month()[1][:3] == [0, 1, 2]
+    assert json.loads(json.dumps(dc1.group_by_day()))['1'] == values[:24]
+
+    # check that integers use the same 32-bit array on all platforms
+    assert dc1._values.typecode == 'i'
+    dc4 = dc1.duplicate()
+    dc4[2] = 2 ** 40
+    assert dc4.is_compact and dc4._values.typecode == 'd' and dc4[2] == 2 ** 40
+    big = dc1 * (2 ** 30)
+    assert big.is_compact and big[3] == 3 * 2 ** 30
+    assert big.total == sum(values) * 2 ** 30
+
+    # check that values that do not fit the array are still accepted
+    dc1[0] = 0.5
+    assert dc1.is_compact and dc1[0] == 0.5 and dc1[1] == 1
+    dc1[1] = None
+    assert not dc1.is_compact and dc1[1] is None
+    with pytest.raises(TypeError):
+        dc1.convert_to_compact()
+    with pytest.raises(AttributeError):
+        dc2.to_immutable().convert_to_compact()
+
+
+def test_numpy_acceleration(monkeypatch):
+    """Test that operations accelerated with numpy match the pure Python ones."""
+    import ladybug._datacollectionbase as base
+    pytest.importorskip('numpy')
+    header = Header(Temperature(), 'C', AnalysisPeriod(3, 5, 0, 7, 20, 23, 4))
+    values = [(i * 7) % 31 - 10.5 for i in xrange(len(header.analysis_period))]
+    dc1 = HourlyContinuousCollection(header, values)
+    dc2 = HourlyContinuousCollection(header.duplicate(), [v + 12 for v in values])
+    dc1.convert_to_compact()
+    dc2.convert_to_compact()
+
+    def results():
+        return [dc1.average_monthly().values, dc1.total_daily().values,
+                dc1.average_monthly_per_hour().values, (dc1 + dc2).values,
+                (dc1 * 2.5).values, (dc1 / dc2).values,
+                (dc1.average, dc1.total, dc1.median, dc1.percentile(33))]
+
+    accelerated = results()
+    assert (dc1 + dc2).is_compact
+    monkeypatch.setattr(base, 'numpy', None)
+    for acc_vals, vals in zip(accelerated, results()):
+        assert acc_vals == pytest.approx(vals, rel=1e-9)
+
+
+def test_lazy_arithmetic():
+    """Test that lazy arithmetic on collections matches the eager arithmetic."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=2))
+    dbt = HourlyContinuousCollection(header, [i % 24 + 0.5 for i in xrange(48)])
+    rh = HourlyContinuousCollection(header, [i + 20 for i in xrange(48)])
+    expected = (-((dbt - 18) * 0.5 + rh / 100) * dbt).values
+
+    lazy_dbt = dbt.to_lazy()
+    assert lazy_dbt.is_lazy and not dbt.is_lazy
+    result = -((lazy_dbt - 18) * 0.5 + rh / 100) * lazy_dbt
+    assert result.is_lazy and len(result) == 48
+    assert result._value_buffer.depth == 5
+    assert result.values == pytest.approx(expected, rel=1e-12)
+    assert result.average_daily().values == \
+        pytest.approx([sum(expected[:24]) / 24, sum(expected[24:]) / 24], rel=1e-12)
+    assert result.to_immutable().values == result.values
+
+    # check that long chains are evaluated and that errors are raised on evaluation
+    total = lazy_dbt
+    for _ in xrange(100):
+        total = total + dbt
+    assert total.values == pytest.approx([v * 101 for v in dbt.values], rel=1e-12)
+    zero = lazy_dbt / (rh * 0)
+    with pytest.raises(ZeroDivisionError):
+        zero.values
+    with pytest.raises(AssertionError):
+        lazy_dbt + dbt.filter_by_analysis_period(AnalysisPeriod(1, 1, 0, 1, 1, 23))
+
+
 def test_dict_methods():
     """Test the to/from dict methods for discontinuous collections."""
     header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
@@ -21,6 +21,14 @@ def test_import_ddy():
     assert ddy_rel.file_path == os.path.normpath(relative_path)
 
 
+def test_import_ddy_from_zip():
+    """Test import of a ddy file that is inside a zip archive."""
+    zip_path = './tests/fixtures/zip/test.zip'
+    ddy = DDY.from_ddy_file(os.path.join(zip_path, 'AUS_NSW.Sydney.947670_IWEC.ddy'))
+    assert ddy.location.latitude == approx(-33.95, rel=1e-3)
+    assert len(ddy.design_days) > 0
+
+
 def test_dict_methods():
     """Test dict methods for the DDY object."""
     relative_path = './tests/fixtures/ddy/chicago.ddy'
@@ -1,6 +1,7 @@
 # coding=utf-8
-from ladybug.dt import DateTime, Date, Time
+from ladybug.dt import DateTime, Date, Time, DateTimeSequence
 import pickle
+import pytest
 
 
 def test_date_time_init():
@@ -211,3 +212,59 @@ def test_pickle_and_unpickle():
     assert pickle.loads(serialized_dt1) == dt1
     assert pickle.loads(serialized_dt2) == dt2
     assert pickle.loads(serialized_dt3) == dt3
+
+
+def test_date_time_sequence():
+    """Test the DateTimeSequence and its properties."""
+    dts = (DateTime(1, 1, 0), DateTime(2, 1, 6, 30), DateTime(12, 31, 23, 45))
+    seq = DateTimeSequence([dt.moy for dt in dts])
+    assert len(seq) == 3
+    assert not seq.leap_year
+    assert seq == dts
+    assert dts == seq
+    assert seq != dts[:2]
+    assert list(seq) == list(dts)
+    assert seq[1] == dts[1]
+    assert isinstance(seq[1], DateTime)
+    assert seq[-1] == dts[-1]
+    assert seq[1:] == dts[1:]
+    assert isinstance(seq[1:], DateTimeSequence)
+    assert list(reversed(seq)) == list(reversed(dts))
+    assert DateTime(2, 1, 6, 30) in seq
+    assert DateTime(2, 1, 6) not in seq
+    assert seq.index(DateTime(12, 31, 23, 45)) == 2
+    assert seq.count(DateTime(1, 1, 0)) == 1
+    assert seq[0] is seq[0]  # iterated DateTimes are kept for later use
+    assert seq[:2][1] is seq[1]
+    seq_2 = DateTimeSequence(seq.moys)
+    assert seq_2[1] == dts[1] and seq_2._datetimes is None  # only one is created
+    assert seq + seq == dts + dts
+    assert dts + seq == dts + dts
+
+    assert list(seq.moys) == [0, 45030, 525585]
+    assert list(seq.hoys) == [dt.hoy for dt in dts]
+    assert list(seq.doys) == [1, 32, 365]
+    assert list(seq.months) == [1, 2, 12]
+
+    seq = DateTimeSequence.from_datetimes(dts)
+    assert seq == dts
+    assert pickle.loads(pickle.dumps(seq)) == seq
+    with pytest.raises(ValueError):
+        seq.index(DateTime(2, 1, 6))
+
+
+def test_date_time_sequence_leap_year():
+    """Test the DateTimeSequence for a leap year."""
+    dts = (DateTime(2, 29, 12, leap_year=True), DateTime(12, 31, 23, leap_year=True))
+    seq = DateTimeSequence.from_datetimes(dts)
+    assert seq.leap_year
+    assert seq == dts
+    assert list(seq.doys) == [60, 366]
+    assert list(seq.months) == [2, 12]
+    assert DateTime(12, 31, 23) not in seq
+    assert seq[:1] != DateTimeSequence(seq.moys[:1])
+
+    with pytest.raises(ValueError):
+        DateTimeSequence([527040], True)
+    with pytest.raises(ValueError):
+        DateTimeSequence([525600])
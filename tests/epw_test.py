@@ -5,6 +5,9 @@ from ladybug.designday import DesignDay
 from ladybug.analysisperiod import AnalysisPeriod
 
 import os
+import io
+import gzip
+import sys
 import pytest
 
 
@@ -43,6 +46,125 @@ def test_import_tokyo_epw():
     assert epw.ashrae_climate_zone == '3A'
 
 
+def test_import_epw_lazy_load():
+    """Test that lazily loaded EPW fields match those of a fully loaded EPW."""
+    relative_path = './tests/fixtures/epw/chicago.epw'
+    epw = EPW(relative_path)
+    lazy_epw = EPW(relative_path, lazy_load=True)
+    assert lazy_epw.lazy_load
+    assert not lazy_epw.is_data_loaded
+    assert lazy_epw.dry_bulb_temperature == epw.dry_bulb_temperature
+    assert lazy_epw.is_data_loaded
+    assert lazy_epw._data[8] is None  # relative humidity has not been parsed
+    assert lazy_epw.relative_humidity == epw.relative_humidity
+    assert lazy_epw.relative_humidity is lazy_epw.relative_humidity
+    assert lazy_epw.to_dict() == epw.to_dict()
+    assert lazy_epw._body_lines is None
+
+    # check that fields parsed after a unit conversion are in the correct units
+    lazy_epw = EPW(relative_path, lazy_load=True)
+    lazy_epw.convert_to_ip()
+    assert lazy_epw.dry_bulb_temperature.header.unit == 'F'
+    assert lazy_epw.dry_bulb_temperature.values[0] == pytest.approx(21.02, rel=1e-2)
+    lazy_epw.convert_to_si()
+    assert lazy_epw.dew_point_temperature.header.unit == 'C'
+
+
+def test_import_data_by_analysis_period():
+    """Test that EPW data imported by analysis period matches the filtered data."""
+    relative_path = './tests/fixtures/epw/chicago.epw'
+    epw = EPW(relative_path)
+    a_pers = (AnalysisPeriod(6, 1, 0, 6, 7, 23), AnalysisPeriod(12, 1, 0, 1, 31, 23),
+              AnalysisPeriod(3, 1, 9, 3, 10, 17), AnalysisPeriod(12, 31, 0, 1, 1, 23))
+    for a_per in a_pers:
+        for field_number in (5, 6, 8, 10, 21):
+            part_epw = EPW(relative_path)
+            coll = part_epw.import_data_by_analysis_period(field_number, a_per)
+            assert not part_epw.is_data_loaded
+            filt_coll = epw.import_data_by_field(field_number) \
+                .filter_by_analysis_period(a_per)
+            assert coll.__class__ == filt_coll.__class__
+            assert coll.header.analysis_period == a_per
+            assert coll.values == filt_coll.values
+            assert coll.datetimes == filt_coll.datetimes
+
+    with pytest.raises(AssertionError):
+        epw.import_data_by_analysis_period(6, AnalysisPeriod(timestep=2))
+    with pytest.raises(ValueError):
+        EPW(relative_path).import_data_by_analysis_period(35, a_pers[0])
+
+
+def test_import_epw_compressed():
+    """Test the import of EPW files that are gzip compressed or inside a zip archive."""
+    zip_path = './tests/fixtures/zip/test.zip'
+    epw = EPW(os.path.join(zip_path, 'AUS_NSW.Sydney.947670_IWEC.epw'))
+    assert epw.location.city == 'SYDNEY'
+    assert len(epw.dry_bulb_temperature) == 8760
+    a_per = AnalysisPeriod(6, 1, 0, 6, 7, 23)
+    assert epw.import_data_by_analysis_period(6, a_per) == \
+        epw.dry_bulb_temperature.filter_by_analysis_period(a_per)
+
+    relative_path = './tests/fixtures/epw/tokyo.epw'
+    gz_path = './tests/fixtures/epw/tokyo.epw.gz'
+    with open(relative_path, 'rb') as inf:
+        with gzip.open(gz_path, 'wb') as outf:
+            outf.write(inf.read())
+    try:
+        gz_epw = EPW(gz_path)
+        assert gz_epw.to_dict() == EPW(relative_path).to_dict()
+    finally:
+        os.remove(gz_path)
+
+
+def test_load_many():
+    """Test the loading of several EPW files in serial and in parallel."""
+    folder = './tests/fixtures/epw'
+    paths = [os.path.join(folder, 'chicago.epw'), os.path.join(folder, 'tokyo.epw')]
+    results = EPW.load_many(paths, fields=[6, 'relative_humidity'])
+    assert len(results) == 2
+    assert results[0]['location'].city == 'Chicago Ohare Intl Ap'
+    assert results[0]['metadata']['city'] == 'Chicago Ohare Intl Ap'
+    assert results[0]['data'][6] == EPW(paths[0]).dry_bulb_temperature
+    assert results[1]['data']['relative_humidity'] == EPW(paths[1]).relative_humidity
+
+    par_results = EPW.load_many(paths, fields=[6, 'relative_humidity'], workers=2)
+    assert [r['file_path'] for r in par_results] == [r['file_path'] for r in results]
+    assert par_results[1]['data'][6] == results[1]['data'][6]
+    assert par_results[1]['location'].city == results[1]['location'].city
+
+    folder_results = EPW.load_many(folder)
+    assert len(folder_results) == 2
+    assert folder_results[0]['data'] == {}
+
+    with pytest.raises(AssertionError):
+        EPW.load_many(paths, fields=['not_a_field'])
+
+
+def test_sky_temperature_memoized():
+    """Test that the memoized sky temperature is updated when the EPW changes."""
+    relative_path = './tests/fixtures/epw/chicago.epw'
+    epw = EPW(relative_path)
+    sky_temp = epw.sky_temperature
+    assert sky_temp is not epw.sky_temperature
+    assert sky_temp == epw.sky_temperature
+    memo = epw._derived['sky_temperature'][1]
+    assert epw.sky_temperature._values is memo._values  # the memo is not re-computed
+    sky_temp[0] = 100  # editing the returned collection does not edit the memo
+    assert epw.sky_temperature[0] != 100
+
+    # check that editing the source field re-computes the sky temperature
+    orig_value = epw.sky_temperature[0]
+    epw.horizontal_infrared_radiation_intensity[0] = 400
+    assert epw.sky_temperature[0] != orig_value
+    assert epw.sky_temperature[0] == pytest.approx(16.67, abs=0.01)
+
+    # check that converting the units clears the memoized collections
+    epw.convert_to_ip()
+    assert epw._derived == {}
+    epw.convert_to_si()
+    assert epw.sky_temperature[0] == pytest.approx(16.67, abs=0.01)
+
+
 def test_epw_from_file_string():
     """Test initialization of EPW from a file string."""
     relative_path = './tests/fixtures/epw/chicago.epw'
@@ -54,6 +176,22 @@ def test_epw_from_file_string():
     assert len(epw.dry_bulb_temperature) == 8760
 
 
+def test_epw_from_file_string_float_integers():
+    """Test that integer fields written as floats are rounded when parsed."""
+    relative_path = './tests/fixtures/epw/chicago.epw'
+    with open(relative_path, 'r') as epwin:
+        lines = epwin.readlines()
+    for i in range(8, len(lines)):
+        row = lines[i].split(',')
+        row[8] = '{}.4'.format(row[8])  # relative humidity is an integer field
+        lines[i] = ','.join(row)
+    epw = EPW.from_file_string(''.join(lines))
+    orig_epw = EPW(relative_path)
+    assert epw.relative_humidity.values == orig_epw.relative_humidity.values
+    assert all(isinstance(val, int) for val in epw.relative_humidity.values)
+    assert epw.dry_bulb_temperature == orig_epw.dry_bulb_temperature
+
+
 def test_epw_from_missing_values():
     """Test initialization of EPW from missing values."""
     epw = EPW.from_missing_values()
@@ -330,11 +468,17 @@ def test_write_epw():
     epw = EPW(path)
 
     modified_path = './tests/fixtures/epw/tokyo_modified.epw'
-    epw.write(modified_path)
+    file_data = epw.write(modified_path)
+    assert file_data == epw.to_file_string()
     assert os.path.isfile(modified_path)
     assert os.stat(modified_path).st_size > 1
     os.remove(modified_path)
 
+    assert epw.stream_to_file(modified_path) == modified_path
+    with open(modified_path, 'r') as epwin:
+        assert epwin.read() == file_data
+    os.remove(modified_path)
+
 
 def test_write_epw_from_missing_values():
     """Test import custom epw with wrong types."""
@@ -362,6 +506,30 @@ def test_write_converted_epw():
     os.remove(modified_path)
 
 
+def test_write_to_file_object():
+    """Test that writing the EPW to a file object does not mutate the EPW."""
+    relative_path = './tests/fixtures/epw/chicago.epw'
+    epw = EPW(relative_path)
+    with open(relative_path, 'r') as epwin:
+        orig_lines = epwin.readlines()
+    dbt_values = epw.dry_bulb_temperature.values
+    epw.convert_to_ip()
+    ip_values = epw.dry_bulb_temperature.values
+
+    file_object = io.StringIO() if sys.version_info >= (3, 0) else io.BytesIO()
+    epw.write_to_file_object(file_object, chunk_size=500)
+    new_lines = file_object.getvalue().splitlines(True)
+    assert len(new_lines) == len(orig_lines)
+    new_epw = EPW.from_file_string(file_object.getvalue())
+    assert new_epw.dry_bulb_temperature.header.unit == 'C'
+    for val, new_val in zip(dbt_values, new_epw.dry_bulb_temperature.values):
+        assert val == pytest.approx(new_val, abs=1e-6)
+    assert float(new_lines[-1].split(',')[6]) == \
+        pytest.approx(dbt_values[0], abs=1e-6)  # point-in-time values start at 1 AM
+    assert epw.dry_bulb_temperature.values == ip_values
+    assert epw.dry_bulb_temperature.header.unit == 'F'
+
+
 def test_to_ddy():
     """Test to_ddy."""
     path = './tests/fixtures/epw/chicago.epw'
@@ -380,6 +548,53 @@ def test_to_ddy():
     os.remove(ddy_path)
 
 
+def test_convert_to_compact():
+    """Test the compact storage of the data of an EPW."""
+    path = './tests/fixtures/epw/chicago.epw'
+    epw = EPW(path, lazy_load=True)
+    epw.convert_to_compact()
+    assert epw.dry_bulb_temperature.is_compact
+    assert epw.relative_humidity.is_compact
+    assert not epw.import_data_by_field(5).is_compact  # uncertainty flags are text
+    assert epw.to_file_string() == EPW(path).to_file_string()
+
+
+def test_approximate_design_day():
+    """Test that approximate_design_day matches the statistics of the dry bulb."""
+    path = './tests/fixtures/epw/chicago.epw'
+    epw = EPW(path, lazy_load=True)
+    db = epw.dry_bulb_temperature
+    for percentile in (0.4, 1, 2):
+        hr_count = int(87.6 * percentile * 2)
+        heating = epw.approximate_design_day('WinterDesignDay', percentile)
+        assert heating.dry_bulb_condition.dry_bulb_max == \
+            pytest.approx(db.percentile(percentile), abs=1e-6)
+        _, indices = db.lowest_values(hr_count)
+        wind_speed = sum(epw.wind_speed[i] for i in indices) / hr_count
+        assert heating.wind_condition.wind_speed == pytest.approx(wind_speed, abs=0.1)
+        assert heating.sky_condition.date.month == \
+            db.average_monthly().lowest_values(1)[1][0] + 1
+
+        cooling = epw.approximate_design_day('SummerDesignDay', percentile)
+        assert cooling.dry_bulb_condition.dry_bulb_max == \
+            pytest.approx(db.percentile(100 - percentile), abs=1e-6)
+        _, indices = db.highest_values(hr_count)
+        wind_speed = sum(epw.wind_speed[i] for i in indices) / hr_count
+        assert cooling.wind_condition.wind_speed == pytest.approx(wind_speed, abs=0.1)
+        assert cooling.sky_condition.date.month == \
+            db.average_monthly().highest_values(1)[1][0] + 1
+        assert cooling.dry_bulb_condition.dry_bulb_range > 0
+
+    # check that the statistics are re-computed when the dry bulb is edited
+    dbt = epw.dry_bulb_temperature
+    dbt[0] = 60
+    cooling = epw.approximate_design_day('SummerDesignDay', 0.4)
+    assert cooling.dry_bulb_condition.dry_bulb_max == \
+        pytest.approx(dbt.percentile(99.6), abs=1e-6)
+    with pytest.raises(AssertionError):
+        epw.approximate_design_day('SummerDesignDay', 0.001)
+
+
 def test_to_wea():
     """Test to_wea."""
     path = './tests/fixtures/epw/chicago.epw'
@@ -0,0 +1,86 @@
+# coding=utf-8
+from ladybug.epw import EPW
+from ladybug.epwcache import file_hash, cache_file_path, read_cache, evict_cache
+from ladybug.config import folders
+from ladybug.futil import nukedir
+
+import os
+import time
+import shutil
+
+
+def test_epw_use_cache():
+    """Test that an EPW loaded from a cache matches the one parsed from text."""
+    cache_folder = './tests/fixtures/epw_cache'
+    orig_folder = folders.epw_cache_folder
+    folders.epw_cache_folder = cache_folder
+    try:
+        relative_path = './tests/fixtures/epw/chicago.epw'
+        cache_file = cache_file_path(relative_path)
+        assert os.path.dirname(cache_file) == cache_folder
+        assert not os.path.isfile(cache_file)
+
+        epw = EPW(relative_path, use_cache=True)
+        assert epw.dry_bulb_temperature[0] == -6.1
+        assert os.path.isfile(cache_file)
+
+        cached_epw = EPW(relative_path, use_cache=True)
+        assert cached_epw._import_cache(cache_file, file_hash(relative_path))
+        assert cached_epw.to_dict() == EPW(relative_path).to_dict()
+        assert isinstance(cached_epw.relative_humidity[0], int)
+        assert isinstance(cached_epw.dry_bulb_temperature[0], float)
+        assert isinstance(cached_epw.import_data_by_field(5)[0], str)
+
+        # check that the cache is not used for a file with different contents
+        assert read_cache(cache_file, file_hash('./tests/fixtures/epw/tokyo.epw')) \
+            is None
+    finally:
+        folders.epw_cache_folder = orig_folder
+        nukedir(cache_folder, True)
+
+
+def test_epw_cache_modified_file():
+    """Test that the cache is not used after the EPW file has been edited."""
+    cache_folder = './tests/fixtures/epw_cache'
+    orig_folder = folders.epw_cache_folder
+    folders.epw_cache_folder = cache_folder
+    try:
+        epw_path = os.path.join(cache_folder, 'chicago.epw')
+        os.makedirs(cache_folder)
+        shutil.copyfile('./tests/fixtures/epw/chicago.epw', epw_path)
+        epw = EPW(epw_path, use_cache=True)
+        assert epw.dry_bulb_temperature[0] == -6.1
+
+        epw.dry_bulb_temperature[0] = 5
+        epw.write(epw_path)
+        os.utime(epw_path, (time.time() + 10, time.time() + 10))
+        new_epw = EPW(epw_path, use_cache=True)
+        assert new_epw.dry_bulb_temperature[0] == 5
+    finally:
+        folders.epw_cache_folder = orig_folder
+        nukedir(cache_folder, True)
+
+
+def test_evict_cache():
+    """Test the eviction of cache files by size and by age."""
+    cache_folder = './tests/fixtures/epw_cache'
+    orig_folder = folders.epw_cache_folder
+    folders.epw_cache_folder = cache_folder
+    try:
+        chicago = './tests/fixtures/epw/chicago.epw'
+        tokyo = './tests/fixtures/epw/tokyo.epw'
+        EPW(chicago, use_cache=True).location
+        EPW(chicago, use_cache=True).dry_bulb_temperature
+        EPW(tokyo, use_cache=True).dry_bulb_temperature
+        chicago_cache, tokyo_cache = cache_file_path(chicago), cache_file_path(tokyo)
+        old_time = time.time() - 3600
+        os.utime(chicago_cache, (old_time, old_time))
+
+        assert evict_cache(max_age=7200) == []
+        cache_size = os.path.getsize(tokyo_cache)
+        assert evict_cache(max_size=cache_size) == [chicago_cache]
+        assert os.path.isfile(tokyo_cache)
+        assert evict_cache(max_age=0) == [tokyo_cache]
+    finally:
+        folders.epw_cache_folder = orig_folder
+        nukedir(cache_folder, True)
@@ -0,0 +1,77 @@
+# coding=utf-8
+from ladybug.epwcatalog import EPWCatalog
+from ladybug.futil import nukedir
+
+import os
+import shutil
+import pytest
+
+
+def _catalog_folder():
+    """Get a folder with copies of the EPW files in the test fixtures."""
+    folder = './tests/fixtures/epw_catalog'
+    if os.path.isdir(folder):
+        nukedir(folder, True)
+    os.makedirs(os.path.join(folder, 'asia'))
+    shutil.copy('./tests/fixtures/epw/chicago.epw', folder)
+    shutil.copy('./tests/fixtures/epw/tokyo.epw', os.path.join(folder, 'asia'))
+    return folder
+
+
+def test_epw_catalog_refresh():
+    """Test the creation and incremental refresh of an EPW catalog."""
+    folder = _catalog_folder()
+    try:
+        catalog = EPWCatalog(folder)
+        assert len(catalog) == 0
+        updated, removed = catalog.refresh()
+        assert len(updated) == 2 and removed == []
+        assert os.path.isfile(catalog.catalog_file)
+        chicago = os.path.join(os.path.normpath(folder), 'chicago.epw')
+        tokyo = os.path.join(os.path.normpath(folder), 'asia', 'tokyo.epw')
+        assert catalog.file_paths == [tokyo, chicago]
+        assert chicago in catalog
+        assert catalog.location(chicago).city == 'Chicago Ohare Intl Ap'
+        assert catalog.climate_zone(tokyo) == '3A'
+        assert not catalog.is_leap_year(tokyo)
+
+        # check that the catalog is loaded from the file and only changes are read
+        catalog = EPWCatalog(folder)
+        assert len(catalog) == 2
+        assert catalog.refresh() == ([], [])
+        os.utime(tokyo, (1000000000, 1000000000))
+        assert catalog.refresh() == ([tokyo], [])
+        os.remove(chicago)
+        assert catalog.refresh() == ([], [chicago])
+        assert catalog.file_paths == [tokyo]
+        with pytest.raises(ValueError):
+            catalog.location(chicago)
+    finally:
+        nukedir(folder, True)
+
+
+def test_epw_catalog_nearest():
+    """Test the nearest station search and filters of an EPW catalog."""
+    folder = _catalog_folder()
+    try:
+        catalog = EPWCatalog(folder)
+        catalog.refresh()
+        chicago = os.path.join(os.path.normpath(folder), 'chicago.epw')
+        tokyo = os.path.join(os.path.normpath(folder), 'asia', 'tokyo.epw')
+
+        nearest = catalog.nearest(41.88, -87.63)  # downtown chicago
+        assert nearest[0][0] == chicago
+        assert nearest[0][1] == pytest.approx(26.4, abs=0.5)
+        nearest = catalog.nearest(34.69, 135.5, count=5)  # osaka
+        assert [n[0] for n in nearest] == [tokyo, chicago]
+        assert nearest[0][1] == pytest.approx(400, abs=10)
+
+        assert catalog.nearest(41.88, -87.63, climate_zone='3')[0][0] == tokyo
+        assert catalog.nearest(41.88, -87.63, climate_zone=['5A', '6A'])[0][0] == \
+            chicago
+        assert catalog.nearest(41.88, -87.63, climate_zone='1') == []
+        assert catalog.filter(min_elevation=100) == [chicago]
+        assert catalog.filter(max_elevation=100) == [tokyo]
+        assert catalog.filter(climate_zone='5', max_elevation=100) == []
+    finally:
+        nukedir(folder, True)
@@ -0,0 +1,87 @@
+# coding=utf-8
+from ladybug.epw import EPW
+from ladybug.epwexport import export_csv, export_columnar, read_columnar, \
+    STATION_COLUMNS, TIME_COLUMNS
+
+import os
+import csv
+import pytest
+
+
+def test_export_csv():
+    """Test the export of several EPW files to a single CSV."""
+    paths = ['./tests/fixtures/epw/chicago.epw', './tests/fixtures/epw/tokyo.epw']
+    csv_path = './tests/fixtures/epw/export.csv'
+    try:
+        export_csv(paths, csv_path, [6, 'relative_humidity'], chunk_size=1000)
+        with open(csv_path) as inf:
+            lines = inf.readlines()
+        assert len(lines) == 8760 * 2 + 1
+        header = lines[0].strip().split(',')
+        assert header == list(STATION_COLUMNS) + list(TIME_COLUMNS) + \
+            ['Dry Bulb Temperature (C)', 'Relative Humidity (%)']
+        first_row = lines[1].strip().split(',')
+        assert first_row[0] == 'Chicago Ohare Intl Ap'
+        assert first_row[9:12] == ['1', '1', '0']
+        assert float(first_row[12]) == EPW(paths[0]).dry_bulb_temperature[0]
+        last_row = lines[-1].strip().split(',')
+        assert last_row[0] == 'Tokyo'
+        assert last_row[9:12] == ['12', '31', '23']
+        assert int(last_row[13]) == EPW(paths[1]).relative_humidity[-1]
+    finally:
+        if os.path.isfile(csv_path):
+            os.remove(csv_path)
+
+
+def test_export_columnar():
+    """Test the export of several EPW files to a binary columnar file."""
+    paths = ['./tests/fixtures/epw/chicago.epw', './tests/fixtures/epw/tokyo.epw']
+    col_path = './tests/fixtures/epw/export.lbcol'
+    try:
+        export_columnar(paths, col_path, [5, 6, 'relative_humidity'])
+        groups = list(read_columnar(col_path))
+        assert len(groups) == 2
+        for (station, data), path in zip(groups, paths):
+            epw = EPW(path)
+            assert station['city'] == epw.location.city
+            assert station['latitude'] == epw.location.latitude
+            assert not station['is_leap_year']
+            assert list(data.keys()) == ['Uncertainty Flags (flag)',
+                                         'Dry Bulb Temperature (C)',
+                                         'Relative Humidity (%)']
+            assert data['Uncertainty Flags (flag)'] == \
+                list(epw.import_data_by_field(5).values)
+            assert data['Dry Bulb Temperature (C)'] == \
+                list(epw.dry_bulb_temperature.values)
+            assert data['Relative Humidity (%)'] == list(epw.relative_humidity.values)
+    finally:
+        if os.path.isfile(col_path):
+            os.remove(col_path)
+
+    with pytest.raises(AssertionError):
+        export_columnar(paths, col_path, ['not_a_field'])
+
+
+def test_export_csv_quoted_text(monkeypatch):
+    """Test that station text with commas is quoted in the exported CSV."""
+    from ladybug.location import Location
+    to_dict = Location.to_dict
+
+    def to_dict_with_state(location):
+        loc_dict = to_dict(location)
+        loc_dict['city'] = 'Chicago, IL'
+        return loc_dict
+    monkeypatch.setattr(Location, 'to_dict', to_dict_with_state)
+
+    csv_path = './tests/fixtures/epw/export_comma.csv'
+    try:
+        export_csv(['./tests/fixtures/epw/chicago.epw'], csv_path, [6])
+        with open(csv_path) as inf:
+            rows = list(csv.reader(inf))
+        assert len(rows) == 8761
+        assert all(len(row) == len(rows[0]) for row in rows)
+        assert rows[1][0] == 'Chicago, IL'
+        assert rows[1][9:12] == ['1', '1', '0']
+    finally:
+        if os.path.isfile(csv_path):
+            os.remove(csv_path)
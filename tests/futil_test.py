@@ -3,6 +3,8 @@ import ladybug.futil as futil
 
 import pytest
 import os
+import gzip
+import io
 
 
 def test_unzip_file():
@@ -35,3 +37,43 @@ def test_csv_to_matrix():
 
     with pytest.raises(Exception):
         epw_mtx = futil.csv_to_num_matrix(path)
+
+
+def test_open_file_compressed():
+    """Test the reading of text from gzip files and from members of zip archives."""
+    path = './tests/fixtures/epw/tokyo.epw'
+    gz_path = './tests/fixtures/zip/tokyo.epw.gz'
+    with open(path, 'rb') as inf:
+        contents = inf.read()
+    with gzip.open(gz_path, 'wb') as outf:
+        outf.write(contents)
+    try:
+        assert futil.file_exists(gz_path)
+        assert futil.archive_member(gz_path) is None
+        with futil.open_file(gz_path) as inf:
+            gz_lines = inf.readlines()
+        with futil.open_file(path) as inf:
+            assert gz_lines == inf.readlines()
+    finally:
+        os.remove(gz_path)
+
+    zip_path = './tests/fixtures/zip/test.zip'
+    member_path = os.path.join(zip_path, 'AUS_NSW.Sydney.947670_IWEC.epw')
+    assert futil.archive_member(member_path) == \
+        (zip_path, 'AUS_NSW.Sydney.947670_IWEC.epw')
+    assert futil.file_exists(member_path)
+    assert not futil.file_exists(os.path.join(zip_path, 'missing.epw'))
+    assert not futil.file_exists('./tests/fixtures/zip/missing.zip/missing.epw')
+    with futil.open_file(member_path) as inf:
+        assert inf.readline().startswith('LOCATION,SYDNEY')
+        assert len(inf.readlines()) == 8767
+
+
+def test_text_mode_reader():
+    """Test the reader that translates line endings of compressed files in Python 2."""
+    reader = futil._TextModeReader(io.StringIO(u'a,1\r\nb,2\r\nc,3\n'))
+    with reader as inf:
+        assert inf.readline() == u'a,1\n'
+        assert inf.read(4) == u'b,2\n'  # the split line ending is kept together
+        assert inf.readlines() == [u'c,3\n']
+    assert list(futil._TextModeReader(io.StringIO(u'a\r\nb'))) == [u'a\n', u'b']
@@ -21,6 +21,15 @@ def test_import_stat():
     assert isinstance(stat, STAT)
 
 
+def test_import_stat_from_zip():
+    """Test import of a stat file that is inside a zip archive."""
+    zip_path = './tests/fixtures/zip/test.zip'
+    stat = STAT(os.path.join(zip_path, 'AUS_NSW.Sydney.947670_IWEC.stat'))
+    assert stat.location.city == 'SYDNEY'
+    assert stat.location.latitude == approx(-33.95, rel=1e-3)
+    assert len(stat.monthly_wind_conditions) == 12
+
+
 def test_stat_location():
     """Test the location within the stat object."""
     relative_path = './tests/fixtures/stat/tokyo.stat'